@@ -89,6 +89,11 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_collection_format",
+                             "markets_recorder",
+                             "write_behind_enabled",
+                             "write_behind_queue_size",
+                             "market_states_checkpoint_interval",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
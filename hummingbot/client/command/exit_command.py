@@ -28,6 +28,11 @@ class ExitCommand:
             # Freeze screen 1 second for better UI
             await asyncio.sleep(1)
 
+        if self.markets_recorder is not None:
+            # Writes the events still queued and the pending market states checkpoint before the process ends
+            self.markets_recorder.stop()
+            self.markets_recorder = None
+
         if self._gateway_monitor is not None:
             self._gateway_monitor.stop()
 
@@ -77,6 +77,8 @@ class StatusCommand:
         else:
             st_status = self.strategy.format_status()
         status = paper_trade + "\n" + st_status
+        if self.markets_recorder is not None and self.markets_recorder.write_behind_enabled:
+            status += f"\n\n  Trades database write behind lag: {self.markets_recorder.write_behind_lag:.2f} s"
         if self._pmm_script_iterator is not None and live is False:
             self._pmm_script_iterator.request_status()
         return status
@@ -179,10 +179,69 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_format: str = Field(
+        default="sql",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the market data collection storage (sql/parquet). Parquet files are written in "
+                "data/market_data and require pyarrow (Default=sql)"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
+    @validator("market_data_collection_format")
+    def validate_market_data_collection_format(cls, v: str):
+        if v not in ("sql", "parquet"):
+            raise ValueError("The market data collection format must be sql or parquet.")
+        return v
+
+
+class MarketsRecorderConfigMap(BaseClientModel):
+    write_behind_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Write the order and trade events to the database in batches from a writer thread? Events not"
+                " written yet are lost if the client crashes (Default=False)"
+            ),
+        ),
+    )
+    write_behind_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of events waiting to be written in write behind mode (Default=10000)"
+            ),
+        ),
+    )
+    market_states_checkpoint_interval: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum time in seconds the saved orders tracking states can lag behind the orders."
+                " Orders created in that time can't be restored after a crash (0 to save the states with every"
+                " order event) (Default=0)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "markets_recorder"
+
+    @validator("write_behind_enabled", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
@@ -1119,6 +1178,7 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    markets_recorder: MarketsRecorderConfigMap = Field(default=MarketsRecorderConfigMap())
 
     class Config:
         title = "client_config_map"
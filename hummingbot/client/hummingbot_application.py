@@ -320,12 +320,16 @@ class HummingbotApplication(*commands):
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
 
+        recorder_config = self.client_config_map.markets_recorder
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            write_behind=recorder_config.write_behind_enabled,
+            write_behind_queue_size=recorder_config.write_behind_queue_size,
+            market_states_checkpoint_interval=recorder_config.market_states_checkpoint_interval,
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
@@ -194,6 +194,13 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Indicates whether the connector is ready to operate on the specified trading pair. Connectors that track
+        readiness per trading pair override this, by default it is the same as the connector being ready.
+        """
+        return self.ready
+
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrderBase]:
         raise NotImplementedError
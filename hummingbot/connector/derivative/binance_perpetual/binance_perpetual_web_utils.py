@@ -6,7 +6,9 @@ from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitUsageRESTPostProcessor
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
@@ -41,7 +43,8 @@ def build_api_factory(
         time_synchronizer: Optional[TimeSynchronizer] = None,
         domain: str = CONSTANTS.DOMAIN,
         time_provider: Optional[Callable] = None,
-        auth: Optional[AuthBase] = None) -> WebAssistantsFactory:
+        auth: Optional[AuthBase] = None,
+        request_coalescer: Optional[RESTRequestCoalescer] = None) -> WebAssistantsFactory:
     throttler = throttler or create_throttler()
     time_synchronizer = time_synchronizer or TimeSynchronizer()
     time_provider = time_provider or (lambda: get_current_server_time(
@@ -54,7 +57,11 @@ def build_api_factory(
         rest_pre_processors=[
             TimeSynchronizerRESTPreProcessor(synchronizer=time_synchronizer, time_provider=time_provider),
             BinancePerpetualRESTPreProcessor(),
-        ])
+        ],
+        rest_post_processors=[
+            RateLimitUsageRESTPostProcessor(throttler=throttler, limit_ids_by_header=CONSTANTS.RATE_LIMIT_USAGE_HEADERS),
+        ],
+        request_coalescer=request_coalescer)
     return api_factory
 
 
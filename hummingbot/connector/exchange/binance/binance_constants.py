@@ -44,6 +44,14 @@ ORDERS = "ORDERS"
 ORDERS_24HR = "ORDERS_24HR"
 RAW_REQUESTS = "RAW_REQUESTS"
 
+# Usage of the limits reported by the server in the response headers.
+# X-MBX-ORDER-COUNT-1D is not used: the server resets that count at a fixed time of the day, while the usage reported
+# to the throttler is only released after a full sliding window.
+RATE_LIMIT_USAGE_HEADERS = {
+    "X-MBX-USED-WEIGHT-1M": REQUEST_WEIGHT,
+    "X-MBX-ORDER-COUNT-10S": ORDERS,
+}
+
 # Rate Limit time intervals
 ONE_MINUTE = 60
 ONE_SECOND = 1
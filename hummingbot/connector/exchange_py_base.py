@@ -15,7 +15,9 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -45,6 +47,14 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Below the keep alive timeout of the pool of connections used for orders
+    CONNECTIONS_WARM_UP_INTERVAL = 10.0
+    # Connectors can opt in to deliver the order book diffs straight to the queue of each order book. The errors raised
+    # while dispatching a diff then reach the data source listener instead of the order book tracker router
+    DIRECT_DIFF_DISPATCH = False
+    # Connectors can opt in to the sliding window throttler, which serves the waiting tasks by priority. Unlike
+    # AsyncThrottler, it runs a task heavier than its whole (share scaled) limit once the window is empty
+    SLIDING_WINDOW_THROTTLER = False
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,9 +70,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._connections_warm_up_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        throttler_class = SlidingWindowThrottler if self.SLIDING_WINDOW_THROTTLER else AsyncThrottler
+        self._throttler = throttler_class(
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
@@ -73,10 +85,12 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
+        self._orderbook_ds.order_book_create_function = self._create_order_book
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            direct_diff_dispatch=self.DIRECT_DIFF_DISPATCH))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -149,6 +163,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_trading_required(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def keep_connections_warm(self) -> bool:
+        """
+        If True the connections used to place and cancel orders are opened when the network is started, and kept open
+        while it runs. Connectors sending their orders through the REST connections pool can opt in, at the cost of
+        one high priority network check request every `CONNECTIONS_WARM_UP_INTERVAL` seconds
+        """
+        return False
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
@@ -183,6 +206,26 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return all(self.status_dict.values())
 
+    @property
+    def ready_pairs(self) -> List[str]:
+        """
+        Returns the trading pairs the connector is ready to operate on. A trading pair is ready as soon as its own order
+        book is initialized, even if the order books of other trading pairs are still being loaded.
+        """
+        if not self._is_ready_except_order_books():
+            return []
+        return self.order_book_tracker.ready_pairs
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return self._is_ready_except_order_books() and self.order_book_tracker.is_trading_pair_ready(trading_pair)
+
+    @property
+    def throttler_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the rate limits usage metrics of the connector, by limit_id (see AsyncThrottlerBase.metrics)
+        """
+        return self._throttler.metrics()
+
     @property
     def name_cap(self) -> str:
         return self.name.capitalize()
@@ -466,15 +509,17 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        # Order actions go ahead of the polling requests when the rate limits are exhausted
+        with request_priority(RequestPriority.HIGH):
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -537,7 +582,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        with request_priority(RequestPriority.HIGH):
+            cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -664,10 +710,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The polling loops to update the trading rules and trading fees
         - The polling loop to update order status and balance status using REST API (backup for main update process)
         - The background task to process the events received through the user stream tracker (websocket connection)
+        - The loop keeping warm the connections used to place and cancel orders
         """
         self._stop_network()
         self.order_book_tracker.start()
         if self.is_trading_required:
+            if self.keep_connections_warm:
+                self._connections_warm_up_task = safe_ensure_future(self._connections_warm_up_loop())
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
             self._trading_fees_polling_task = safe_ensure_future(self._trading_fees_polling_loop())
             self._status_polling_task = safe_ensure_future(self._status_polling_loop())
@@ -719,6 +768,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._connections_warm_up_task is not None:
+            self._connections_warm_up_task.cancel()
+            self._connections_warm_up_task = None
 
     # === loops and sync related methods ===
     #
@@ -729,7 +781,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.LOW):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -749,7 +802,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.LOW):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -774,10 +828,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                with request_priority(RequestPriority.LOW):
+                    await self._update_time_synchronizer()
 
-                # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                    # the following method is implementation-specific
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -816,7 +871,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.LOW):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -839,6 +895,9 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().exception("Error while reading user events queue. Retrying in 1s.")
                 await self._sleep(1.0)
 
+    def _is_ready_except_order_books(self) -> bool:
+        return all(status for key, status in self.status_dict.items() if key != "order_books_initialized")
+
     def _is_user_stream_initialized(self):
         return self._user_stream_tracker.data_source.last_recv_time > 0 or not self.is_trading_required
 
@@ -1069,6 +1128,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def _create_order_book(self) -> OrderBook:
+        """
+        Creates the order book used for each trading pair. Connectors for markets with dense price grids can return a
+        `FlatOrderBook` instead.
+        """
+        return OrderBook()
+
     async def _initialize_trading_pair_symbol_map(self):
         try:
             exchange_info = await self._make_trading_pairs_request()
@@ -1079,6 +1145,28 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _make_network_check_request(self):
         await self._api_get(path_url=self.check_network_request_path)
 
+    async def _connections_warm_up_loop(self):
+        """
+        Warms up the connections used to place and cancel orders every `CONNECTIONS_WARM_UP_INTERVAL` seconds, so they
+        are not closed for being idle between orders
+        """
+        while True:
+            await self._warm_up_connections()
+            await self._sleep(self.CONNECTIONS_WARM_UP_INTERVAL)
+
+    async def _warm_up_connections(self):
+        """
+        Sends the network check request with high priority to open a connection in the pool used to place and cancel
+        orders, so the first order does not have to wait for the TCP and TLS handshakes
+        """
+        try:
+            with request_priority(RequestPriority.HIGH):
+                await self._make_network_check_request()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().debug("Error warming up the connections to the exchange.", exc_info=True)
+
     async def _make_trading_rules_request(self) -> Any:
         exchange_info = await self._api_get(path_url=self.trading_rules_request_path)
         return exchange_info
@@ -0,0 +1,192 @@
+import glob
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+def _dataset_schemas() -> Dict[str, "pa.Schema"]:
+    price_levels = pa.list_(pa.float64())
+    return {
+        MarketDataParquetWriter.ORDER_BOOK_SNAPSHOTS: pa.schema([
+            ("timestamp", pa.float64()),
+            ("exchange", pa.string()),
+            ("trading_pair", pa.string()),
+            ("mid_price", pa.float64()),
+            ("best_bid", pa.float64()),
+            ("best_ask", pa.float64()),
+            ("bid_prices", price_levels),
+            ("bid_amounts", price_levels),
+            ("ask_prices", price_levels),
+            ("ask_amounts", price_levels),
+        ]),
+        MarketDataParquetWriter.TRADES: pa.schema([
+            ("timestamp", pa.float64()),
+            ("exchange", pa.string()),
+            ("trading_pair", pa.string()),
+            ("price", pa.float64()),
+            ("amount", pa.float64()),
+            ("side", pa.string()),
+        ]),
+    }
+
+
+class MarketDataParquetWriter:
+    """
+    Records order book snapshots (top levels, mid price, best bid and best ask) and public trades in compressed
+    Parquet files, one directory per dataset under `base_path`.
+
+    The records are buffered in columns and written as a row group when `flush` is called. A new file is started every
+    `rotation_interval` seconds, named after the UTC time it was opened. A file can only be read once it is closed
+    (rotated, or by `close`). Requires `pyarrow`.
+    """
+    ORDER_BOOK_SNAPSHOTS = "order_book_snapshots"
+    TRADES = "trades"
+
+    def __init__(self,
+                 base_path: str,
+                 rotation_interval: float = 3600,
+                 flush_interval: float = 60,
+                 compression: str = "zstd"):
+        if pa is None:
+            raise ImportError("Recording market data in Parquet files requires pyarrow (pip install pyarrow).")
+        self._base_path = base_path
+        self._rotation_interval = rotation_interval
+        self._flush_interval = flush_interval
+        self._compression = compression
+        self._schemas = _dataset_schemas()
+        self._buffers: Dict[str, Dict[str, List]] = {dataset: defaultdict(list) for dataset in self._schemas}
+        self._writers: Dict[str, "pq.ParquetWriter"] = {}
+        self._files_opening_times: Dict[str, float] = {}
+        self._last_flush_time = self._time()
+
+    @property
+    def base_path(self) -> str:
+        return self._base_path
+
+    def add_order_book_snapshot(self,
+                                timestamp: float,
+                                exchange: str,
+                                trading_pair: str,
+                                mid_price: float,
+                                best_bid: float,
+                                best_ask: float,
+                                bids: np.ndarray,
+                                asks: np.ndarray):
+        """
+        Buffers an order book snapshot
+        :param bids: the top bid levels, with the price and amount in the first two columns (see
+        `OrderBook.get_depth_arrays`)
+        :param asks: the top ask levels, with the price and amount in the first two columns
+        """
+        buffer = self._buffers[self.ORDER_BOOK_SNAPSHOTS]
+        buffer["timestamp"].append(timestamp)
+        buffer["exchange"].append(exchange)
+        buffer["trading_pair"].append(trading_pair)
+        buffer["mid_price"].append(float(mid_price))
+        buffer["best_bid"].append(float(best_bid))
+        buffer["best_ask"].append(float(best_ask))
+        buffer["bid_prices"].append(bids[:, 0].tolist())
+        buffer["bid_amounts"].append(bids[:, 1].tolist())
+        buffer["ask_prices"].append(asks[:, 0].tolist())
+        buffer["ask_amounts"].append(asks[:, 1].tolist())
+
+    def add_trade(self, timestamp: float, exchange: str, trading_pair: str, price: float, amount: float, side: str):
+        buffer = self._buffers[self.TRADES]
+        buffer["timestamp"].append(timestamp)
+        buffer["exchange"].append(exchange)
+        buffer["trading_pair"].append(trading_pair)
+        buffer["price"].append(float(price))
+        buffer["amount"].append(float(amount))
+        buffer["side"].append(side)
+
+    def flush_if_due(self):
+        """
+        Flushes the buffered records if `flush_interval` seconds passed since the last flush
+        """
+        if self._time() - self._last_flush_time >= self._flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered records of each dataset as a row group of its current file
+        """
+        now = self._time()
+        for dataset, buffer in self._buffers.items():
+            if len(buffer["timestamp"]) == 0:
+                continue
+            table = pa.Table.from_pydict(buffer, schema=self._schemas[dataset])
+            self._writer(dataset, now).write_table(table)
+            buffer.clear()
+        self._last_flush_time = now
+
+    def close(self):
+        """
+        Writes the buffered records and closes the files
+        """
+        self.flush()
+        for dataset in list(self._writers):
+            self._close_file(dataset)
+
+    def _writer(self, dataset: str, now: float) -> "pq.ParquetWriter":
+        if dataset in self._writers and now - self._files_opening_times[dataset] >= self._rotation_interval:
+            self._close_file(dataset)
+        if dataset not in self._writers:
+            dataset_path = os.path.join(self._base_path, dataset)
+            os.makedirs(dataset_path, exist_ok=True)
+            file_name = f"{dataset}_{datetime.fromtimestamp(now, tz=timezone.utc).strftime('%Y%m%d_%H%M%S')}.parquet"
+            self._writers[dataset] = pq.ParquetWriter(
+                os.path.join(dataset_path, file_name), self._schemas[dataset], compression=self._compression)
+            self._files_opening_times[dataset] = now
+        return self._writers[dataset]
+
+    def _close_file(self, dataset: str):
+        self._writers.pop(dataset).close()
+        del self._files_opening_times[dataset]
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+def read_market_data(base_path: str,
+                     dataset: str,
+                     start_timestamp: Optional[float] = None,
+                     end_timestamp: Optional[float] = None) -> pd.DataFrame:
+    """
+    Reads the records of a dataset written by `MarketDataParquetWriter` into a DataFrame sorted by timestamp. The
+    level columns of the order book snapshots contain one array per snapshot.
+    :param base_path: the `base_path` of the writer
+    :param dataset: `MarketDataParquetWriter.ORDER_BOOK_SNAPSHOTS` or `MarketDataParquetWriter.TRADES`
+    :param start_timestamp: if provided, only the records with a timestamp greater or equal are returned
+    :param end_timestamp: if provided, only the records with a timestamp lower are returned
+    """
+    if pa is None:
+        raise ImportError("Reading market data Parquet files requires pyarrow (pip install pyarrow).")
+    filters = []
+    if start_timestamp is not None:
+        filters.append(("timestamp", ">=", start_timestamp))
+    if end_timestamp is not None:
+        filters.append(("timestamp", "<", end_timestamp))
+
+    tables = []
+    for file_path in sorted(glob.glob(os.path.join(base_path, dataset, "*.parquet"))):
+        try:
+            tables.append(pq.read_table(file_path, filters=filters or None))
+        except pa.ArrowInvalid:
+            # The file still being written by a running writer has no footer yet
+            continue
+    schema = _dataset_schemas()[dataset]
+    table = pa.concat_tables(tables) if len(tables) > 0 else schema.empty_table()
+    return table.to_pandas().sort_values("timestamp", kind="stable").reset_index(drop=True)
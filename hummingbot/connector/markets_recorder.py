@@ -1,12 +1,12 @@
 import asyncio
+import functools
 import json
 import logging
 import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -14,8 +14,11 @@ from sqlalchemy.orm import Query, Session
 from hummingbot import data_path
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.market_data_parquet_writer import MarketDataParquetWriter
+from hummingbot.connector.trades_csv_writer import TradesCSVWriter
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -23,6 +26,8 @@ from hummingbot.core.event.events import (
     FundingPaymentCompletedEvent,
     MarketEvent,
     MarketOrderFailureEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
     OrderCancelledEvent,
     OrderExpiredEvent,
     OrderFilledEvent,
@@ -44,6 +49,7 @@ from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import AfterCommitCallback, SQLWriteBehindQueue, WriteOperation
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.smart_components.models.executors_info import ExecutorInfo
 
@@ -73,7 +79,17 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_behind: bool = False,
+                 write_behind_queue_size: int = SQLWriteBehindQueue.DEFAULT_MAX_SIZE,
+                 market_states_checkpoint_interval: float = 0):
+        """
+        :param write_behind: if True the order and trade events are written to the database in batches by a writer
+        thread, instead of being written synchronously in the event loop
+        :param write_behind_queue_size: the maximum number of events waiting to be written in write behind mode
+        :param market_states_checkpoint_interval: if greater than zero, the markets tracking states are saved at most
+        once every interval (in seconds) after they change, instead of being saved with each order event
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -84,6 +100,16 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_writer: Optional[MarketDataParquetWriter] = None
+        self._public_trade_forwarders: Dict[str, SourceInfoEventForwarder] = {}
+        self._write_behind_queue: Optional[SQLWriteBehindQueue] = (
+            SQLWriteBehindQueue(
+                sql_manager=sql, max_size=write_behind_queue_size, on_batch_written=self._flush_csv_writers)
+            if write_behind else None)
+        self._csv_writers: Dict[str, TradesCSVWriter] = {}
+        self._market_states_checkpoint_interval: float = market_states_checkpoint_interval
+        self._market_states_checkpoint_handle: Optional[asyncio.TimerHandle] = None
+        self._dirty_markets: Dict[str, ConnectorBase] = {}
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -125,34 +151,18 @@ class MarketsRecorder:
         MarketsRecorder._shared_instance = self
 
     def _start_market_data_recording(self):
+        if self._market_data_collection_config.market_data_collection_format == "parquet":
+            self._market_data_writer = MarketDataParquetWriter(base_path=os.path.join(data_path(), "market_data"))
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
     async def _record_market_data(self):
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_writer is not None:
+                        self._record_market_data_in_parquet_files()
+                    else:
+                        self._record_market_data_in_db()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -160,6 +170,76 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _record_market_data_in_db(self):
+        depth = self._market_data_collection_config.market_data_collection_depth + 1
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for market in self._markets:
+                    exchange = market.display_name
+                    for trading_pair in market.trading_pairs:
+                        mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                        best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                        best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                        bids, asks = market.get_order_book(trading_pair).get_depth_arrays(depth)
+                        market_data = MarketData(
+                            timestamp=self.db_timestamp,
+                            exchange=exchange,
+                            trading_pair=trading_pair,
+                            mid_price=mid_price,
+                            best_bid=best_bid,
+                            best_ask=best_ask,
+                            order_book={
+                                "bid": [[price, amount, int(update_id)] for price, amount, update_id in bids.tolist()],
+                                "ask": [[price, amount, int(update_id)] for price, amount, update_id in asks.tolist()]}
+                        )
+                        session.add(market_data)
+
+    def _record_market_data_in_parquet_files(self):
+        if len(self._public_trade_forwarders) == 0:
+            self._subscribe_to_public_trades()
+        depth = self._market_data_collection_config.market_data_collection_depth
+        timestamp = self.db_timestamp * 1e-3
+        for market in self._markets:
+            for trading_pair in market.trading_pairs:
+                bids, asks = market.get_order_book(trading_pair).get_depth_arrays(depth)
+                self._market_data_writer.add_order_book_snapshot(
+                    timestamp=timestamp,
+                    exchange=market.display_name,
+                    trading_pair=trading_pair,
+                    mid_price=market.get_price_by_type(trading_pair, PriceType.MidPrice),
+                    best_bid=market.get_price_by_type(trading_pair, PriceType.BestBid),
+                    best_ask=market.get_price_by_type(trading_pair, PriceType.BestAsk),
+                    bids=bids,
+                    asks=asks,
+                )
+        self._market_data_writer.flush_if_due()
+
+    def _subscribe_to_public_trades(self):
+        for market in self._markets:
+            forwarder = SourceInfoEventForwarder(functools.partial(self._did_public_trade, market.display_name))
+            self._public_trade_forwarders[market.display_name] = forwarder
+            for order_book in market.order_books.values():
+                order_book.add_listener(OrderBookEvent.TradeEvent, forwarder)
+
+    def _unsubscribe_from_public_trades(self):
+        for market in self._markets:
+            forwarder = self._public_trade_forwarders.get(market.display_name)
+            if forwarder is not None:
+                for order_book in market.order_books.values():
+                    order_book.remove_listener(OrderBookEvent.TradeEvent, forwarder)
+        self._public_trade_forwarders.clear()
+
+    def _did_public_trade(self, exchange: str, event_tag: int, order_book: OrderBook, evt: OrderBookTradeEvent):
+        if self._market_data_writer is not None:
+            self._market_data_writer.add_trade(
+                timestamp=evt.timestamp,
+                exchange=exchange,
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                amount=evt.amount,
+                side=evt.type.name.lower(),
+            )
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -176,7 +256,21 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind_enabled(self) -> bool:
+        return self._write_behind_queue is not None
+
+    @property
+    def write_behind_lag(self) -> float:
+        """
+        The time in seconds the oldest event not written to the database yet has been waiting (always 0 when the write
+        behind mode is disabled)
+        """
+        return self._write_behind_queue.lag if self._write_behind_queue is not None else 0
+
     def start(self):
+        if self._write_behind_queue is not None:
+            self._write_behind_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -189,6 +283,39 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._market_data_writer is not None:
+            self._unsubscribe_from_public_trades()
+            self._market_data_writer.close()
+            self._market_data_writer = None
+        self._checkpoint_market_states()
+        if self._write_behind_queue is not None:
+            self._write_behind_queue.stop()
+        for csv_writer in self._csv_writers.values():
+            csv_writer.close()
+        self._csv_writers.clear()
+
+    def flush(self):
+        """
+        Blocks until all the events received are written to the database
+        """
+        if self._write_behind_queue is not None and self._write_behind_queue.is_running:
+            self._write_behind_queue.flush()
+
+    def _write(self, operation: WriteOperation):
+        """
+        Executes a database write operation, in the writer thread when the write behind mode is enabled, or
+        synchronously in its own transaction otherwise
+        :param operation: function receiving the session and optionally returning an after commit callback
+        """
+        if self._write_behind_queue is not None and self._write_behind_queue.is_running:
+            self._write_behind_queue.put(operation)
+        else:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    after_commit_callback = operation(session)
+            if after_commit_callback is not None:
+                after_commit_callback()
+                self._flush_csv_writers()
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -244,19 +371,81 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states_snapshot(
+            config_file_path, market.display_name, market.tracking_states, self.db_timestamp, session=session)
 
+    @staticmethod
+    def _save_market_states_snapshot(config_file_path: str,
+                                     market_name: str,
+                                     tracking_states: Dict[str, Any],
+                                     timestamp: int,
+                                     session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
+    def _market_states_writer(self, market: ConnectorBase) -> Callable[[Session], None]:
+        """
+        Returns a function saving the current tracking states of the market in the session it receives. The states are
+        copied now, in the event loop, so the function can be executed later from the writer thread.
+        """
+        config_file_path = self._config_file_path
+        market_name = market.display_name
+        tracking_states = market.tracking_states
+        timestamp = self.db_timestamp
+
+        def write_market_states(session: Session):
+            self._save_market_states_snapshot(config_file_path, market_name, tracking_states, timestamp, session)
+
+        return write_market_states
+
+    def _market_states_checkpoint(self, market: ConnectorBase) -> Callable[[Session], None]:
+        """
+        Returns the function to execute in the transaction of an order event to save the market states.
+
+        When the checkpoints are debounced the market is only flagged as changed, and the states are saved by the next
+        scheduled checkpoint, in their own transaction. Each checkpoint saves a complete snapshot, so the restored states
+        are always consistent, at most `market_states_checkpoint_interval` seconds older than the order records.
+        """
+        if self._market_states_checkpoint_interval <= 0:
+            return self._market_states_writer(market)
+
+        self._dirty_markets[market.display_name] = market
+        if self._market_states_checkpoint_handle is None:
+            self._market_states_checkpoint_handle = self._ev_loop.call_later(
+                self._market_states_checkpoint_interval, self._checkpoint_market_states)
+        return lambda session: None
+
+    def _checkpoint_market_states(self):
+        """
+        Saves the tracking states of the markets changed since the last checkpoint
+        """
+        if self._market_states_checkpoint_handle is not None:
+            self._market_states_checkpoint_handle.cancel()
+            self._market_states_checkpoint_handle = None
+        if len(self._dirty_markets) == 0:
+            return
+
+        writers = [self._market_states_writer(market) for market in self._dirty_markets.values()]
+        self._dirty_markets.clear()
+
+        def write_checkpoint(session: Session):
+            for write_market_states in writers:
+                write_market_states(session)
+
+        self._write(write_checkpoint)
+
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
@@ -287,31 +476,34 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        write_market_states = self._market_states_checkpoint(market)
+
+        def write_order(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+            write_market_states(session)
+
+        self._write(write_order)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -326,57 +518,60 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+        write_market_states = self._market_states_checkpoint(market)
+
+        def write_fill(session: Session) -> AfterCommitCallback:
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            write_market_states(session)
+            # The CSV row is built while the order record can still be loaded, but only written once committed
+            csv_path, field_names, field_data = self._trade_fill_csv_row(trade_fill_record)
+            return lambda: self._append_row_to_csv(csv_path, field_names, field_data)
+
+        self._write(write_fill)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -388,26 +583,28 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
 
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        def write_funding_payment(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._write(write_funding_payment)
 
     def append_to_csv(self, trade: TradeFill):
+        self._append_row_to_csv(*self._trade_fill_csv_row(trade))
+        self._flush_csv_writers()
+
+    @staticmethod
+    def _trade_fill_csv_row(trade: TradeFill) -> Tuple[str, tuple, tuple]:
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -420,15 +617,24 @@ class MarketsRecorder:
             '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
+        return csv_path, field_names, field_data
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    def _append_row_to_csv(self, csv_path: str, field_names: tuple, field_data: tuple):
+        """
+        Writes the row with the open writer of the CSV file. The rows are only flushed to the file by
+        `_flush_csv_writers`, after each written batch of events.
+        """
+        csv_writer: Optional[TradesCSVWriter] = self._csv_writers.get(csv_path)
+        if csv_writer is None or csv_writer.field_names != field_names:
+            if csv_writer is not None:
+                csv_writer.close()
+            csv_writer = TradesCSVWriter(csv_path=csv_path, field_names=field_names)
+            self._csv_writers[csv_path] = csv_writer
+        csv_writer.write_row(field_data)
+
+    def _flush_csv_writers(self):
+        for csv_writer in list(self._csv_writers.values()):
+            csv_writer.flush()
 
     def _update_order_status(self,
                              event_tag: int,
@@ -446,18 +652,21 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        write_market_states = self._market_states_checkpoint(market)
+
+        def write_order_status(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                write_market_states(session)
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        self._write(write_order_status)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -493,15 +702,18 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        write_market_states = self._market_states_checkpoint(connector)
+
+        def write_range_position_update(session: Session):
+            session.add(rp_update)
+            write_market_states(session)
+
+        self._write(write_range_position_update)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -511,17 +723,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        write_market_states = self._market_states_checkpoint(connector)
+
+        def write_range_position_fees(session: Session):
+            session.add(rp_fees)
+            write_market_states(session)
+
+        self._write(write_range_position_fees)
 
     @staticmethod
     async def _sleep(delay):
@@ -8,6 +8,8 @@ from hummingbot.connector.derivative.perpetual_budget_checker import PerpetualBu
 from hummingbot.connector.derivative.position import Position
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.perpetual_trading import PerpetualTrading
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
@@ -381,7 +383,8 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             # There is a chance of race condition when the next await allows for a set() to occur before the clear()
             # Maybe it is better to use a asyncio.Condition() instead of asyncio.Event()?
             self._funding_fee_poll_notifier.clear()
-            await self._update_all_funding_payments(fire_event_on_new=True)
+            with request_priority(RequestPriority.LOW):
+                await self._update_all_funding_payments(fire_event_on_new=True)
 
     async def _update_all_funding_payments(self, fire_event_on_new: bool):
         try:
@@ -12,6 +12,10 @@ from aioresponses.core import RequestCall
 from bidict import bidict
 
 from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import current_request_priority
+from hummingbot.core.api_throttler.data_types import RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
@@ -611,6 +615,49 @@ class AbstractExchangeConnectorTests:
 
             self.assertRaises(asyncio.CancelledError, self.async_run_with_timeout, self.exchange.check_network())
 
+        def test_warm_up_connections_sends_network_check_request_with_high_priority(self):
+            request_priorities = []
+            self.exchange._make_network_check_request = AsyncMock(
+                side_effect=lambda: request_priorities.append(current_request_priority()))
+
+            self.async_run_with_timeout(coroutine=self.exchange._warm_up_connections())
+
+            self.assertEqual([RequestPriority.HIGH], request_priorities)
+
+        def test_connections_warm_up_loop_warms_up_the_connections_periodically(self):
+            warm_up_sleeps = []
+
+            # Other background loops of the connector can also await the patched sleep
+            async def sleep(delay: float):
+                if delay == self.exchange.CONNECTIONS_WARM_UP_INTERVAL:
+                    warm_up_sleeps.append(delay)
+                    if len(warm_up_sleeps) == 2:
+                        raise asyncio.CancelledError()
+
+            self.exchange._make_network_check_request = AsyncMock()
+            self.exchange._sleep = sleep
+
+            self.assertRaises(
+                asyncio.CancelledError, self.async_run_with_timeout, self.exchange._connections_warm_up_loop())
+
+            self.assertEqual(2, self.exchange._make_network_check_request.await_count)
+            self.assertEqual([self.exchange.CONNECTIONS_WARM_UP_INTERVAL] * 2, warm_up_sleeps)
+
+        def test_order_book_tracker_uses_the_connector_diff_dispatch_mode(self):
+            self.assertEqual(self.exchange.DIRECT_DIFF_DISPATCH, self.exchange.order_book_tracker._direct_diff_dispatch)
+
+        def test_throttler_uses_the_connector_engine(self):
+            self.assertIsInstance(
+                self.exchange._throttler,
+                SlidingWindowThrottler if self.exchange.SLIDING_WINDOW_THROTTLER else AsyncThrottler)
+
+        def test_warm_up_connections_ignores_errors(self):
+            self.exchange._make_network_check_request = AsyncMock(side_effect=IOError("Test error"))
+
+            self.async_run_with_timeout(coroutine=self.exchange._warm_up_connections())
+
+            self.exchange._make_network_check_request.assert_awaited_once()
+
         def test_initial_status_dict(self):
             self.exchange._set_trading_pair_symbol_map(None)
 
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
@@ -15,6 +15,10 @@ class TimeSynchronizer:
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+
+    The synchronized time is the local monotonic counter plus the offset, so it is not affected by wall-clock
+    adjustments. The offset is computed when it is first needed after the samples change, and then reused.
+    Without samples the offset anchors the counter to the wall-clock time of that moment.
     """
 
     NaN = float("nan")
@@ -22,6 +26,7 @@ class TimeSynchronizer:
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        self._current_time_offset_ms: Optional[float] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -31,20 +36,17 @@ class TimeSynchronizer:
 
     @property
     def time_offset_ms(self) -> float:
-        if not self._time_offset_ms:
-            offset = (self._time() - self._current_seconds_counter()) * 1e3
-        else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
-
-        return offset
+        if self._current_time_offset_ms is None:
+            self._current_time_offset_ms = self._calculate_time_offset_ms()
+        return self._current_time_offset_ms
 
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
+        self._current_time_offset_ms = None
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._current_time_offset_ms = None
 
     def time(self) -> float:
         """
@@ -86,6 +88,16 @@ class TimeSynchronizer:
             # This is done to avoid the warning message from asyncio framework saying a coroutine was not awaited
             time_provider.close()
 
+    def _calculate_time_offset_ms(self) -> float:
+        if not self._time_offset_ms:
+            offset = (self._time() - self._current_seconds_counter()) * 1e3
+        else:
+            median = numpy.median(self._time_offset_ms)
+            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+            offset = numpy.mean([median, weighted_average])
+
+        return offset
+
     def _current_seconds_counter(self):
         return time.perf_counter()
 
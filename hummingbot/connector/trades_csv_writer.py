@@ -0,0 +1,68 @@
+import csv
+import os
+import threading
+from shutil import move
+from typing import IO, Any, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+class TradesCSVWriter:
+    """
+    Appends the trade rows to a CSV file kept open between writes.
+
+    The header of an existing file is checked only once, when the file is opened: if it doesn't match the field names
+    the file is renamed with an `_old_<timestamp>` suffix and a new one is started. Rows are buffered by the file
+    object until `flush` is called, so the caller decides how many rows are written at once.
+    """
+
+    def __init__(self, csv_path: str, field_names: Tuple[str, ...]):
+        self._csv_path = csv_path
+        self._field_names = field_names
+        self._file: Optional[IO[str]] = None
+        self._writer: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @property
+    def csv_path(self) -> str:
+        return self._csv_path
+
+    @property
+    def field_names(self) -> Tuple[str, ...]:
+        return self._field_names
+
+    def write_row(self, row: Sequence[Any]):
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._writer.writerow(row)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._writer = None
+
+    def _open(self):
+        header = self._read_header() if os.path.exists(self._csv_path) else None
+        if header is not None and header != self._field_names:
+            move(self._csv_path,
+                 self._csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+        write_header = not os.path.exists(self._csv_path) or os.path.getsize(self._csv_path) == 0
+
+        self._file = open(self._csv_path, mode="a", newline="")
+        # The line terminator used by pandas, to keep appending to the files created with `DataFrame.to_csv`
+        self._writer = csv.writer(self._file, lineterminator=os.linesep)
+        if write_header:
+            self._writer.writerow(self._field_names)
+
+    def _read_header(self) -> Optional[Tuple[str, ...]]:
+        with open(self._csv_path, newline="") as csv_file:
+            header = next(csv.reader(csv_file), None)
+        return tuple(header) if header is not None else None
@@ -3,9 +3,10 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.throttler_metrics import LimitMetrics
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -34,6 +35,7 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 metrics: Optional[LimitMetrics] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +44,7 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param metrics: Metrics where the task is recorded
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +52,7 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._metrics: Optional[LimitMetrics] = metrics
 
     def flush(self):
         """
@@ -67,13 +71,24 @@ class AsyncRequestContextBase(ABC):
         raise NotImplementedError
 
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        start = time.time()
+        waiting = False
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+                    if self.within_capacity():
+                        break
+                if not waiting and self._metrics is not None:
+                    self._metrics.waiting += 1
+                    waiting = True
+                await asyncio.sleep(self._retry_interval)
+        finally:
+            if waiting:
+                self._metrics.waiting -= 1
+        if self._metrics is not None:
+            self._metrics.task_acquired(time.time() - start)
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
@@ -1,13 +1,13 @@
 import time
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -59,11 +59,12 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: ignored, this throttler serves the tasks as they find capacity
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
@@ -74,4 +75,19 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            metrics=self.limit_metrics(limit_id),
         )
+
+    def capacity_used(self, limit_id: str) -> float:
+        now = time.time()
+        return float(sum(task.weight
+                         for task in self._task_logs
+                         if task.rate_limit.limit_id == limit_id and
+                         now - task.timestamp <= task.rate_limit.time_interval * (1 + self._safety_margin_pct)))
+
+    def update_capacity_used(self, limit_id: str, capacity_used: float):
+        rate_limit = self._id_to_limit_map.get(limit_id)
+        if rate_limit is not None:
+            missing_capacity = self._scaled_capacity_used(capacity_used) - self.capacity_used(limit_id)
+            if missing_capacity > 0:
+                self._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=missing_capacity))
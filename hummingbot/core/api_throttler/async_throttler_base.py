@@ -3,13 +3,38 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
+from hummingbot.core.api_throttler.throttler_metrics import LimitMetrics
 from hummingbot.logger.logger import HummingbotLogger
 
+_request_priority: ContextVar[RequestPriority] = ContextVar("request_priority", default=RequestPriority.NORMAL)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Sets the priority of the throttled tasks executed within the context (and the asyncio tasks created from it) that
+    do not specify one. This allows prioritizing requests done deep in connector specific code, for instance:
+
+        with request_priority(RequestPriority.HIGH):
+            await self._place_cancel(order_id, tracked_order)
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_request_priority() -> RequestPriority:
+    return _request_priority.get()
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -56,6 +81,9 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Usage metrics of the tasks executed, by limit_id
+        self._metrics: Dict[str, LimitMetrics] = {}
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
@@ -85,6 +113,67 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def limit_metrics(self, limit_id: str) -> LimitMetrics:
+        """
+        Returns the metrics object where the tasks executed for the limit_id are recorded
+        """
+        metrics = self._metrics.get(limit_id)
+        if metrics is None:
+            metrics = self._metrics[limit_id] = LimitMetrics()
+        return metrics
+
+    def record_rate_limit_rejection(self, limit_id: str):
+        """
+        Records a request rejected by the server because of rate limits (e.g. HTTP 429)
+        """
+        self.limit_metrics(limit_id).rejected += 1
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the usage metrics of each limit_id, with the keys:
+            limit, time_interval: the rate limit definition (None for tasks without rate limit)
+            capacity_used: the weight used in the current time window
+            waiting: the number of tasks waiting for capacity
+            acquired: the number of tasks executed
+            rejected: the number of requests rejected by the server because of rate limits
+            wait_time_p50, wait_time_p99: the percentiles of the time waited by the last tasks, in seconds
+        """
+        metrics = {}
+        for limit_id in list(self._id_to_limit_map) + [limit_id for limit_id in self._metrics
+                                                       if limit_id not in self._id_to_limit_map]:
+            rate_limit = self._id_to_limit_map.get(limit_id)
+            limit_metrics = self._metrics.get(limit_id) or LimitMetrics()
+            metrics[limit_id] = {
+                "limit": None if rate_limit is None else float(rate_limit.limit),
+                "time_interval": None if rate_limit is None else rate_limit.time_interval,
+                "capacity_used": self.capacity_used(limit_id),
+                "waiting": limit_metrics.waiting,
+                "acquired": limit_metrics.acquired,
+                "rejected": limit_metrics.rejected,
+                "wait_time_p50": limit_metrics.wait_time_percentile(50),
+                "wait_time_p99": limit_metrics.wait_time_percentile(99),
+            }
+        return metrics
+
+    @abstractmethod
+    def capacity_used(self, limit_id: str) -> float:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_capacity_used(self, limit_id: str, capacity_used: float):
+        """
+        Raises the capacity used in the current window of the limit to the value reported by the server, when it is
+        higher than the one accounted locally (e.g. because other clients share the same API key or IP).
+        The server reports the usage of the whole account, so it is scaled by `limits_pct` like the limits.
+        """
+        raise NotImplementedError
+
+    def _scaled_capacity_used(self, capacity_used: float) -> float:
+        """
+        Returns the share of the capacity used reported by the server that corresponds to this throttler
+        """
+        return float(Decimal(str(capacity_used)) * self.limits_pct)
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,15 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority of a task waiting for rate limit capacity. Lower values are served first.
+    """
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -0,0 +1,395 @@
+import asyncio
+import itertools
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, current_request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.throttler_metrics import LimitMetrics
+
+
+class RateLimitWindow:
+    """
+    Sliding window log of the capacity used for a single RateLimit.
+    Entries are kept in acquisition order, so the expired ones are always at the left end of the deque and the used
+    capacity is maintained as a running sum. The window also keeps the FIFO queue of the tasks waiting for capacity and
+    the timer that wakes them up when the capacity they need is released.
+    """
+
+    __slots__ = ("rate_limit", "limit", "window", "capacity_used", "waiters", "_entries", "_timer")
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self._entries: Deque[Tuple[float, float]] = deque()
+        self.capacity_used: float = 0.0
+        self.waiters: WaiterQueue = WaiterQueue()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.update_rate_limit(rate_limit, safety_margin_pct)
+
+    def update_rate_limit(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self.limit: float = float(rate_limit.limit)
+        self.window: float = rate_limit.time_interval * (1 + safety_margin_pct)
+
+    def expire(self, now: float):
+        """
+        Removes the entries that are at least as old as the window
+        :param now: the current time
+        """
+        entries = self._entries
+        cutoff = now - self.window
+        while entries and entries[0][0] <= cutoff:
+            self.capacity_used -= entries.popleft()[1]
+        if not entries:
+            # Avoids carrying float rounding errors from one burst to the next
+            self.capacity_used = 0.0
+
+    def has_capacity(self, weight: float, now: float) -> bool:
+        self.expire(now)
+        # A task heavier than the whole limit can only run alone
+        return self.capacity_used + weight <= self.limit or self.capacity_used == 0
+
+    def time_until_capacity(self, weight: float, now: float) -> float:
+        """
+        Returns the time until enough entries expire for a task with the given weight to fit in the window
+        :param weight: the weight of the task
+        :param now: the current time
+        """
+        if self.has_capacity(weight, now):
+            return 0.0
+        excess = self.capacity_used + weight - self.limit
+        for timestamp, entry_weight in self._entries:
+            excess -= entry_weight
+            if excess <= 0:
+                return timestamp + self.window - now
+        return self._entries[-1][0] + self.window - now
+
+    def add(self, weight: float, now: float):
+        self._entries.append((now, weight))
+        self.capacity_used += weight
+
+    def schedule_wakeup(self, delay: float, callback):
+        """
+        Sets the timer of the window to run the callback after the delay, replacing the timer already scheduled
+        """
+        loop = asyncio.get_running_loop()
+        when = loop.time() + delay
+        if self._timer is not None:
+            if abs(self._timer.when() - when) < 1e-6:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_at(when, self._wakeup, callback)
+
+    def cancel_wakeup(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _wakeup(self, callback):
+        self._timer = None
+        callback(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TaskWaiter:
+    """
+    A task waiting for capacity. It is queued in all the windows it consumes capacity from, and runs once it is first in
+    all those queues and all the windows have capacity for it.
+    """
+
+    __slots__ = ("windows", "future", "priority", "sequence", "enqueued_at")
+
+    def __init__(self,
+                 windows: List[Tuple[RateLimitWindow, float]],
+                 future: asyncio.Future,
+                 priority: RequestPriority,
+                 sequence: int,
+                 enqueued_at: float):
+        self.windows: List[Tuple[RateLimitWindow, float]] = windows
+        self.future: asyncio.Future = future
+        self.priority: RequestPriority = priority
+        self.sequence: int = sequence
+        self.enqueued_at: float = enqueued_at
+
+
+class WaiterQueue:
+    """
+    Tasks waiting for the capacity of a window, with one FIFO lane per priority.
+    Higher priorities are served first, but a task that has been waiting since before `starved_before` is served ahead
+    of any priority, in arrival order, so the low priority lanes are never starved. The order only depends on the
+    tasks, which means it is the same in all the queues a task is waiting in.
+    """
+
+    __slots__ = ("_lanes",)
+
+    def __init__(self):
+        self._lanes: Dict[RequestPriority, Deque[TaskWaiter]] = {priority: deque() for priority in RequestPriority}
+
+    def append(self, waiter: TaskWaiter):
+        self._lanes[waiter.priority].append(waiter)
+
+    def remove(self, waiter: TaskWaiter):
+        self._lanes[waiter.priority].remove(waiter)
+
+    def first(self, starved_before: float) -> Optional[TaskWaiter]:
+        first = None
+        starved = None
+        for lane in self._lanes.values():
+            if lane:
+                waiter = lane[0]
+                if first is None:
+                    first = waiter
+                if waiter.enqueued_at <= starved_before and (starved is None or waiter.sequence < starved.sequence):
+                    starved = waiter
+        return starved or first
+
+    def __contains__(self, waiter: TaskWaiter) -> bool:
+        return waiter in self._lanes[waiter.priority]
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that waits until all the windows associated with the task have
+    capacity for it. Waiting tasks are woken up in FIFO order exactly when the capacity they need is released.
+    """
+
+    def __init__(self,
+                 throttler: "SlidingWindowThrottler",
+                 windows: List[Tuple[RateLimitWindow, float]],
+                 priority: RequestPriority = RequestPriority.NORMAL,
+                 metrics: Optional[LimitMetrics] = None,
+                 ):
+        """
+        :param throttler: The throttler owning the windows
+        :param windows: List of windows with the weight the task consumes from each of them
+        :param priority: The priority of the task when it has to wait for capacity
+        :param metrics: Metrics where the task is recorded
+        """
+        self._throttler: "SlidingWindowThrottler" = throttler
+        self._windows: List[Tuple[RateLimitWindow, float]] = windows
+        self._priority: RequestPriority = priority
+        self._metrics: Optional[LimitMetrics] = metrics
+
+    def flush(self):
+        now = self._throttler._time()
+        for window, _ in self._windows:
+            window.expire(now)
+
+    def within_capacity(self) -> bool:
+        now = self._throttler._time()
+        for window, weight in self._windows:
+            if not window.has_capacity(weight, now):
+                if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                    rate_limit = window.rate_limit
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {window.capacity_used:g} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                return False
+        return True
+
+    async def acquire(self):
+        if all(len(window.waiters) == 0 for window, _ in self._windows) and self.within_capacity():
+            self._throttler.register_task(self._windows)
+            if self._metrics is not None:
+                self._metrics.task_acquired(0.0)
+        elif self._metrics is None:
+            await self._throttler.wait_for_capacity(self._windows, self._priority)
+        else:
+            start = self._throttler._time()
+            self._metrics.waiting += 1
+            try:
+                await self._throttler.wait_for_capacity(self._windows, self._priority)
+            finally:
+                self._metrics.waiting -= 1
+            self._metrics.task_acquired(self._throttler._time() - start)
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Throttler with the same rate limit semantics as AsyncThrottler, that keeps a separate sliding window per limit_id
+    instead of a single task log shared by all the limits. Checking the capacity of a task only touches the windows of
+    the limits it consumes, expiration is amortized O(1) and all the arithmetic is done with floats.
+    Tasks that have to wait are queued by priority, in FIFO order within the same priority, and woken up by a timer per
+    limit set to the exact time the oldest blocking entry expires, so `retry_interval` is not used. Tasks waiting for
+    longer than `priority_max_wait` are served in arrival order regardless of their priority.
+    It can be used wherever an AsyncThrottler is expected, for instance in WebAssistantsFactory.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_max_wait: float = 5.0,
+                 ):
+        """
+        :param priority_max_wait: Time after which a waiting task is served before any newer task, whatever the
+            priorities
+        (see AsyncThrottlerBase for the other parameters)
+        """
+        self._priority_max_wait: float = priority_max_wait
+        self._waiters_sequence = itertools.count()
+        # Required by set_rate_limits, which is called from the base class constructor
+        self._safety_margin_pct: float = safety_margin_pct
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._task_windows: Dict[str, List[Tuple[RateLimitWindow, float]]] = {}
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        # The windows of limits that are kept preserve the capacity already used
+        windows = {}
+        for limit_id, rate_limit in self._id_to_limit_map.items():
+            window = self._windows.get(limit_id)
+            if window is None:
+                window = RateLimitWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            else:
+                window.update_rate_limit(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            windows[limit_id] = window
+        self._windows = windows
+        self._task_windows = {}
+        for window in windows.values():
+            if window.waiters:
+                # The time the waiters have to wait depends on the limit
+                self._process_waiters(window)
+
+    def task_windows(self, limit_id: str) -> List[Tuple[RateLimitWindow, float]]:
+        """
+        Returns the windows a task consumes capacity from, with the weight it consumes from each of them
+        :param limit_id: the limit_id associated with the task
+        """
+        task_windows = self._task_windows.get(limit_id)
+        if task_windows is None:
+            rate_limit, related_limits = self.get_related_limits(limit_id=limit_id)
+            weights: Dict[str, float] = {}
+            if rate_limit is not None:
+                for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits:
+                    weights[limit.limit_id] = weights.get(limit.limit_id, 0.0) + weight
+            task_windows = [(self._windows[window_limit_id], weight) for window_limit_id, weight in weights.items()]
+            self._task_windows[limit_id] = task_windows
+        return task_windows
+
+    def capacity_used(self, limit_id: str) -> float:
+        """
+        Returns the capacity used in the current window of the limit
+        :param limit_id: the limit_id of the RateLimit
+        """
+        window = self._windows.get(limit_id)
+        if window is None:
+            return 0.0
+        window.expire(self._time())
+        return window.capacity_used
+
+    def update_capacity_used(self, limit_id: str, capacity_used: float):
+        window = self._windows.get(limit_id)
+        if window is not None:
+            now = self._time()
+            window.expire(now)
+            missing_capacity = self._scaled_capacity_used(capacity_used) - window.capacity_used
+            if missing_capacity > 0:
+                # Registered as a task executed now, so it is released after a full window
+                window.add(missing_capacity, now)
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the task if it has to wait, by default the one set with `request_priority`
+        :return: An async context (used with async with syntax)
+        """
+        return SlidingWindowRequestContext(
+            throttler=self,
+            windows=self.task_windows(limit_id),
+            priority=current_request_priority() if priority is None else priority,
+            metrics=self.limit_metrics(limit_id),
+        )
+
+    def register_task(self, task_windows: List[Tuple[RateLimitWindow, float]]):
+        """
+        Registers a task that is about to run in the windows it consumes capacity from
+        """
+        now = self._time()
+        for window, weight in task_windows:
+            window.add(weight, now)
+
+    async def wait_for_capacity(self,
+                                task_windows: List[Tuple[RateLimitWindow, float]],
+                                priority: RequestPriority = RequestPriority.NORMAL):
+        """
+        Queues a task in its windows and waits until it is registered
+        """
+        waiter = TaskWaiter(
+            windows=task_windows,
+            future=asyncio.get_running_loop().create_future(),
+            priority=priority,
+            sequence=next(self._waiters_sequence),
+            enqueued_at=self._time(),
+        )
+        for window, _ in task_windows:
+            window.waiters.append(waiter)
+        self._process_waiters(task_windows[0][0])
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.cancelled():
+                # The waiter can be holding back the ones queued after it
+                for window, _ in task_windows:
+                    if waiter in window.waiters:
+                        window.waiters.remove(waiter)
+                        self._process_waiters(window)
+            raise
+
+    def _process_waiters(self, window: RateLimitWindow):
+        """
+        Runs the waiters that are first in all their queues while there is capacity for them, and sets the timers of
+        the windows blocking the first one that can not run yet.
+        """
+        pending = [window]
+        while pending:
+            window = pending.pop()
+            while window.waiters:
+                now = self._time()
+                starved_before = now - self._priority_max_wait
+                waiter = window.waiters.first(starved_before)
+                if waiter.future.done():
+                    window.waiters.remove(waiter)
+                    continue
+                if any(task_window.waiters.first(starved_before) is not waiter for task_window, _ in waiter.windows):
+                    # The queues where the waiter is not first are processed when their first waiter runs
+                    break
+                blocked = False
+                for task_window, weight in waiter.windows:
+                    delay = task_window.time_until_capacity(weight, now)
+                    if delay > 0:
+                        blocked = True
+                        task_window.schedule_wakeup(delay, self._process_waiters)
+                if blocked:
+                    break
+                self.register_task(waiter.windows)
+                for task_window, _ in waiter.windows:
+                    task_window.waiters.remove(waiter)
+                    if task_window is not window:
+                        pending.append(task_window)
+                waiter.future.set_result(None)
+
+    def _time(self) -> float:
+        return time.monotonic()
@@ -0,0 +1,35 @@
+import math
+from collections import deque
+from typing import Deque
+
+WAIT_TIMES_SAMPLE_SIZE = 1000
+
+
+class LimitMetrics:
+    """
+    Counters of the tasks executed through a throttler for one limit_id. The wait time percentiles are computed over
+    the last `WAIT_TIMES_SAMPLE_SIZE` tasks.
+    """
+
+    __slots__ = ("waiting", "acquired", "rejected", "_wait_times")
+
+    def __init__(self):
+        self.waiting: int = 0
+        self.acquired: int = 0
+        self.rejected: int = 0
+        self._wait_times: Deque[float] = deque(maxlen=WAIT_TIMES_SAMPLE_SIZE)
+
+    def task_acquired(self, wait_time: float):
+        self.acquired += 1
+        self._wait_times.append(wait_time)
+
+    def wait_time_percentile(self, percentile: float) -> float:
+        """
+        Returns the wait time percentile (nearest rank), or 0 if no task has been executed yet
+        :param percentile: the percentile, between 0 and 100
+        """
+        if not self._wait_times:
+            return 0.0
+        wait_times = sorted(self._wait_times)
+        rank = max(math.ceil(percentile / 100 * len(wait_times)), 1)
+        return wait_times[rank - 1]
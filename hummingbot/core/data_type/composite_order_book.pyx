@@ -11,6 +11,9 @@ from libcpp.vector cimport vector
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+NaN = float("nan")
+
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
@@ -192,3 +195,100 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    # The composite entries are produced by the bid_entries()/ask_entries() overrides, so the depth queries walk
+    # those instead of the raw C++ sets used by OrderBook.
+    def _taker_entries(self, bint is_buy) -> Iterator[OrderBookRow]:
+        """
+        Returns the composite entries consumed by a taker order, the asks for a buy and the bids for a sell
+        """
+        return self.ask_entries() if is_buy else self.bid_entries()
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in self._taker_entries(is_buy):
+            cumulative_volume += order_book_row.amount
+            if cumulative_volume >= volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+
+        for order_book_row in self._taker_entries(is_buy):
+            total_cost += order_book_row.amount * order_book_row.price
+            total_volume += order_book_row.amount
+            if total_volume >= volume:
+                total_cost -= order_book_row.amount * order_book_row.price
+                total_volume -= order_book_row.amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * order_book_row.price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in self._taker_entries(is_buy):
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            if cumulative_volume >= quote_volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        for order_book_row in self._taker_entries(is_buy):
+            row_amount = order_book_row.amount
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * order_book_row.price
+            if cumulative_base_amount >= base_amount:
+                break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in self._taker_entries(is_buy):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in self._taker_entries(is_buy):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
@@ -0,0 +1,27 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+
+
+cdef class FlatOrderBook(OrderBook):
+    # Each side is stored in parallel vectors sorted by key, with the best price at the back. Bid keys are the prices
+    # and ask keys the negated prices, so both sides share the same ascending order.
+    cdef vector[double] _bid_keys
+    cdef vector[double] _bid_amounts
+    cdef vector[int64_t] _bid_update_ids
+    cdef vector[double] _ask_keys
+    cdef vector[double] _ask_amounts
+    cdef vector[int64_t] _ask_update_ids
+
+    cdef c_truncate_overlap_entries(self)
+    cdef c_update_best_prices(self)
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
@@ -0,0 +1,432 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from libc.math cimport INFINITY, NAN
+from libc.stdint cimport int64_t
+from libcpp.algorithm cimport sort
+from libcpp.utility cimport pair
+from libcpp.vector cimport vector
+
+from cython.operator cimport address as ref, dereference as deref
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+NaN = float("nan")
+
+
+cdef inline size_t key_position(const vector[double] &keys, double key) noexcept nogil:
+    """
+    Returns the position of the first key that is not lower than `key`. Most updates hit the top of the book, which is
+    at the back of the vectors, so that end is checked before the binary search.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = keys.size()
+        size_t middle
+    if high == 0 or keys[high - 1] < key:
+        return high
+    while low < high:
+        middle = (low + high) // 2
+        if keys[middle] < key:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef int apply_level(vector[double] &keys,
+                     vector[double] &amounts,
+                     vector[int64_t] &update_ids,
+                     double key,
+                     double amount,
+                     int64_t update_id) except -1:
+    cdef size_t position = key_position(keys, key)
+    if position < keys.size() and keys[position] == key:
+        if amount > 0:
+            amounts[position] = amount
+            update_ids[position] = update_id
+        else:
+            keys.erase(keys.begin() + position)
+            amounts.erase(amounts.begin() + position)
+            update_ids.erase(update_ids.begin() + position)
+    elif amount > 0:
+        keys.insert(keys.begin() + position, key)
+        amounts.insert(amounts.begin() + position, amount)
+        update_ids.insert(update_ids.begin() + position, update_id)
+    return 0
+
+
+cdef int fill_side(vector[OrderBookEntry] &entries,
+                   double sign,
+                   vector[double] &keys,
+                   vector[double] &amounts,
+                   vector[int64_t] &update_ids) except -1:
+    """
+    Replaces the content of one side with the snapshot entries. As in the tree based book, the first entry wins when a
+    price is repeated.
+    """
+    cdef:
+        vector[pair[double, size_t]] order
+        size_t i
+
+    keys.clear()
+    amounts.clear()
+    update_ids.clear()
+    order.reserve(entries.size())
+    for i in range(entries.size()):
+        order.push_back(pair[double, size_t](sign * entries[i].getPrice(), i))
+    sort(order.begin(), order.end())
+    for i in range(order.size()):
+        if keys.size() > 0 and keys.back() == order[i].first:
+            continue
+        keys.push_back(order[i].first)
+        amounts.push_back(entries[order[i].second].getAmount())
+        update_ids.push_back(entries[order[i].second].getUpdateId())
+    return 0
+
+
+cdef class FlatOrderBook(OrderBook):
+    """
+    Order book that keeps each side in flat sorted arrays instead of a tree with one heap node per level. Updates close
+    to the top of the book, the most frequent ones, only move the few levels above them, and the walks done by the
+    depth queries run over contiguous memory.
+
+    Behaves like `OrderBook` and can replace it wherever an order book is created, for instance through
+    `ExchangePyBase._create_order_book`.
+    """
+
+    def __init__(self, dex=False, depth_index=False):
+        super().__init__(dex=dex, depth_index=depth_index)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            size_t bid_book_size
+            size_t ask_book_size
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+            double depth_bid_price = INFINITY
+            double depth_ask_price = -INFINITY
+            bint depth_changed = False
+
+        if self._depth_event_levels > 0:
+            depth_bid_price = self.c_get_level_price(True, self._depth_event_levels)
+            depth_ask_price = self.c_get_level_price(False, self._depth_event_levels)
+
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            apply_level(self._bid_keys, self._bid_amounts, self._bid_update_ids,
+                        bid.getPrice(), bid.getAmount(), bid.getUpdateId())
+            if bid.getPrice() >= depth_bid_price:
+                depth_changed = True
+        for ask in asks:
+            apply_level(self._ask_keys, self._ask_amounts, self._ask_update_ids,
+                        -ask.getPrice(), ask.getAmount(), ask.getUpdateId())
+            if ask.getPrice() <= depth_ask_price:
+                depth_changed = True
+
+        bid_book_size = self._bid_keys.size()
+        ask_book_size = self._ask_keys.size()
+        self.c_truncate_overlap_entries()
+        if bids.size() > 0 or self._bid_keys.size() != bid_book_size:
+            self._bid_depth_index_dirty = True
+        if asks.size() > 0 or self._ask_keys.size() != ask_book_size:
+            self._ask_depth_index_dirty = True
+
+        self.c_update_best_prices()
+        self._last_diff_uid = update_id
+
+        if self._best_bid_ask_events_enabled or self._depth_event_levels > 0:
+            depth_changed = (depth_changed
+                             or self._bid_keys.size() != bid_book_size
+                             or self._ask_keys.size() != ask_book_size)
+            self.c_record_top_of_book_changes(previous_best_bid, previous_best_ask, depth_changed)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        fill_side(bids, 1.0, self._bid_keys, self._bid_amounts, self._bid_update_ids)
+        fill_side(asks, -1.0, self._ask_keys, self._ask_amounts, self._ask_update_ids)
+        if self._dex:
+            self.c_truncate_overlap_entries()
+
+        self._best_bid = self._best_ask = NAN
+        self.c_update_best_prices()
+        self._snapshot_uid = update_id
+        self._bid_depth_index_dirty = self._ask_depth_index_dirty = True
+
+        if self._best_bid_ask_events_enabled or self._depth_event_levels > 0:
+            self.c_record_top_of_book_changes(previous_best_bid, previous_best_ask, True)
+
+    cdef c_truncate_overlap_entries(self):
+        """
+        Removes the crossed levels at the top of the book. Centralised exchanges: newer entries win. DEX: the entry with
+        the larger quote amount wins (see OrderBookEntry.cpp).
+        """
+        cdef:
+            double bid_price
+            double ask_price
+            bint remove_ask
+
+        while self._bid_keys.size() > 0 and self._ask_keys.size() > 0:
+            bid_price = self._bid_keys.back()
+            ask_price = -self._ask_keys.back()
+            if bid_price < ask_price:
+                break
+            if self._dex:
+                remove_ask = self._bid_amounts.back() * bid_price > self._ask_amounts.back() * ask_price
+            else:
+                remove_ask = self._bid_update_ids.back() > self._ask_update_ids.back()
+            if remove_ask:
+                self._ask_keys.pop_back()
+                self._ask_amounts.pop_back()
+                self._ask_update_ids.pop_back()
+            else:
+                self._bid_keys.pop_back()
+                self._bid_amounts.pop_back()
+                self._bid_update_ids.pop_back()
+
+    cdef c_update_best_prices(self):
+        # As in OrderBook, an emptied side keeps its last best price
+        if self._bid_keys.size() > 0:
+            self._best_bid = self._bid_keys.back()
+        if self._ask_keys.size() > 0:
+            self._best_ask = -self._ask_keys.back()
+
+    cdef double c_get_level_price(self, bint is_bid, int level):
+        if is_bid:
+            if <size_t>level <= self._bid_keys.size():
+                return self._bid_keys[self._bid_keys.size() - level]
+            return -INFINITY
+        if <size_t>level <= self._ask_keys.size():
+            return -self._ask_keys[self._ask_keys.size() - level]
+        return INFINITY
+
+    cdef c_update_depth_index(self, bint is_buy):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_quote_volume = 0
+            double price
+            size_t position
+
+        with nogil:
+            if is_buy and self._ask_depth_index_dirty:
+                self._ask_index_prices.clear()
+                self._ask_index_volumes.clear()
+                self._ask_index_quote_volumes.clear()
+                position = self._ask_keys.size()
+                while position > 0:
+                    position -= 1
+                    price = -self._ask_keys[position]
+                    cumulative_volume += self._ask_amounts[position]
+                    cumulative_quote_volume += self._ask_amounts[position] * price
+                    self._ask_index_prices.push_back(price)
+                    self._ask_index_volumes.push_back(cumulative_volume)
+                    self._ask_index_quote_volumes.push_back(cumulative_quote_volume)
+                self._ask_depth_index_dirty = False
+            elif not is_buy and self._bid_depth_index_dirty:
+                self._bid_index_prices.clear()
+                self._bid_index_volumes.clear()
+                self._bid_index_quote_volumes.clear()
+                position = self._bid_keys.size()
+                while position > 0:
+                    position -= 1
+                    price = self._bid_keys[position]
+                    cumulative_volume += self._bid_amounts[position]
+                    cumulative_quote_volume += self._bid_amounts[position] * price
+                    self._bid_index_prices.push_back(price)
+                    self._bid_index_volumes.push_back(cumulative_volume)
+                    self._bid_index_quote_volumes.push_back(cumulative_quote_volume)
+                self._bid_depth_index_dirty = False
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        if (self._ask_keys.size() if is_buy else self._bid_keys.size()) < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef size_t position = self._bid_keys.size()
+        while position > 0:
+            position -= 1
+            yield OrderBookRow(self._bid_keys[position], self._bid_amounts[position], self._bid_update_ids[position])
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef size_t position = self._ask_keys.size()
+        while position > 0:
+            position -= 1
+            yield OrderBookRow(-self._ask_keys[position], self._ask_amounts[position], self._ask_update_ids[position])
+
+    @property
+    def numpy_snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.get_depth_arrays(max(self._bid_keys.size(), self._ask_keys.size()))
+
+    cdef Py_ssize_t c_fill_depth(self, double[:, ::1] out, Py_ssize_t n, bint is_bid):
+        cdef:
+            Py_ssize_t level = 0
+            size_t size = self._bid_keys.size() if is_bid else self._ask_keys.size()
+            size_t position
+
+        with nogil:
+            while level < n and <size_t>level < size:
+                position = size - 1 - level
+                if is_bid:
+                    out[level, 0] = self._bid_keys[position]
+                    out[level, 1] = self._bid_amounts[position]
+                    out[level, 2] = self._bid_update_ids[position]
+                else:
+                    out[level, 0] = -self._ask_keys[position]
+                    out[level, 1] = self._ask_amounts[position]
+                    out[level, 2] = self._ask_update_ids[position]
+                level += 1
+        return level
+
+    # The depth queries walk one side from the best price, which is the back of the vectors. Prices are recovered from
+    # the keys with `sign`: 1 for bids and -1 for asks.
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            vector[double] *keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+            vector[double] *amounts = ref(self._ask_amounts) if is_buy else ref(self._bid_amounts)
+            double sign = -1 if is_buy else 1
+            double cumulative_volume = 0
+            double result_price = NaN
+            size_t position = deref(keys).size()
+
+        if self._depth_index_enabled:
+            return OrderBook.c_get_price_for_volume(self, is_buy, volume)
+
+        with nogil:
+            while position > 0:
+                position -= 1
+                cumulative_volume += deref(amounts)[position]
+                if cumulative_volume >= volume:
+                    result_price = sign * deref(keys)[position]
+                    break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            vector[double] *keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+            vector[double] *amounts = ref(self._ask_amounts) if is_buy else ref(self._bid_amounts)
+            double sign = -1 if is_buy else 1
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+            double row_price
+            double row_amount
+            size_t position = deref(keys).size()
+
+        if self._depth_index_enabled:
+            return OrderBook.c_get_vwap_for_volume(self, is_buy, volume)
+
+        with nogil:
+            while position > 0:
+                position -= 1
+                row_price = sign * deref(keys)[position]
+                row_amount = deref(amounts)[position]
+                if total_volume + row_amount >= volume:
+                    total_cost += (volume - total_volume) * row_price
+                    total_volume = volume
+                    result_vwap = total_cost / total_volume
+                    break
+                total_cost += row_amount * row_price
+                total_volume += row_amount
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            vector[double] *keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+            vector[double] *amounts = ref(self._ask_amounts) if is_buy else ref(self._bid_amounts)
+            double sign = -1 if is_buy else 1
+            double cumulative_volume = 0
+            double result_price = NaN
+            size_t position = deref(keys).size()
+
+        if self._depth_index_enabled:
+            return OrderBook.c_get_price_for_quote_volume(self, is_buy, quote_volume)
+
+        with nogil:
+            while position > 0:
+                position -= 1
+                cumulative_volume += deref(amounts)[position] * sign * deref(keys)[position]
+                if cumulative_volume >= quote_volume:
+                    result_price = sign * deref(keys)[position]
+                    break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            vector[double] *keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+            vector[double] *amounts = ref(self._ask_amounts) if is_buy else ref(self._bid_amounts)
+            double sign = -1 if is_buy else 1
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+            size_t position = deref(keys).size()
+
+        if self._depth_index_enabled:
+            return OrderBook.c_get_quote_volume_for_base_amount(self, is_buy, base_amount)
+
+        with nogil:
+            while position > 0:
+                position -= 1
+                row_amount = deref(amounts)[position]
+                if row_amount + cumulative_base_amount >= base_amount:
+                    row_amount = base_amount - cumulative_base_amount
+                cumulative_base_amount += row_amount
+                cumulative_volume += row_amount * sign * deref(keys)[position]
+                if cumulative_base_amount >= base_amount:
+                    break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            vector[double] *keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+            vector[double] *amounts = ref(self._ask_amounts) if is_buy else ref(self._bid_amounts)
+            double sign = -1 if is_buy else 1
+            double cumulative_volume = 0
+            double result_price = NaN
+            size_t position = deref(keys).size()
+
+        if self._depth_index_enabled:
+            return OrderBook.c_get_volume_for_price(self, is_buy, price)
+
+        with nogil:
+            # Keys grow towards the best price, so the walk stops at the first key below the price key
+            while position > 0 and deref(keys)[position - 1] >= sign * price:
+                position -= 1
+                cumulative_volume += deref(amounts)[position]
+                result_price = sign * deref(keys)[position]
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            vector[double] *keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+            vector[double] *amounts = ref(self._ask_amounts) if is_buy else ref(self._bid_amounts)
+            double sign = -1 if is_buy else 1
+            double cumulative_volume = 0
+            double result_price = NaN
+            size_t position = deref(keys).size()
+
+        if self._depth_index_enabled:
+            return OrderBook.c_get_quote_volume_for_price(self, is_buy, price)
+
+        with nogil:
+            while position > 0 and deref(keys)[position - 1] >= sign * price:
+                position -= 1
+                cumulative_volume += deref(amounts)[position] * sign * deref(keys)[position]
+                result_price = sign * deref(keys)[position]
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
@@ -20,6 +20,22 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    cdef bint _bid_depth_index_dirty
+    cdef bint _ask_depth_index_dirty
+    cdef vector[double] _bid_index_prices
+    cdef vector[double] _bid_index_volumes
+    cdef vector[double] _bid_index_quote_volumes
+    cdef vector[double] _ask_index_prices
+    cdef vector[double] _ask_index_volumes
+    cdef vector[double] _ask_index_quote_volumes
+    cdef bint _best_bid_ask_events_enabled
+    cdef int _depth_event_levels
+    cdef bint _best_bid_ask_changed
+    cdef bint _depth_changed
+    cdef bint _top_of_book_events_scheduled
+    cdef double _notified_best_bid
+    cdef double _notified_best_ask
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,6 +46,10 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_update_depth_index(self, bint is_buy)
+    cdef double c_get_level_price(self, bint is_bid, int level)
+    cdef c_record_top_of_book_changes(self, double previous_best_bid, double previous_best_ask, bint depth_changed)
+    cdef Py_ssize_t c_fill_depth(self, double[:, ::1] out, Py_ssize_t n, bint is_bid)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -1,5 +1,6 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+import asyncio
 import bisect
 import logging
 import time
@@ -26,18 +27,135 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
+    OrderBookBestBidAskChangedEvent,
+    OrderBookDepthChangedEvent,
     OrderBookEvent,
     OrderBookTradeEvent
 )
 
+from libc.math cimport INFINITY, isnan
+
 cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
 
 
+cdef inline bint prices_differ(double previous_price, double price) noexcept nogil:
+    return not (previous_price == price or (isnan(previous_price) and isnan(price)))
+
+
+cdef inline size_t first_level_reaching(const vector[double] &cumulative, double target) noexcept nogil:
+    """
+    Binary search over a non-decreasing cumulative vector for the first level at which `target` is reached. Returns
+    the vector size if it is never reached.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = cumulative.size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if cumulative[middle] >= target:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline size_t levels_within_price(const vector[double] &prices, double price, bint is_buy) noexcept nogil:
+    """
+    Number of levels, counted from the top of the book, whose price is not worse than `price`.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = prices.size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if (prices[middle] > price) if is_buy else (prices[middle] < price):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef double indexed_quote_amount(const vector[double] &prices,
+                                 const vector[double] &volumes,
+                                 const vector[double] &quote_volumes,
+                                 double base_amount,
+                                 size_t level) noexcept nogil:
+    """
+    Quote amount of the first `base_amount` of the side, `level` being the level at which that amount is reached.
+    """
+    if level >= prices.size():
+        return quote_volumes.back() if quote_volumes.size() > 0 else 0
+    if level == 0:
+        return base_amount * prices[0]
+    return quote_volumes[level - 1] + (base_amount - volumes[level - 1]) * prices[level]
+
+
+cdef OrderBookQueryResult indexed_price_for_volume(const vector[double] &prices,
+                                                   const vector[double] &cumulative,
+                                                   double volume):
+    cdef:
+        size_t level = first_level_reaching(cumulative, volume)
+    if level < prices.size():
+        return OrderBookQueryResult(NaN, volume, prices[level], min(cumulative[level], volume))
+    return OrderBookQueryResult(NaN, volume, NaN, min(cumulative.back() if cumulative.size() > 0 else 0, volume))
+
+
+cdef OrderBookQueryResult indexed_vwap_for_volume(const vector[double] &prices,
+                                                  const vector[double] &volumes,
+                                                  const vector[double] &quote_volumes,
+                                                  double volume):
+    cdef:
+        size_t level = first_level_reaching(volumes, volume)
+    if level < prices.size():
+        return OrderBookQueryResult(NaN,
+                                    volume,
+                                    indexed_quote_amount(prices, volumes, quote_volumes, volume, level) / volume,
+                                    volume)
+    return OrderBookQueryResult(NaN, volume, NaN, min(volumes.back() if volumes.size() > 0 else 0, volume))
+
+
+cdef OrderBookQueryResult indexed_volume_for_price(const vector[double] &prices,
+                                                   const vector[double] &cumulative,
+                                                   double price,
+                                                   bint is_buy):
+    cdef:
+        size_t levels = levels_within_price(prices, price, is_buy)
+    if levels == 0:
+        return OrderBookQueryResult(price, NaN, NaN, 0)
+    return OrderBookQueryResult(price, NaN, prices[levels - 1], cumulative[levels - 1])
+
+
+cdef vector[OrderBookEntry] raw_entries_to_vector(object raw_entries, int64_t update_id) except *:
+    """
+    Converts the raw [price, amount, ...] levels of an order book message content into order book entries, parsing each
+    price and amount once and without creating intermediate OrderBookRow objects.
+    """
+    cdef:
+        vector[OrderBookEntry] entries
+    entries.reserve(len(raw_entries))
+    for raw_entry in raw_entries:
+        entries.push_back(OrderBookEntry(float(raw_entry[0]), float(raw_entry[1]), update_id))
+    return entries
+
+
+cdef bint has_raw_price_levels(object message):
+    """
+    Messages whose class overrides the bids/asks properties store their levels in an exchange specific format, so they
+    can't be read straight from the message content.
+    """
+    message_class = type(message)
+    return message_class.bids is OrderBookMessage.bids and message_class.asks is OrderBookMessage.asks
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_BEST_BID_ASK_CHANGED_EVENT_TAG = OrderBookEvent.BestBidAskChanged.value
+    ORDER_BOOK_DEPTH_CHANGED_EVENT_TAG = OrderBookEvent.DepthChanged.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -46,7 +164,7 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, depth_index=False):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,6 +173,11 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = depth_index
+        self._bid_depth_index_dirty = self._ask_depth_index_dirty = True
+        self._best_bid_ask_events_enabled = False
+        self._depth_event_levels = 0
+        self._notified_best_bid = self._notified_best_ask = float("NaN")
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +188,18 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+            double depth_bid_price = INFINITY
+            double depth_ask_price = -INFINITY
+            bint depth_changed = False
+
+        if self._depth_event_levels > 0:
+            # Lowest bid and highest ask inside the tracked levels, any update from them to the top changes the depth
+            depth_bid_price = self.c_get_level_price(True, self._depth_event_levels)
+            depth_ask_price = self.c_get_level_price(False, self._depth_event_levels)
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -73,15 +208,25 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if bid.getPrice() >= depth_bid_price:
+                depth_changed = True
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if ask.getPrice() <= depth_ask_price:
+                depth_changed = True
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if bids.size() > 0 or self._bid_book.size() != bid_book_size:
+            self._bid_depth_index_dirty = True
+        if asks.size() > 0 or self._ask_book.size() != ask_book_size:
+            self._ask_depth_index_dirty = True
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -96,10 +241,18 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        if self._best_bid_ask_events_enabled or self._depth_event_levels > 0:
+            depth_changed = (depth_changed
+                             or self._bid_book.size() != bid_book_size
+                             or self._ask_book.size() != ask_book_size)
+            self.c_record_top_of_book_changes(previous_best_bid, previous_best_ask, depth_changed)
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
@@ -136,6 +289,78 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self._bid_depth_index_dirty = self._ask_depth_index_dirty = True
+
+        if self._best_bid_ask_events_enabled or self._depth_event_levels > 0:
+            self.c_record_top_of_book_changes(previous_best_bid, previous_best_ask, True)
+
+    cdef double c_get_level_price(self, bint is_bid, int level):
+        """
+        Returns the price of the given level (1 is the best price) of one side of the book. If the side has less levels
+        the price beyond the last one is returned (-inf for bids, inf for asks), so every update is inside the levels.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            int current_level = 1
+
+        if is_bid:
+            while bid_iterator != self._bid_book.rend():
+                if current_level == level:
+                    return deref(bid_iterator).getPrice()
+                inc(bid_iterator)
+                current_level += 1
+            return -INFINITY
+        while ask_iterator != self._ask_book.end():
+            if current_level == level:
+                return deref(ask_iterator).getPrice()
+            inc(ask_iterator)
+            current_level += 1
+        return INFINITY
+
+    cdef c_record_top_of_book_changes(self, double previous_best_bid, double previous_best_ask, bint depth_changed):
+        if (self._best_bid_ask_events_enabled
+                and (prices_differ(previous_best_bid, self._best_bid)
+                     or prices_differ(previous_best_ask, self._best_ask))):
+            self._best_bid_ask_changed = True
+        if self._depth_event_levels > 0 and depth_changed:
+            self._depth_changed = True
+        if (self._best_bid_ask_changed or self._depth_changed) and not self._top_of_book_events_scheduled:
+            try:
+                event_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Without a running event loop there is nothing to coalesce with, notify right away
+                self.emit_top_of_book_events()
+            else:
+                self._top_of_book_events_scheduled = True
+                event_loop.call_soon(self.emit_top_of_book_events)
+
+    def emit_top_of_book_events(self):
+        """
+        Triggers the pending best bid/ask and depth change events. Changes applied during the same event loop iteration
+        are notified only once, and no best bid/ask event is triggered if the prices end up equal to the last notified.
+        """
+        cdef:
+            int64_t update_id = max(self._snapshot_uid, self._last_diff_uid)
+
+        self._top_of_book_events_scheduled = False
+        if self._best_bid_ask_changed:
+            self._best_bid_ask_changed = False
+            if (prices_differ(self._notified_best_bid, self._best_bid)
+                    or prices_differ(self._notified_best_ask, self._best_ask)):
+                self._notified_best_bid = self._best_bid
+                self._notified_best_ask = self._best_ask
+                self.c_trigger_event(
+                    self.ORDER_BOOK_BEST_BID_ASK_CHANGED_EVENT_TAG,
+                    OrderBookBestBidAskChangedEvent(best_bid=self._best_bid, best_ask=self._best_ask, update_id=update_id)
+                )
+        if self._depth_changed:
+            self._depth_changed = False
+            self.c_trigger_event(
+                self.ORDER_BOOK_DEPTH_CHANGED_EVENT_TAG,
+                OrderBookDepthChangedEvent(levels=self._depth_event_levels, update_id=update_id)
+            )
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -161,6 +386,58 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        """
+        When enabled, depth queries are answered by binary search over cumulative volume indexes that are rebuilt
+        lazily, only for sides modified since the previous query. Worth it when the book is queried many times between
+        updates.
+        """
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        self._depth_index_enabled = value
+        self._bid_depth_index_dirty = self._ask_depth_index_dirty = True
+        if not value:
+            self._bid_index_prices.clear()
+            self._bid_index_volumes.clear()
+            self._bid_index_quote_volumes.clear()
+            self._ask_index_prices.clear()
+            self._ask_index_volumes.clear()
+            self._ask_index_quote_volumes.clear()
+
+
+    @property
+    def best_bid_ask_events_enabled(self) -> bool:
+        """
+        When enabled, the order book triggers OrderBookEvent.BestBidAskChanged when an update changes the best bid or
+        best ask price. Changes are coalesced to at most one event per event loop iteration.
+        """
+        return self._best_bid_ask_events_enabled
+
+    @best_bid_ask_events_enabled.setter
+    def best_bid_ask_events_enabled(self, value: bool):
+        self._best_bid_ask_events_enabled = value
+        self._best_bid_ask_changed = False
+        self._notified_best_bid = self._best_bid
+        self._notified_best_ask = self._best_ask
+
+    @property
+    def depth_event_levels(self) -> int:
+        """
+        Number of levels on each side of the book tracked for OrderBookEvent.DepthChanged. The event is triggered, at
+        most once per event loop iteration, when an update modifies any of those levels. 0 disables the event.
+        """
+        return self._depth_event_levels
+
+    @depth_event_levels.setter
+    def depth_event_levels(self, value: int):
+        if value < 0:
+            raise ValueError(f"The number of depth levels can't be negative ({value}).")
+        self._depth_event_levels = value
+        self._depth_changed = False
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -177,6 +454,64 @@ cdef class OrderBook(PubSub):
         asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    @property
+    def numpy_snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        DataFrame free variant of `snapshot`. Returns the bid and ask sides as float64 arrays with the columns
+        [price, amount, update_id], best price first.
+        """
+        return self.get_depth_arrays(max(self._bid_book.size(), self._ask_book.size()))
+
+    def get_depth(self, n: int, is_bid: bool, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Copies the top `n` levels of one side of the book into a float64 array with the columns
+        [price, amount, update_id], best price first.
+
+        :param n: the maximum number of levels to export
+        :param is_bid: True to export the bid side, False for the ask side
+        :param out: optional preallocated C-contiguous float64 array with shape (n, 3) to fill instead of allocating
+        :return: a view over the filled rows, which can be fewer than `n` if the side is shallower
+        """
+        if out is None:
+            out = np.empty((n, 3), dtype=np.float64)
+        elif out.dtype != np.float64 or out.ndim != 2 or out.shape[0] < n or out.shape[1] != 3:
+            raise ValueError(f"The output buffer must be a float64 array with shape ({n}, 3).")
+        return out[:self.c_fill_depth(out, n, is_bid)]
+
+    def get_depth_arrays(self,
+                         n: int,
+                         bids_out: Optional[np.ndarray] = None,
+                         asks_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copies the top `n` levels of both sides of the book. See `get_depth`.
+        """
+        return self.get_depth(n, True, bids_out), self.get_depth(n, False, asks_out)
+
+    cdef Py_ssize_t c_fill_depth(self, double[:, ::1] out, Py_ssize_t n, bint is_bid):
+        cdef:
+            Py_ssize_t level = 0
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        with nogil:
+            if is_bid:
+                bid_it = self._bid_book.rbegin()
+                while level < n and bid_it != self._bid_book.rend():
+                    out[level, 0] = deref(bid_it).getPrice()
+                    out[level, 1] = deref(bid_it).getAmount()
+                    out[level, 2] = deref(bid_it).getUpdateId()
+                    level += 1
+                    inc(bid_it)
+            else:
+                ask_it = self._ask_book.begin()
+                while level < n and ask_it != self._ask_book.end():
+                    out[level, 0] = deref(ask_it).getPrice()
+                    out[level, 1] = deref(ask_it).getAmount()
+                    out[level, 2] = deref(ask_it).getUpdateId()
+                    level += 1
+                    inc(ask_it)
+        return level
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -197,6 +532,32 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, converting its price levels straight from the message content when possible.
+        """
+        cdef:
+            int64_t update_id = message.update_id
+        if has_raw_price_levels(message):
+            self.c_apply_diffs(raw_entries_to_vector(message.content["bids"], update_id),
+                               raw_entries_to_vector(message.content["asks"], update_id),
+                               update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, converting its price levels straight from the message content when possible.
+        """
+        cdef:
+            int64_t update_id = message.update_id
+        if has_raw_price_levels(message):
+            self.c_apply_snapshot(raw_entries_to_vector(message.content["bids"], update_id),
+                                  raw_entries_to_vector(message.content["asks"], update_id),
+                                  update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -308,6 +669,41 @@ cdef class OrderBook(PubSub):
                 break
         return retval
 
+    cdef c_update_depth_index(self, bint is_buy):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_quote_volume = 0
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        with nogil:
+            if is_buy and self._ask_depth_index_dirty:
+                self._ask_index_prices.clear()
+                self._ask_index_volumes.clear()
+                self._ask_index_quote_volumes.clear()
+                ask_it = self._ask_book.begin()
+                while ask_it != self._ask_book.end():
+                    cumulative_volume += deref(ask_it).getAmount()
+                    cumulative_quote_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                    self._ask_index_prices.push_back(deref(ask_it).getPrice())
+                    self._ask_index_volumes.push_back(cumulative_volume)
+                    self._ask_index_quote_volumes.push_back(cumulative_quote_volume)
+                    inc(ask_it)
+                self._ask_depth_index_dirty = False
+            elif not is_buy and self._bid_depth_index_dirty:
+                self._bid_index_prices.clear()
+                self._bid_index_volumes.clear()
+                self._bid_index_quote_volumes.clear()
+                bid_it = self._bid_book.rbegin()
+                while bid_it != self._bid_book.rend():
+                    cumulative_volume += deref(bid_it).getAmount()
+                    cumulative_quote_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                    self._bid_index_prices.push_back(deref(bid_it).getPrice())
+                    self._bid_index_volumes.push_back(cumulative_volume)
+                    self._bid_index_quote_volumes.push_back(cumulative_quote_volume)
+                    inc(bid_it)
+                self._bid_depth_index_dirty = False
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -322,19 +718,32 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            if is_buy:
+                return indexed_price_for_volume(self._ask_index_prices, self._ask_index_volumes, volume)
+            return indexed_price_for_volume(self._bid_index_prices, self._bid_index_volumes, volume)
+
+        with nogil:
+            if is_buy:
+                ask_it = self._ask_book.begin()
+                while ask_it != self._ask_book.end():
+                    cumulative_volume += deref(ask_it).getAmount()
+                    if cumulative_volume >= volume:
+                        result_price = deref(ask_it).getPrice()
+                        break
+                    inc(ask_it)
+            else:
+                bid_it = self._bid_book.rbegin()
+                while bid_it != self._bid_book.rend():
+                    cumulative_volume += deref(bid_it).getAmount()
+                    if cumulative_volume >= volume:
+                        result_price = deref(bid_it).getPrice()
+                        break
+                    inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -343,30 +752,46 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            double row_price
+            double row_amount
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            if is_buy:
+                return indexed_vwap_for_volume(
+                    self._ask_index_prices, self._ask_index_volumes, self._ask_index_quote_volumes, volume)
+            return indexed_vwap_for_volume(
+                self._bid_index_prices, self._bid_index_volumes, self._bid_index_quote_volumes, volume)
+
+        with nogil:
+            if is_buy:
+                ask_it = self._ask_book.begin()
+                while ask_it != self._ask_book.end():
+                    row_price = deref(ask_it).getPrice()
+                    row_amount = deref(ask_it).getAmount()
+                    if total_volume + row_amount >= volume:
+                        total_cost += (volume - total_volume) * row_price
+                        total_volume = volume
+                        result_vwap = total_cost / total_volume
+                        break
+                    total_cost += row_amount * row_price
+                    total_volume += row_amount
+                    inc(ask_it)
+            else:
+                bid_it = self._bid_book.rbegin()
+                while bid_it != self._bid_book.rend():
+                    row_price = deref(bid_it).getPrice()
+                    row_amount = deref(bid_it).getAmount()
+                    if total_volume + row_amount >= volume:
+                        total_cost += (volume - total_volume) * row_price
+                        total_volume = volume
+                        result_vwap = total_cost / total_volume
+                        break
+                    total_cost += row_amount * row_price
+                    total_volume += row_amount
+                    inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -374,19 +799,32 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            if is_buy:
+                return indexed_price_for_volume(self._ask_index_prices, self._ask_index_quote_volumes, quote_volume)
+            return indexed_price_for_volume(self._bid_index_prices, self._bid_index_quote_volumes, quote_volume)
+
+        with nogil:
+            if is_buy:
+                ask_it = self._ask_book.begin()
+                while ask_it != self._ask_book.end():
+                    cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                    if cumulative_volume >= quote_volume:
+                        result_price = deref(ask_it).getPrice()
+                        break
+                    inc(ask_it)
+            else:
+                bid_it = self._bid_book.rbegin()
+                while bid_it != self._bid_book.rend():
+                    cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                    if cumulative_volume >= quote_volume:
+                        result_price = deref(bid_it).getPrice()
+                        break
+                    inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -395,25 +833,50 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            if is_buy:
+                cumulative_volume = indexed_quote_amount(
+                    self._ask_index_prices,
+                    self._ask_index_volumes,
+                    self._ask_index_quote_volumes,
+                    base_amount,
+                    first_level_reaching(self._ask_index_volumes, base_amount))
+            else:
+                cumulative_volume = indexed_quote_amount(
+                    self._bid_index_prices,
+                    self._bid_index_volumes,
+                    self._bid_index_quote_volumes,
+                    base_amount,
+                    first_level_reaching(self._bid_index_volumes, base_amount))
+            return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+        with nogil:
+            if is_buy:
+                ask_it = self._ask_book.begin()
+                while ask_it != self._ask_book.end():
+                    row_amount = deref(ask_it).getAmount()
+                    if row_amount + cumulative_base_amount >= base_amount:
+                        row_amount = base_amount - cumulative_base_amount
+                    cumulative_base_amount += row_amount
+                    cumulative_volume += row_amount * deref(ask_it).getPrice()
+                    if cumulative_base_amount >= base_amount:
+                        break
+                    inc(ask_it)
+            else:
+                bid_it = self._bid_book.rbegin()
+                while bid_it != self._bid_book.rend():
+                    row_amount = deref(bid_it).getAmount()
+                    if row_amount + cumulative_base_amount >= base_amount:
+                        row_amount = base_amount - cumulative_base_amount
+                    cumulative_base_amount += row_amount
+                    cumulative_volume += row_amount * deref(bid_it).getPrice()
+                    if cumulative_base_amount >= base_amount:
+                        break
+                    inc(bid_it)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -421,19 +884,32 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            if is_buy:
+                return indexed_volume_for_price(self._ask_index_prices, self._ask_index_volumes, price, is_buy)
+            return indexed_volume_for_price(self._bid_index_prices, self._bid_index_volumes, price, is_buy)
+
+        with nogil:
+            if is_buy:
+                ask_it = self._ask_book.begin()
+                while ask_it != self._ask_book.end():
+                    if deref(ask_it).getPrice() > price:
+                        break
+                    cumulative_volume += deref(ask_it).getAmount()
+                    result_price = deref(ask_it).getPrice()
+                    inc(ask_it)
+            else:
+                bid_it = self._bid_book.rbegin()
+                while bid_it != self._bid_book.rend():
+                    if deref(bid_it).getPrice() < price:
+                        break
+                    cumulative_volume += deref(bid_it).getAmount()
+                    result_price = deref(bid_it).getPrice()
+                    inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -441,19 +917,32 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            if is_buy:
+                return indexed_volume_for_price(self._ask_index_prices, self._ask_index_quote_volumes, price, is_buy)
+            return indexed_volume_for_price(self._bid_index_prices, self._bid_index_quote_volumes, price, is_buy)
+
+        with nogil:
+            if is_buy:
+                ask_it = self._ask_book.begin()
+                while ask_it != self._ask_book.end():
+                    if deref(ask_it).getPrice() > price:
+                        break
+                    cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                    result_price = deref(ask_it).getPrice()
+                    inc(ask_it)
+            else:
+                bid_it = self._bid_book.rbegin()
+                while bid_it != self._bid_book.rend():
+                    if deref(bid_it).getPrice() < price:
+                        break
+                    cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                    result_price = deref(bid_it).getPrice()
+                    inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -478,6 +967,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -12,7 +12,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +21,76 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookMessageQueue(asyncio.Queue):
+    """
+    Queue of the messages pending to be applied to a single order book. When the consumer falls behind and the queue
+    already holds `coalescing_threshold` messages, a new diff message is merged into the last queued diff instead of
+    being appended, so the queue stays bounded and the order book catches up applying fewer, larger diffs.
+    """
+
+    def __init__(self, coalescing_threshold: int):
+        super().__init__()
+        self._coalescing_threshold: int = coalescing_threshold
+        self.coalesced_messages: int = 0
+
+    def _put(self, item: OrderBookMessage):
+        if (len(self._queue) >= self._coalescing_threshold
+                and self._is_mergeable_diff(item)
+                and self._is_mergeable_diff(self._queue[-1])):
+            self._queue[-1] = self.merge_diff_messages(self._queue[-1], item)
+            self.coalesced_messages += 1
+        else:
+            self._queue.append(item)
+
+    @staticmethod
+    def _is_mergeable_diff(message: OrderBookMessage) -> bool:
+        # Subclasses of OrderBookMessage can use their own content format, only the default one is merged
+        return type(message) is OrderBookMessage and message.type is OrderBookMessageType.DIFF
+
+    @staticmethod
+    def merge_diff_messages(older: OrderBookMessage, newer: OrderBookMessage) -> OrderBookMessage:
+        """
+        Merges two consecutive diff messages into one. For price levels present in both diffs the newer amount wins.
+        """
+        content = dict(newer.content)
+        for side in ("bids", "asks"):
+            levels = {float(level[0]): level for level in older.content[side]}
+            levels.update((float(level[0]), level) for level in newer.content[side])
+            content[side] = list(levels.values())
+        if "first_update_id" in older.content:
+            content["first_update_id"] = older.content["first_update_id"]
+        return OrderBookMessage(OrderBookMessageType.DIFF, content, newer.timestamp)
+
+
+class OrderBookDiffDispatcher:
+    """
+    Used by the tracker in direct dispatch mode as the output queue of the data source diffs listener. Each diff
+    message is delivered to the queue of its order book as soon as it is parsed, without going through the shared diff
+    stream and the router coroutine.
+    """
+
+    def __init__(self, tracker: "OrderBookTracker"):
+        self._tracker = tracker
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._tracker._dispatch_diff_message(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._tracker._dispatch_diff_message(message)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Snapshot requests go through the data source and its throttler, which enforces the exchange rate limits. This only
+    # caps how many initializations are in flight at the same time.
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS: int = 10
+    ORDER_BOOK_INITIALIZATION_RETRY_INTERVAL: float = 5.0
+    # Maximum number of diff messages buffered for a trading pair while its order book is being resynchronized
+    RESYNC_BUFFER_SIZE: int = 1000
+    # Maximum number of trade messages saved for a trading pair while its order book is being initialized
+    SAVED_TRADE_MESSAGES_SIZE: int = 1000
+    # Number of pending messages in the queue of an order book from which new diffs are merged into the last queued one
+    PENDING_DIFFS_COALESCING_THRESHOLD: int = 100
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +99,24 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 direct_diff_dispatch: bool = False):
+        """
+        :param data_source: the data source providing the order book messages
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if the connector supports several
+        :param direct_diff_dispatch: if True the data source delivers the diff messages directly to the queue of each
+            order book instead of the shared diff stream processed by the router coroutine
+        """
         self._domain: Optional[str] = domain
+        self._direct_diff_dispatch: bool = direct_diff_dispatch
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +126,17 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._saved_snapshot_messages: Dict[str, OrderBookMessage] = {}
+        self._saved_trade_messages: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.SAVED_TRADE_MESSAGES_SIZE))
+        self._last_diff_message_timestamp: float = time.time()
+        self._diff_messages_queued: int = 0
+        self._diff_messages_accepted: int = 0
+        self._diff_messages_rejected: int = 0
+        self._resync_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._sequence_gaps_count: Dict[str, int] = defaultdict(int)
+        self._resyncs_count: Dict[str, int] = defaultdict(int)
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +160,34 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_pairs(self) -> List[str]:
+        """
+        Returns the trading pairs whose order book has already been initialized and is being tracked
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_trading_pair_ready(trading_pair)]
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        ready_event = self._order_book_ready_events.get(trading_pair)
+        return ready_event is not None and ready_event.is_set()
+
+    @property
+    def order_book_sync_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns, for each trading pair, the number of gaps detected in the diff messages sequence, the number of
+        completed resynchronizations, the number of diffs currently buffered waiting for a resynchronization and the
+        number of diffs merged into other pending diffs because the order book was falling behind
+        """
+        return {
+            trading_pair: {
+                "sequence_gaps": self._sequence_gaps_count[trading_pair],
+                "resyncs": self._resyncs_count[trading_pair],
+                "buffered_diffs": len(self._resync_buffers.get(trading_pair, ())),
+                "coalesced_diffs": getattr(self._tracking_message_queues.get(trading_pair), "coalesced_messages", 0),
+            }
+            for trading_pair in self._trading_pairs
+        }
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -83,8 +203,9 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        diff_output = OrderBookDiffDispatcher(self) if self._direct_diff_dispatch else self._order_book_diff_stream
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
@@ -95,9 +216,10 @@ class OrderBookTracker:
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
+        if not self._direct_diff_dispatch:
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
@@ -137,10 +259,27 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_buffers.clear()
+        self._saved_snapshot_messages.clear()
+        self._saved_trade_messages.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
-    async def wait_ready(self):
-        await self._order_books_initialized.wait()
+    async def wait_ready(self, trading_pair: Optional[str] = None):
+        """
+        Waits until the order book of the given trading pair is initialized, or until all order books are initialized
+        if no trading pair is specified.
+
+        :param trading_pair: the trading pair to wait for
+        """
+        if trading_pair is None:
+            await self._order_books_initialized.wait()
+        else:
+            await self._order_book_ready_events[trading_pair].wait()
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -174,56 +313,57 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books concurrently. Each order book starts being tracked as soon as its own snapshot is
+        available, without waiting for the rest of the trading pairs.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS)
+        await safe_gather(*[self._init_order_book(trading_pair, semaphore) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore):
+        while True:
+            try:
+                async with semaphore:
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                    f"Retrying after {self.ORDER_BOOK_INITIALIZATION_RETRY_INTERVAL:.0f} seconds."
+                )
+                await self._sleep(delay=self.ORDER_BOOK_INITIALIZATION_RETRY_INTERVAL)
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = OrderBookMessageQueue(self.PENDING_DIFFS_COALESCING_THRESHOLD)
+        self._process_saved_snapshot_and_trade_messages(trading_pair, order_book)
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._order_books)}/{len(self._trading_pairs)} completed.")
+
+    def _process_saved_snapshot_and_trade_messages(self, trading_pair: str, order_book: OrderBook):
+        """
+        Processes the snapshot and trade messages received before the order book was initialized. The snapshot is only
+        applied if it is more recent than the one the order book was initialized with.
+        """
+        snapshot_message = self._saved_snapshot_messages.pop(trading_pair, None)
+        if snapshot_message is not None and snapshot_message.update_id > order_book.snapshot_uid:
+            self._tracking_message_queues[trading_pair].put_nowait(snapshot_message)
+        saved_trade_messages = self._saved_trade_messages.pop(trading_pair, ())
+        for trade_message in saved_trade_messages:
+            self._apply_trade_message(order_book, trade_message)
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
         """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, "
-                                        f"rejected: {messages_rejected}, queued: {messages_queued}")
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
-
-                last_message_timestamp = now
+                self._dispatch_diff_message(ob_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -234,16 +374,47 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _dispatch_diff_message(self, ob_message: OrderBookMessage):
+        """
+        Delivers a diff message to the queue of its order book. Messages received before the order book is initialized
+        are saved to be processed after the snapshot, and messages older than the snapshot are discarded.
+        """
+        trading_pair: str = ob_message.trading_pair
+
+        if trading_pair not in self._tracking_message_queues:
+            self._diff_messages_queued += 1
+            # Save diff messages received before snapshots are ready
+            self._saved_message_queues[trading_pair].append(ob_message)
+        # Check the order book's initial update ID. If it's larger, don't bother.
+        elif self._order_books[trading_pair].snapshot_uid > ob_message.update_id:
+            self._diff_messages_rejected += 1
+        else:
+            self._tracking_message_queues[trading_pair].put_nowait(ob_message)
+            self._diff_messages_accepted += 1
+
+        # Log some statistics.
+        now: float = time.time()
+        if int(now / 60.0) > int(self._last_diff_message_timestamp / 60.0):
+            self.logger().debug(f"Diff messages processed: {self._diff_messages_accepted}, "
+                                f"rejected: {self._diff_messages_rejected}, queued: {self._diff_messages_queued}")
+            self._diff_messages_accepted = 0
+            self._diff_messages_rejected = 0
+            self._diff_messages_queued = 0
+        self._last_diff_message_timestamp = now
+
     async def _order_book_snapshot_router(self):
         """
         Route the real-time order book snapshot messages to the correct order book.
+        The last message of each trading pair whose order book is not initialized yet is saved to be processed after
+        the initialization.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
+                    if trading_pair in self._trading_pairs:
+                        self._saved_snapshot_messages[trading_pair] = ob_message
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 await message_queue.put(ob_message)
@@ -272,7 +443,13 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if trading_pair in self._resync_buffers:
+                        self._resync_buffers[trading_pair].append(message)
+                        continue
+                    if self._is_sequence_gap(order_book, message):
+                        self._start_resync(trading_pair, order_book, message)
+                        continue
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -283,8 +460,11 @@ class OrderBookTracker:
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if trading_pair in self._resync_buffers:
+                        self._complete_resync(trading_pair, order_book, message)
+                    else:
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,39 +475,100 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _is_sequence_gap(order_book: OrderBook, message: OrderBookMessage) -> bool:
+        """
+        Checks if there are missing updates between the last update applied to the order book and the diff message.
+        Only diff messages that include their first update ID can be checked.
+        """
+        if "first_update_id" not in message.content:
+            return False
+        last_update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        return message.first_update_id > last_update_id + 1
+
+    @staticmethod
+    def _snapshot_covers_diffs(snapshot: OrderBookMessage, diffs: List[OrderBookMessage]) -> bool:
+        """
+        Checks that there are no missing updates between the snapshot and the first diff to replay on top of it
+        """
+        for diff in diffs:
+            if diff.update_id > snapshot.update_id:
+                return "first_update_id" not in diff.content or diff.first_update_id <= snapshot.update_id + 1
+        return True
+
+    def _start_resync(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage):
+        self._sequence_gaps_count[trading_pair] += 1
+        self.logger().warning(
+            f"Gap detected in the order book diffs for {trading_pair} (last update ID "
+            f"{max(order_book.snapshot_uid, order_book.last_diff_uid)}, received diff from update ID "
+            f"{message.first_update_id}). Resynchronizing the order book."
+        )
+        self._resync_buffers[trading_pair] = deque([message], maxlen=self.RESYNC_BUFFER_SIZE)
+        self._resync_tasks[trading_pair] = safe_ensure_future(self._request_resync_snapshot(trading_pair))
+
+    def _complete_resync(self, trading_pair: str, order_book: OrderBook, snapshot: OrderBookMessage):
+        buffered_diffs: List[OrderBookMessage] = list(self._resync_buffers[trading_pair])
+        if not self._snapshot_covers_diffs(snapshot, buffered_diffs):
+            # The snapshot is older than the buffered diffs, a newer one is required
+            resync_task = self._resync_tasks.get(trading_pair)
+            if resync_task is None or resync_task.done():
+                self._resync_tasks[trading_pair] = safe_ensure_future(self._request_resync_snapshot(trading_pair))
+            return
+        replay_diffs = [diff for diff in buffered_diffs if diff.update_id > snapshot.update_id]
+        order_book.restore_from_snapshot_and_diffs(snapshot, replay_diffs)
+        self._past_diffs_windows[trading_pair].extend(replay_diffs)
+        del self._resync_buffers[trading_pair]
+        resync_task = self._resync_tasks.pop(trading_pair, None)
+        if resync_task is not None and not resync_task.done():
+            resync_task.cancel()
+        self._resyncs_count[trading_pair] += 1
+        self.logger().info(f"Order book for {trading_pair} resynchronized.")
+
+    async def _request_resync_snapshot(self, trading_pair: str):
+        while True:
+            try:
+                snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error fetching order book snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error fetching order book snapshot for {trading_pair}. "
+                                    f"Retrying after {self.ORDER_BOOK_INITIALIZATION_RETRY_INTERVAL:.0f} seconds."
+                )
+                await self._sleep(delay=self.ORDER_BOOK_INITIALIZATION_RETRY_INTERVAL)
+        await self._tracking_message_queues[trading_pair].put(snapshot)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
+        messages_queued: int = 0
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
                 trading_pair: str = trade_message.trading_pair
 
-                if trading_pair not in self._order_books:
+                if trading_pair in self._order_books:
+                    self._apply_trade_message(self._order_books[trading_pair], trade_message)
+                    messages_accepted += 1
+                elif trading_pair in self._trading_pairs:
+                    # Save trade messages received before the order book is initialized
+                    self._saved_trade_messages[trading_pair].append(trade_message)
+                    messages_queued += 1
+                else:
                     messages_rejected += 1
-                    continue
-
-                order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    trade_id=trade_message.trade_id,
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
-
-                messages_accepted += 1
 
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Trade messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    self.logger().debug(f"Trade messages processed: {messages_accepted}, rejected: {messages_rejected}"
+                                        f", queued: {messages_queued}")
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -340,6 +581,18 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _apply_trade_message(order_book: OrderBook, trade_message: OrderBookMessage):
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=trade_message.trading_pair,
+            timestamp=trade_message.timestamp,
+            price=float(trade_message.content["price"]),
+            amount=float(trade_message.content["amount"]),
+            trade_id=trade_message.trade_id,
+            type=TradeType.SELL if
+            trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+        ))
+
     @staticmethod
     async def _sleep(delay: float):
         await asyncio.sleep(delay=delay)
@@ -64,9 +64,20 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_snapshot_message(snapshot_msg)
         return order_book
 
+    async def get_order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Requests the current order book snapshot for a particular trading pair. Used by the order book tracker to
+        resynchronize an order book when a gap is detected in the diff messages sequence
+
+        :param trading_pair: the trading pair for which the order book snapshot has to be retrieved
+
+        :return: a snapshot message with the current content of the order book in the exchange
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
@@ -230,17 +241,19 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         pass
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
-        async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None:  # data will be None when the websocket is disconnected
-                channel: str = self._channel_originating_message(event_message=data)
-                valid_channels = self._get_messages_queue_keys()
-                if channel in valid_channels:
-                    self._message_queue[channel].put_nowait(data)
-                else:
-                    await self._process_message_for_unknown_channel(
-                        event_message=data, websocket_assistant=websocket_assistant
-                    )
+        valid_channels = self._get_messages_queue_keys()
+        # The messages already received are processed together, without waiting for the websocket between them
+        async for ws_responses in websocket_assistant.iter_message_batches():
+            for ws_response in ws_responses:
+                data: Dict[str, Any] = ws_response.data
+                if data is not None:  # data will be None when the websocket is disconnected
+                    channel: str = self._channel_originating_message(event_message=data)
+                    if channel in valid_channels:
+                        self._message_queue[channel].put_nowait(data)
+                    else:
+                        await self._process_message_for_unknown_channel(
+                            event_message=data, websocket_assistant=websocket_assistant
+                        )
 
     def _get_messages_queue_keys(self) -> List[str]:
         return [self._snapshot_messages_queue_key, self._diff_messages_queue_key, self._trade_messages_queue_key]
@@ -37,6 +37,8 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    BestBidAskChanged = 902
+    DepthChanged = 903
     OrderBookDataSourceUpdateEvent = 904
 
 
@@ -156,6 +158,17 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookBestBidAskChangedEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+    update_id: int
+
+
+class OrderBookDepthChangedEvent(NamedTuple):
+    levels: int
+    update_id: int
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
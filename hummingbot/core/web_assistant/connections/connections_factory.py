@@ -2,6 +2,7 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig, WSCompression
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -16,24 +17,47 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    The factory keeps two pools of connections. The shared pool is used by the WebSocket connections and the REST
+    requests in general, while the priority pool is reserved to the REST requests executed with
+    `RequestPriority.HIGH` (orders placement and cancelation). The keep alive timeout of the priority pool is kept
+    below the idle timeout of the exchanges servers and load balancers, so an order is not sent through a connection
+    already closed by the server. The connectors keep it warm with a periodic request (see `ExchangePyBase`).
     """
 
-    def __init__(self):
+    DEFAULT_POOL_CONFIG = ConnectionPoolConfig()
+    DEFAULT_PRIORITY_POOL_CONFIG = ConnectionPoolConfig(limit=20, limit_per_host=10, keepalive_timeout=15)
+
+    def __init__(
+        self,
+        pool_config: Optional[ConnectionPoolConfig] = None,
+        priority_pool_config: Optional[ConnectionPoolConfig] = None,
+    ):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
+        self._pool_config = pool_config or self.DEFAULT_POOL_CONFIG
+        self._priority_pool_config = priority_pool_config or self.DEFAULT_PRIORITY_POOL_CONFIG
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._priority_client: Optional[aiohttp.ClientSession] = None
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        priority_client = await self._get_priority_client()
+        connection = RESTConnection(aiohttp_client_session=shared_client, priority_client_session=priority_client)
         return connection
 
-    async def get_ws_connection(self) -> WSConnection:
+    async def get_ws_connection(self, compression: Optional[WSCompression] = None) -> WSConnection:
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client, compression=compression)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        self._shared_client = self._shared_client or aiohttp.ClientSession(
+            connector=self._pool_config.create_connector())
         return self._shared_client
+
+    async def _get_priority_client(self) -> aiohttp.ClientSession:
+        self._priority_client = self._priority_client or aiohttp.ClientSession(
+            connector=self._priority_pool_config.create_connector())
+        return self._priority_client
@@ -4,7 +4,8 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import aiohttp
-import ujson
+
+from hummingbot.core.web_assistant.connections import json_codec
 
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
@@ -73,7 +74,7 @@ class EndpointRESTRequest(RESTRequest, ABC):
     def _ensure_data(self):
         if self.method == RESTMethod.POST:
             if self.data is not None:
-                self.data = ujson.dumps(self.data)
+                self.data = json_codec.dumps(self.data)
         elif self.data is not None:
             raise ValueError(
                 "The `data` field should be used only for POST requests. Use `params` instead."
@@ -111,13 +112,45 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=json_codec.loads)
         return json_
 
     async def text(self) -> str:
         text_ = await self._aiohttp_response.text()
         return text_
 
+    async def read(self) -> bytes:
+        body = await self._aiohttp_response.read()
+        return body
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    """Settings of the `aiohttp.TCPConnector` of a pool of HTTP connections.
+
+    `limit` and `limit_per_host` are the maximum number of simultaneous connections (0 means no limit). Idle
+    connections are kept open for `keepalive_timeout` seconds, and resolved host names are cached for `ttl_dns_cache`
+    seconds (None caches them forever). aiohttp always enables TCP_NODELAY on its sockets.
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 30
+    ttl_dns_cache: Optional[int] = 300
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+
+class WSCompression(Enum):
+    """Compression of the payload of the binary WebSocket frames"""
+    GZIP = "gzip"
+    DEFLATE = "deflate"  # raw deflate stream, without zlib header
+
 
 class WSRequest(ABC):
     @abstractmethod
@@ -0,0 +1,19 @@
+"""
+JSON encoding and decoding used by the web assistants for request bodies, REST responses and WebSocket messages.
+
+`ujson` (a hummingbot dependency) is several times faster than the standard library `json` module and encodes the same
+values the same way (numpy floats, NaN and infinity, integers of any size, non ASCII text escaped), only without the
+whitespace between items. Decoding errors are raised as `ValueError` subclasses.
+"""
+
+from typing import Any, Union
+
+import ujson
+
+
+def dumps(obj: Any) -> str:
+    return ujson.dumps(obj, escape_forward_slashes=False)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    return ujson.loads(data)
@@ -1,13 +1,25 @@
+from typing import Optional
+
 import aiohttp
+
+from hummingbot.core.api_throttler.async_throttler_base import current_request_priority
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
 
 
 class RESTConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(
+        self,
+        aiohttp_client_session: aiohttp.ClientSession,
+        priority_client_session: Optional[aiohttp.ClientSession] = None,
+    ):
         self._client_session = aiohttp_client_session
+        # Requests executed with high priority (orders placement and cancelation) use their own pool of connections,
+        # so they do not wait for a connection used by the polling requests
+        self._priority_client_session = priority_client_session
 
     async def call(self, request: RESTRequest) -> RESTResponse:
-        aiohttp_resp = await self._client_session.request(
+        aiohttp_resp = await self._client_session_for_request().request(
             method=request.method.value,
             url=request.url,
             params=request.params,
@@ -18,6 +30,11 @@ class RESTConnection:
         resp = await self._build_resp(aiohttp_resp)
         return resp
 
+    def _client_session_for_request(self) -> aiohttp.ClientSession:
+        if self._priority_client_session is not None and current_request_priority() == RequestPriority.HIGH:
+            return self._priority_client_session
+        return self._client_session
+
     @staticmethod
     async def _build_resp(aiohttp_resp: aiohttp.ClientResponse) -> RESTResponse:
         resp = RESTResponse(aiohttp_resp)
@@ -1,16 +1,39 @@
 import asyncio
+import logging
 import time
-from json import JSONDecodeError
-from typing import Any, Dict, Mapping, Optional
+import zlib
+from typing import Any, Dict, List, Mapping, Optional
 
 import aiohttp
+from aiohttp.streams import DataQueue
 
-from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections import json_codec
+from hummingbot.core.web_assistant.connections.data_types import WSCompression, WSRequest, WSResponse
+
+DATA_MESSAGE_TYPES = (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY)
+DECOMPRESSION_WBITS = {
+    WSCompression.GZIP: 16 + zlib.MAX_WBITS,
+    WSCompression.DEFLATE: -zlib.MAX_WBITS,
+}
+# aiohttp does not expose the messages received and not read yet. The versions listed here keep them in the DataQueue
+# of the private `_reader` attribute of the WebSocket response, which `receive_batch` uses to size the batches.
+# test_ws_connection checks it against a real WebSocket server, update the list when aiohttp is upgraded.
+BUFFERED_MESSAGES_AIOHTTP_VERSIONS = ("3.8.", "3.9.")
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    _logger = None
+    _unsupported_aiohttp_version_logged = False
+
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, compression: Optional[WSCompression] = None):
         self._client_session = aiohttp_client_session
+        self._compression = compression
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -65,6 +88,24 @@ class WSConnection:
                 break
         return response
 
+    async def receive_batch(self, max_batch_size: int = 100) -> List[WSResponse]:
+        """
+        Waits for the next message and returns it together with the messages already received and buffered by
+        aiohttp, up to `max_batch_size` messages. The buffered messages are read without suspending the task.
+        The list is empty if the connection is disconnected while waiting for the first message.
+        With an aiohttp version not in `BUFFERED_MESSAGES_AIOHTTP_VERSIONS` each batch has a single message.
+        """
+        self._ensure_connected()
+        responses = []
+        while (self._connected
+               and len(responses) < max_batch_size
+               and (len(responses) == 0 or self._buffered_messages_count() > 0)):
+            msg = await self._read_message()
+            msg = await self._process_message(msg)
+            if msg is not None:
+                responses.append(self._build_resp(msg))
+        return responses
+
     def _ensure_not_connected(self):
         if self._connected:
             raise RuntimeError("WS is connected.")
@@ -80,8 +121,18 @@ class WSConnection:
             raise asyncio.TimeoutError("Message receive timed out.")
         return msg
 
+    def _buffered_messages_count(self) -> int:
+        if not aiohttp.__version__.startswith(BUFFERED_MESSAGES_AIOHTTP_VERSIONS):
+            if not WSConnection._unsupported_aiohttp_version_logged:
+                WSConnection._unsupported_aiohttp_version_logged = True
+                self.logger().warning(f"The WebSocket messages are not read in batches with aiohttp {aiohttp.__version__}.")
+            return 0
+        reader = getattr(self._connection, "_reader", None)
+        return len(reader) if isinstance(reader, DataQueue) else 0
+
     async def _process_message(self, msg: aiohttp.WSMessage) -> Optional[aiohttp.WSMessage]:
-        msg = await self._check_msg_types(msg)
+        if msg.type not in DATA_MESSAGE_TYPES:
+            msg = await self._check_msg_types(msg)
         self._update_last_recv_time(msg)
         return msg
 
@@ -117,19 +168,29 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        await self._connection.send_json(payload, dumps=json_codec.dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
-            data = msg.data
-        else:
-            try:
-                data = msg.json()
-            except JSONDecodeError:
+            if self._compression is None:
                 data = msg.data
+            else:
+                data = self._decode_json(self._decompress(msg.data))
+        else:
+            data = self._decode_json(msg.data)
         response = WSResponse(data)
         return response
+
+    def _decompress(self, payload: bytes) -> str:
+        return zlib.decompress(payload, DECOMPRESSION_WBITS[self._compression]).decode("utf-8")
+
+    @staticmethod
+    def _decode_json(text: str) -> Any:
+        try:
+            data = json_codec.loads(text)
+        except ValueError:
+            data = text
+        return data
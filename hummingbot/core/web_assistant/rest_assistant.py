@@ -1,14 +1,18 @@
-import json
 from asyncio import wait_for
-from copy import deepcopy
+from copy import copy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections import json_codec
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
+
+# HTTP statuses used by the exchanges to reject requests exceeding the rate limits
+RATE_LIMIT_REJECTION_STATUSES = (418, 429)
 
 
 class RESTAssistant:
@@ -17,6 +21,9 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    When a `RESTRequestCoalescer` is provided, the unauthenticated GET requests sent with `execute_request` and
+    `execute_request_and_get_response` share a single network call with the identical requests already in flight.
     """
     def __init__(
         self,
@@ -25,12 +32,14 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        request_coalescer: Optional[RESTRequestCoalescer] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._request_coalescer = request_coalescer
 
     async def execute_request(
         self,
@@ -78,37 +87,73 @@ class RESTAssistant:
 
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = json_codec.dumps(data) if data is not None else data
 
         request = RESTRequest(
             method=method,
             url=url,
-            params=params,
+            params=dict(params) if params is not None else params,
             data=data,
             headers=local_headers,
             is_auth_required=is_auth_required,
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
-
-            if 400 <= response.status:
-                if not return_err:
-                    error_response = await response.text()
-                    error_text = "N/A" if "<html" in error_response else error_response
-                    raise IOError(f"Error executing request {method.name} {url}. HTTP status is {response.status}. "
-                                  f"Error: {error_text}")
-            return response
+        if self._request_coalescer is not None and method == RESTMethod.GET and not is_auth_required:
+            response = await self._request_coalescer.execute(
+                key=self._request_coalescer.request_key(request),
+                request_function=lambda: self._execute_shared_request(request=request, timeout=timeout))
+        else:
+            response = await self._execute_request(request=request, timeout=timeout)
+
+        if 400 <= response.status:
+            if not return_err:
+                error_response = await response.text()
+                error_text = "N/A" if "<html" in error_response else error_response
+                raise IOError(f"Error executing request {method.name} {url}. HTTP status is {response.status}. "
+                              f"Error: {error_text}")
+        return response
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
+        request = self._copy_request(request)
+        return await self._call(request=request, timeout=timeout)
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
         resp = await self._post_process_response(resp)
         return resp
 
+    async def _execute_request(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        async with self._throttler.execute_task(limit_id=request.throttler_limit_id):
+            # The request is built by the assistant, so it can be processed without copying it
+            response = await self._call(request=request, timeout=timeout)
+            if response.status in RATE_LIMIT_REJECTION_STATUSES:
+                self._throttler.record_rate_limit_rejection(request.throttler_limit_id)
+        return response
+
+    async def _execute_shared_request(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        response = await self._execute_request(request=request, timeout=timeout)
+        # The body is read before sharing the response, so every caller can decode it
+        await response.read()
+        return response
+
+    @staticmethod
+    def _copy_request(request: RESTRequest) -> RESTRequest:
+        """
+        Copies the request so the pre-processors and the authenticator do not modify the caller's instance. They
+        replace or update the top level fields, so only the params, data and headers dictionaries are copied.
+        """
+        request = copy(request)
+        if isinstance(request.params, dict):
+            request.params = dict(request.params)
+        if isinstance(request.data, dict):
+            request.data = dict(request.data)
+        if isinstance(request.headers, dict):
+            request.headers = dict(request.headers)
+        return request
+
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
         for pre_processor in self._rest_pre_processors:
             request = await pre_processor.pre_process(request)
@@ -1,5 +1,7 @@
 import abc
+from typing import Dict
 
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.connections.data_types import RESTResponse
 
 
@@ -13,3 +15,32 @@ class RESTPostProcessorBase(abc.ABC):
     @abc.abstractmethod
     async def post_process(self, response: RESTResponse) -> RESTResponse:
         ...
+
+
+class RateLimitUsageRESTPostProcessor(RESTPostProcessorBase):
+    """Feeds the rate limit usage reported by the server in the response headers back into the throttler.
+
+    The server counts the requests of all the clients sharing the API key or IP, so the local accounting of the
+    throttler is raised to the reported usage when it is lower.
+    """
+
+    def __init__(self, throttler: AsyncThrottlerBase, limit_ids_by_header: Dict[str, str]):
+        """
+        :param throttler: the throttler of the connector
+        :param limit_ids_by_header: the limit_id updated with each usage header (e.g. X-MBX-USED-WEIGHT-1M)
+        """
+        self._throttler = throttler
+        self._limit_ids_by_header = limit_ids_by_header
+
+    async def post_process(self, response: RESTResponse) -> RESTResponse:
+        headers = response.headers or {}
+        for header, limit_id in self._limit_ids_by_header.items():
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                capacity_used = float(value)
+            except (TypeError, ValueError):
+                continue
+            self._throttler.update_capacity_used(limit_id=limit_id, capacity_used=capacity_used)
+        return response
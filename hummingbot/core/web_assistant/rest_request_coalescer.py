@@ -0,0 +1,63 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+
+from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
+
+
+class RESTRequestCoalescer:
+    """Shares the response of a REST request with the identical requests issued while it is in flight.
+
+    The first request for a key is executed in its own task, and every caller awaits that task. A caller being
+    cancelled does not cancel the request for the other callers. When `ttl` is greater than zero the successful
+    responses are also reused for `ttl` seconds after they are received.
+
+    The responses are shared with their body already read, so each caller decoding the JSON content gets its own
+    objects.
+    """
+
+    def __init__(self, ttl: float = 0):
+        self._ttl = ttl
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._cached_responses: Dict[Hashable, Tuple[float, RESTResponse]] = {}
+
+    @staticmethod
+    def request_key(request: RESTRequest) -> Hashable:
+        params = tuple(sorted((key, str(value)) for key, value in (request.params or {}).items()))
+        headers = tuple(sorted((key, str(value)) for key, value in (request.headers or {}).items()))
+        return request.method, request.url, params, headers
+
+    async def execute(self, key: Hashable, request_function: Callable[[], Awaitable[RESTResponse]]) -> RESTResponse:
+        """
+        Returns the response of the request identified by the key, executing `request_function` only if the same
+        request is not already in flight or cached
+        :param key: the request identifier (see `request_key`)
+        :param request_function: the function executing the request, returning a response with its body already read
+        """
+        cached_response = self._cached_responses.get(key)
+        if cached_response is not None:
+            expiration, response = cached_response
+            if self._time() < expiration:
+                return response
+            del self._cached_responses[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(key=key, request_function=request_function))
+            # The exception is retrieved to avoid the asyncio warning when all the callers were cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def _execute(self, key: Hashable, request_function: Callable[[], Awaitable[RESTResponse]]) -> RESTResponse:
+        try:
+            response = await request_function()
+            if self._ttl > 0 and response.status < 400:
+                self._cached_responses[key] = (self._time() + self._ttl, response)
+            return response
+        finally:
+            del self._in_flight[key]
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
@@ -66,6 +66,16 @@ class WSAssistant:
                 response = await self._post_process_response(response)
                 yield response
 
+    async def iter_message_batches(self, max_batch_size: int = 100) -> AsyncGenerator[List[WSResponse], None]:
+        """
+        Yields lists with the messages received since the previous iteration (see `WSConnection.receive_batch`).
+        Will stop if `WSDelegate.disconnect()` is called while waiting for a response.
+        """
+        while self._connection.connected:
+            responses = await self._connection.receive_batch(max_batch_size=max_batch_size)
+            if responses:
+                yield [await self._post_process_response(response) for response in responses]
+
     async def receive(self) -> Optional[WSResponse]:
         """This method will return `None` if `WSDelegate.disconnect()` is called while waiting for a response."""
         response = await self._connection.receive()
@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -25,6 +25,25 @@ class MarketDataProvider:
         all_candles_feeds_running = all(feed.ready for feed in self.candles_feeds.values())
         return all_connectors_running and all_candles_feeds_running
 
+    def markets_ready(self, markets: Dict[str, Set[str]], candles_configs: Optional[List[CandlesConfig]] = None) -> bool:
+        """
+        Checks if the given trading pairs and candles feeds are ready, regardless of the state of the rest of the
+        markets. Used to start operating on some markets while the others are still being initialized.
+        :param markets: Dictionary of connector names and their trading pairs
+        :param candles_configs: List of CandlesConfig of the candles feeds that have to be ready
+        :return: True if all the markets and candles feeds are ready
+        """
+        for connector_name, trading_pairs in markets.items():
+            connector = self.connectors.get(connector_name)
+            if connector is None or not all(connector.is_trading_pair_ready(trading_pair)
+                                            for trading_pair in trading_pairs):
+                return False
+        for config in candles_configs or []:
+            candles_feed = self.candles_feeds.get(self._generate_candle_feed_key(config))
+            if candles_feed is None or not candles_feed.ready:
+                return False
+        return True
+
     def initialize_candles_feed(self, config: CandlesConfig):
         """
         Initializes a candle feed based on the given configuration.
@@ -28,10 +28,13 @@ class Migrator:
         original_db_name = Path(original_db_path).stem
         backup_db_path = original_db_path + '.backup_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S")
         new_db_path = original_db_path + '.new'
+        if db_handle.engine.dialect.name == "sqlite":
+            # Move the transactions still in the WAL journal to the database file before copying it
+            db_handle.engine.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        db_handle.engine.dispose()
         copyfile(original_db_path, new_db_path)
         copyfile(original_db_path, backup_db_path)
 
-        db_handle.engine.dispose()
         new_db_handle = SQLConnectionManager(
             client_config_map, SQLConnectionType.TRADE_FILLS, new_db_path, original_db_name, True
         )
@@ -57,7 +60,9 @@ class Migrator:
                 new_db_handle.engine.dispose()
                 if migration_successful:
                     move(new_db_path, original_db_path)
-                db_handle.__init__(SQLConnectionType.TRADE_FILLS, original_db_path, original_db_name, True)
+                db_handle.__init__(
+                    client_config_map, SQLConnectionType.TRADE_FILLS, original_db_path, original_db_name, True
+                )
             except Exception as e:
                 logging.getLogger().error(f"Fatal error migrating DB {original_db_path}")
                 raise e
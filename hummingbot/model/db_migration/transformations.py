@@ -2,7 +2,10 @@ from sqlalchemy import Column, Integer, Text
 
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.executors import Executors
+from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
 
 
 class AddExchangeOrderIdColumnToOrders(DatabaseTransformation):
@@ -149,3 +152,34 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class AddQueryPatternIndexes(DatabaseTransformation):
+    """
+    Adds the indexes used by the queries filtering orders by config file and market, trade fills by order and
+    timestamp, and executors by controller. The tables created after the indexes were added to the models already have
+    them, so only the missing indexes are created.
+    """
+    indexes = {
+        Order: ["o_config_market_timestamp_index"],
+        TradeFill: ["tf_order_id_index", "tf_timestamp_index"],
+        Executors: ["ex_controller_id"],
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        for model, index_names in self.indexes.items():
+            for index in model.__table__.indexes:
+                if index.name in index_names:
+                    index.create(bind=db_handle.engine, checkfirst=True)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddQueryPatternIndexes"
+
+    @property
+    def to_version(self):
+        return 20240415
@@ -0,0 +1,159 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+AfterCommitCallback = Callable[[], None]
+WriteOperation = Callable[[Session], Optional[AfterCommitCallback]]
+
+
+class SQLWriteBehindQueue:
+    """
+    Executes database write operations in a dedicated writer thread, grouping the pending operations in batches that
+    are committed in a single transaction.
+
+    Each operation receives the session of the batch and can return a callback, that is executed after the batch is
+    committed (for side effects that must not be repeated if the transaction is rolled back). When a batch fails its
+    operations are retried individually, so a single failing operation does not discard the others.
+
+    The queue is bounded: adding an operation when it is full blocks the caller until the writer makes room for it.
+    `on_batch_written` is called by the writer thread after each batch, once the callbacks of its operations are done.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    DEFAULT_MAX_SIZE = 10000
+    DEFAULT_MAX_BATCH_SIZE = 500
+
+    _STOP = object()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql_manager: SQLConnectionManager,
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 on_batch_written: Optional[Callable[[], None]] = None):
+        self._sql_manager = sql_manager
+        self._max_batch_size = max_batch_size
+        self._on_batch_written = on_batch_written
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._enqueue_times: Deque[float] = deque()
+        self._enqueue_times_lock = threading.Lock()
+        self._writer_thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    @property
+    def pending_operations(self) -> int:
+        """
+        The number of operations added to the queue and not committed yet
+        """
+        return len(self._enqueue_times)
+
+    @property
+    def lag(self) -> float:
+        """
+        The time in seconds the oldest operation not committed yet has been waiting (0 if there are none)
+        """
+        with self._enqueue_times_lock:
+            oldest_enqueue_time = self._enqueue_times[0] if self._enqueue_times else None
+        return 0 if oldest_enqueue_time is None else self._time() - oldest_enqueue_time
+
+    def start(self):
+        if not self.is_running:
+            self._writer_thread = threading.Thread(target=self._write_loop, name="SQLWriteBehindQueue", daemon=True)
+            self._writer_thread.start()
+
+    def stop(self):
+        """
+        Stops the writer thread after all the pending operations are written to the database
+        """
+        if self.is_running:
+            self._queue.put(self._STOP)
+            self._writer_thread.join()
+        self._writer_thread = None
+
+    def put(self, operation: WriteOperation):
+        """
+        Adds a write operation to the queue, blocking while the queue is full
+        :param operation: function receiving the batch session and optionally returning an after commit callback
+        """
+        if self._queue.full():
+            self.logger().warning(f"The database write queue is full ({self.pending_operations} pending operations, "
+                                  f"lag {self.lag:.3f} seconds). Waiting for the writer.")
+        with self._enqueue_times_lock:
+            self._enqueue_times.append(self._time())
+        self._queue.put(operation)
+
+    def flush(self):
+        """
+        Blocks until all the operations added to the queue are written to the database
+        """
+        self._queue.join()
+
+    def _write_loop(self):
+        stop_requested = False
+        while not stop_requested:
+            items = [self._queue.get()]
+            while len(items) < self._max_batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            operations = [item for item in items if item is not self._STOP]
+            stop_requested = len(operations) < len(items)
+
+            if len(operations) > 0:
+                self._write_batch(operations)
+                with self._enqueue_times_lock:
+                    for _ in operations:
+                        self._enqueue_times.popleft()
+            for _ in items:
+                self._queue.task_done()
+
+    def _write_batch(self, operations: List[WriteOperation]):
+        try:
+            callbacks = self._execute(operations)
+        except Exception:
+            self.logger().warning(f"Error writing a batch of {len(operations)} operations to the database. "
+                                  f"Retrying them individually.", exc_info=True)
+            callbacks = []
+            for operation in operations:
+                try:
+                    callbacks.extend(self._execute([operation]))
+                except Exception:
+                    self.logger().error("Unexpected error writing to the database.", exc_info=True)
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                self.logger().error("Unexpected error executing a database write callback.", exc_info=True)
+        if self._on_batch_written is not None:
+            try:
+                self._on_batch_written()
+            except Exception:
+                self.logger().error("Unexpected error executing the batch written callback.", exc_info=True)
+
+    def _execute(self, operations: List[WriteOperation]) -> List[AfterCommitCallback]:
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                callbacks = [operation(session) for operation in operations]
+        return [callback for callback in callbacks if callback is not None]
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
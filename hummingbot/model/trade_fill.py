@@ -20,7 +20,11 @@ class TradeFill(HummingbotBase):
                       Index("tf_market_base_asset_timestamp_index",
                             "market", "base_asset", "timestamp"),
                       Index("tf_market_quote_asset_timestamp_index",
-                            "market", "quote_asset", "timestamp")
+                            "market", "quote_asset", "timestamp"),
+                      Index("tf_order_id_index",
+                            "order_id"),
+                      Index("tf_timestamp_index",
+                            "timestamp")
                       )
 
     config_file_path = Column(Text, nullable=False)
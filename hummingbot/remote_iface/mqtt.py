@@ -2,6 +2,7 @@
 
 import asyncio
 import functools
+import json
 import logging
 import threading
 import time
@@ -578,6 +579,7 @@ class MQTTGateway(Node):
     _INTERVAL_HEALTH_CHECK = 1.0
     _INTERVAL_RESTART_SHORT = 5.0
     _INTERVAL_RESTART_LONG = 10.0
+    _INTERVAL_THROTTLER_METRICS = 60.0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -841,6 +843,31 @@ class MQTTGateway(Node):
     def _stop_health_monitoring_loop(self):
         self._stop_event_async.set()
 
+    def _start_throttler_metrics_loop(self):
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self._start_throttler_metrics_loop)
+            return
+        safe_ensure_future(self._throttler_metrics_loop(),
+                           loop=self._ev_loop)
+
+    async def _throttler_metrics_loop(self):
+        while not self._stop_event_async.is_set():
+            await asyncio.sleep(self._INTERVAL_THROTTLER_METRICS)
+            if self.health:
+                self.broadcast_throttler_metrics()
+
+    def broadcast_throttler_metrics(self):
+        """
+        Publishes the rate limits usage metrics of the connectors as a status update of type `throttler_metrics`
+        """
+        metrics = {}
+        for connector_name, connector in self._hb_app.markets.items():
+            connector_metrics = getattr(connector, "throttler_metrics", None)
+            if connector_metrics:
+                metrics[connector_name] = connector_metrics
+        if len(metrics) > 0:
+            self.broadcast_status_update(json.dumps(metrics), msg_type="throttler_metrics")
+
     def start(self, with_health: bool = True) -> None:
         self._init_logger()
         self._init_notifier()
@@ -850,6 +877,7 @@ class MQTTGateway(Node):
 
         if with_health:
             self._start_health_monitoring_loop()
+            self._start_throttler_metrics_loop()
 
         self.run()
         self.broadcast_status_update("online", msg_type="availability")
@@ -159,8 +159,19 @@ class ControllerBase(SmartComponentBase):
             if client_data and client_data.is_updatable:
                 setattr(self.config, field.name, getattr(new_config, field.name))
 
+    @property
+    def markets_ready(self) -> bool:
+        """
+        Checks if the markets and candles feeds used by the controller are ready. Controllers that don't declare their
+        markets wait for all the markets to be ready.
+        """
+        markets = self.config.update_markets({})
+        if len(markets) == 0:
+            return self.market_data_provider.ready
+        return self.market_data_provider.markets_ready(markets, self.config.candles_config)
+
     async def control_task(self):
-        if self.market_data_provider.ready and self.executors_update_event.is_set():
+        if self.markets_ready and self.executors_update_event.is_set():
             await self.update_processed_data()
             executor_actions: List[ExecutorAction] = self.determine_executor_actions()
             await self.send_actions(executor_actions)
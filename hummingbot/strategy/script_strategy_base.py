@@ -32,6 +32,9 @@ class ScriptStrategyBase(StrategyPyBase):
 
     # This class member defines connectors and their trading pairs needed for the strategy operation,
     markets: Dict[str, Set[str]]
+    # When enabled, on_tick is called as soon as any of the markets is ready instead of waiting for all the connectors.
+    # Use is_market_ready to check the state of each market.
+    partial_start: bool = False
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -70,10 +73,35 @@ class ScriptStrategyBase(StrategyPyBase):
             if not self.ready_to_trade:
                 for con in [c for c in self.connectors.values() if not c.ready]:
                     self.logger().warning(f"{con.name} is not ready. Please wait...")
+                if self.partial_start and len(self.ready_markets()) > 0:
+                    self.on_tick()
                 return
         else:
             self.on_tick()
 
+    def is_market_ready(self, connector_name: str, trading_pair: str) -> bool:
+        """
+        Checks if the connector is ready to operate on the trading pair, even if other markets are not ready yet.
+
+        :param connector_name: the name of the connector
+        :param trading_pair: the trading pair
+        """
+        return self.connectors[connector_name].is_trading_pair_ready(trading_pair)
+
+    def ready_markets(self) -> Dict[str, Set[str]]:
+        """
+        Returns the connectors and trading pairs of the strategy markets that are ready to operate.
+        """
+        ready_markets = {}
+        for connector_name, trading_pairs in self.markets.items():
+            if connector_name not in self.connectors:
+                continue
+            ready_pairs = {trading_pair for trading_pair in trading_pairs
+                           if self.is_market_ready(connector_name, trading_pair)}
+            if len(ready_pairs) > 0:
+                ready_markets[connector_name] = ready_pairs
+        return ready_markets
+
     def on_tick(self):
         """
         An event which is called on every tick, a sub class implements this to define what operation the strategy needs
@@ -178,6 +178,8 @@ class StrategyV2Base(ScriptStrategyBase):
     markets: Dict[str, Set[str]]
     _last_config_update_ts: float = 0
     closed_executors_buffer: int = 5
+    # Controllers check the readiness of their own markets, so they can start while other markets are still loading.
+    partial_start: bool = True
 
     @classmethod
     def init_markets(cls, config: StrategyV2ConfigBase):
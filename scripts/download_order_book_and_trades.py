@@ -1,96 +1,127 @@
 import json
 import os
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
+
+import numpy as np
 
 from hummingbot import data_path
+from hummingbot.connector import market_data_parquet_writer
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.market_data_parquet_writer import MarketDataParquetWriter
+from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
+class MarketDataJSONLinesWriter:
+    """
+    Used instead of `MarketDataParquetWriter` when pyarrow is not installed: appends the records to one JSON lines
+    file per trading pair, dataset and day in `base_path`.
+    """
+
+    def __init__(self, base_path: str, flush_interval: float):
+        self._base_path = base_path
+        self._flush_interval = flush_interval
+        self._lines: Dict[str, List[str]] = defaultdict(list)
+        self._last_flush_time = time.time()
+
+    def add_order_book_snapshot(self, timestamp: float, exchange: str, trading_pair: str, mid_price: float,
+                                best_bid: float, best_ask: float, bids: np.ndarray, asks: np.ndarray):
+        self._add(exchange, trading_pair, "order_book_snapshots",
+                  {"ts": timestamp, "bids": bids[:, :2].tolist(), "asks": asks[:, :2].tolist()})
+
+    def add_trade(self, timestamp: float, exchange: str, trading_pair: str, price: float, amount: float, side: str):
+        self._add(exchange, trading_pair, "trades",
+                  {"ts": timestamp, "price": float(price), "q_base": float(amount), "side": side})
+
+    def flush_if_due(self):
+        if time.time() - self._last_flush_time >= self._flush_interval:
+            self.flush()
+
+    def flush(self):
+        for file_path, lines in self._lines.items():
+            with open(file_path, "a") as file:
+                file.write("".join(lines))
+        self._lines.clear()
+        self._last_flush_time = time.time()
+
+    def close(self):
+        self.flush()
+
+    def _add(self, exchange: str, trading_pair: str, dataset: str, record: Dict):
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        file_path = os.path.join(self._base_path, f"{exchange}_{trading_pair}_{dataset}_{current_date}.txt")
+        self._lines[file_path].append(json.dumps(record) + "\n")
+
+
 class DownloadTradesAndOrderBookSnapshots(ScriptStrategyBase):
+    """
+    Records the order book snapshots and the public trades of the trading pairs in Parquet files, in
+    data/market_data. The files can be loaded with `hummingbot.connector.market_data_parquet_writer.read_market_data`.
+    If pyarrow is not installed the records are written in JSON lines files in data/ instead.
+    """
     exchange = os.getenv("EXCHANGE", "binance_paper_trade")
     trading_pairs = os.getenv("TRADING_PAIRS", "ETH-USDT,BTC-USDT")
     depth = int(os.getenv("DEPTH", 50))
     trading_pairs = [pair for pair in trading_pairs.split(",")]
-    last_dump_timestamp = 0
-    time_between_csv_dumps = 10
-
-    ob_temp_storage = {trading_pair: [] for trading_pair in trading_pairs}
-    trades_temp_storage = {trading_pair: [] for trading_pair in trading_pairs}
-    current_date = None
-    ob_file_paths = {}
-    trades_file_paths = {}
+    time_between_dumps = 10
+    time_between_files = 3600
+
+    bids_buffer = np.empty((depth, 3), dtype=np.float64)
+    asks_buffer = np.empty((depth, 3), dtype=np.float64)
     markets = {exchange: set(trading_pairs)}
     subscribed_to_order_book_trade_event: bool = False
 
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         super().__init__(connectors)
-        self.create_order_book_and_trade_files()
+        if market_data_parquet_writer.pa is not None:
+            self.market_data_writer = MarketDataParquetWriter(
+                base_path=os.path.join(data_path(), "market_data"),
+                rotation_interval=self.time_between_files,
+                flush_interval=self.time_between_dumps,
+            )
+        else:
+            self.logger().warning("pyarrow is not installed, the market data is written in JSON lines files. "
+                                  "Install it (pip install pyarrow) to record the market data in Parquet files.")
+            self.market_data_writer = MarketDataJSONLinesWriter(
+                base_path=data_path(), flush_interval=self.time_between_dumps)
         self.order_book_trade_event = SourceInfoEventForwarder(self._process_public_trade)
 
     def on_tick(self):
         if not self.subscribed_to_order_book_trade_event:
             self.subscribe_to_order_book_trade_event()
-        self.check_and_replace_files()
+        connector = self.connectors[self.exchange]
         for trading_pair in self.trading_pairs:
-            order_book_data = self.get_order_book_dict(self.exchange, trading_pair, self.depth)
-            self.ob_temp_storage[trading_pair].append(order_book_data)
-        if self.last_dump_timestamp < self.current_timestamp:
-            self.dump_and_clean_temp_storage()
-
-    def get_order_book_dict(self, exchange: str, trading_pair: str, depth: int = 50):
-        order_book = self.connectors[exchange].get_order_book(trading_pair)
-        snapshot = order_book.snapshot
-        return {
-            "ts": self.current_timestamp,
-            "bids": snapshot[0].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
-            "asks": snapshot[1].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
-        }
-
-    def dump_and_clean_temp_storage(self):
-        for trading_pair, order_book_info in self.ob_temp_storage.items():
-            file = self.ob_file_paths[trading_pair]
-            json_strings = [json.dumps(obj) for obj in order_book_info]
-            json_data = '\n'.join(json_strings)
-            file.write(json_data)
-            self.ob_temp_storage[trading_pair] = []
-        for trading_pair, trades_info in self.trades_temp_storage.items():
-            file = self.trades_file_paths[trading_pair]
-            json_strings = [json.dumps(obj) for obj in trades_info]
-            json_data = '\n'.join(json_strings)
-            file.write(json_data)
-            self.trades_temp_storage[trading_pair] = []
-        self.last_dump_timestamp = self.current_timestamp + self.time_between_csv_dumps
-
-    def check_and_replace_files(self):
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        if current_date != self.current_date:
-            for file in self.ob_file_paths.values():
-                file.close()
-            self.create_order_book_and_trade_files()
-
-    def create_order_book_and_trade_files(self):
-        self.current_date = datetime.now().strftime("%Y-%m-%d")
-        self.ob_file_paths = {trading_pair: self.get_file(self.exchange, trading_pair, "order_book_snapshots", self.current_date) for
-                              trading_pair in self.trading_pairs}
-        self.trades_file_paths = {trading_pair: self.get_file(self.exchange, trading_pair, "trades", self.current_date) for
-                                  trading_pair in self.trading_pairs}
-
-    @staticmethod
-    def get_file(exchange: str, trading_pair: str, source_type: str, current_date: str):
-        file_path = data_path() + f"/{exchange}_{trading_pair}_{source_type}_{current_date}.txt"
-        return open(file_path, "a")
+            order_book = connector.get_order_book(trading_pair)
+            bids, asks = order_book.get_depth_arrays(self.depth, bids_out=self.bids_buffer, asks_out=self.asks_buffer)
+            self.market_data_writer.add_order_book_snapshot(
+                timestamp=self.current_timestamp,
+                exchange=self.exchange,
+                trading_pair=trading_pair,
+                mid_price=connector.get_price_by_type(trading_pair, PriceType.MidPrice),
+                best_bid=connector.get_price_by_type(trading_pair, PriceType.BestBid),
+                best_ask=connector.get_price_by_type(trading_pair, PriceType.BestAsk),
+                bids=bids,
+                asks=asks,
+            )
+        self.market_data_writer.flush_if_due()
+
+    def on_stop(self):
+        self.market_data_writer.close()
 
     def _process_public_trade(self, event_tag: int, market: ConnectorBase, event: OrderBookTradeEvent):
-        self.trades_temp_storage[event.trading_pair].append({
-            "ts": event.timestamp,
-            "price": event.price,
-            "q_base": event.amount,
-            "side": event.type.name.lower(),
-        })
+        self.market_data_writer.add_trade(
+            timestamp=event.timestamp,
+            exchange=self.exchange,
+            trading_pair=event.trading_pair,
+            price=event.price,
+            amount=event.amount,
+            side=event.type.name.lower(),
+        )
 
     def subscribe_to_order_book_trade_event(self):
         for market in self.connectors.values():
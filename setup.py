@@ -87,6 +87,7 @@ def main():
         "prompt-toolkit",
         "protobuf",
         "psutil",
+        "pyarrow",
         "pydantic",
         "pyjwt",
         "pyperclip",
@@ -103,7 +104,7 @@ def main():
         "sqlalchemy",
         "tabulate",
         "tzlocal",
-        "ujson",
+        "ujson>=5.7",
         "web3",
         "websockets",
         "yarl",
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the tree based OrderBook against FlatOrderBook replaying a Binance diff depth stream.
+
+Usage:
+    python test/debug/debug_flat_order_book.py [recorded_stream.jsonl]
+
+The optional file contains one Binance `depthUpdate` event per line, as received from the `<symbol>@depth@100ms`
+websocket stream (the first line can be the REST `/api/v3/depth` snapshot). Without it, a synthetic stream with the
+same format and a dense tick grid around the mid price is generated.
+"""
+
+import json
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+
+TRADING_PAIR = "BTC-USDT"
+SNAPSHOT_LEVELS = 5000
+DIFF_EVENTS = 20000
+TICK_SIZE = 0.01
+QUERIES_PER_DIFF = 1
+
+
+def synthetic_stream(seed: int = 1) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    random = np.random.RandomState(seed)
+    mid_price = 30000.0
+    snapshot = {
+        "lastUpdateId": 1,
+        "bids": [[f"{mid_price - (i + 1) * TICK_SIZE:.2f}", f"{random.uniform(0.001, 2):.5f}"]
+                 for i in range(SNAPSHOT_LEVELS)],
+        "asks": [[f"{mid_price + (i + 1) * TICK_SIZE:.2f}", f"{random.uniform(0.001, 2):.5f}"]
+                 for i in range(SNAPSHOT_LEVELS)],
+    }
+    events = []
+    update_id = 1
+    for _ in range(DIFF_EVENTS):
+        mid_price += random.randint(-2, 3) * TICK_SIZE
+        sides = {}
+        for side, direction in (("b", -1), ("a", 1)):
+            # Most of the changes happen at the top of the book
+            ticks = np.minimum(random.geometric(0.08, random.randint(1, 12)), SNAPSHOT_LEVELS)
+            sides[side] = [[f"{mid_price + direction * tick * TICK_SIZE:.2f}",
+                            "0.00000" if random.rand() < 0.3 else f"{random.uniform(0.001, 2):.5f}"]
+                           for tick in ticks]
+        events.append({"e": "depthUpdate", "s": "BTCUSDT", "U": update_id + 1, "u": update_id + 3,
+                       "b": sides["b"], "a": sides["a"]})
+        update_id += 3
+    return snapshot, events
+
+
+def recorded_stream(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    with open(path) as file:
+        messages = [json.loads(line) for line in file if line.strip()]
+    messages = [message.get("data", message) for message in messages]
+    if "lastUpdateId" in messages[0]:
+        return messages[0], messages[1:]
+    # Without snapshot, start from an empty book
+    return {"lastUpdateId": messages[0]["U"] - 1, "bids": [], "asks": []}, messages
+
+
+def to_messages(snapshot: Dict[str, Any],
+                events: List[Dict[str, Any]]) -> Tuple[OrderBookMessage, List[OrderBookMessage]]:
+    snapshot_message = BinanceOrderBook.snapshot_message_from_exchange(
+        dict(snapshot), timestamp=0, metadata={"trading_pair": TRADING_PAIR})
+    diff_messages = [
+        BinanceOrderBook.diff_message_from_exchange(dict(event), timestamp=0, metadata={"trading_pair": TRADING_PAIR})
+        for event in events
+    ]
+    return snapshot_message, diff_messages
+
+
+def replay(order_book: OrderBook, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]) -> Tuple[float, float]:
+    order_book.apply_snapshot_message(snapshot)
+    start = time.perf_counter()
+    for diff in diffs:
+        order_book.apply_diff_message(diff)
+    apply_seconds = time.perf_counter() - start
+
+    order_book.apply_snapshot_message(snapshot)
+    start = time.perf_counter()
+    for diff in diffs:
+        order_book.apply_diff_message(diff)
+        for _ in range(QUERIES_PER_DIFF):
+            order_book.get_price(True)
+            order_book.get_vwap_for_volume(False, 5)
+    return apply_seconds, time.perf_counter() - start
+
+
+def main():
+    snapshot, events = recorded_stream(sys.argv[1]) if len(sys.argv) > 1 else synthetic_stream()
+    snapshot_message, diff_messages = to_messages(snapshot, events)
+    print(f"Replaying {len(diff_messages)} diff events over a snapshot with "
+          f"{len(snapshot['bids'])}/{len(snapshot['asks'])} levels")
+
+    results = {}
+    for name, order_book in (("OrderBook", OrderBook()),
+                             ("OrderBook (depth index)", OrderBook(depth_index=True)),
+                             ("FlatOrderBook", FlatOrderBook())):
+        apply_seconds, apply_and_query_seconds = replay(order_book, snapshot_message, diff_messages)
+        results[name] = order_book.numpy_snapshot
+        print(f"{name:<24} apply: {apply_seconds / len(diff_messages) * 1e6:6.2f} us/diff   "
+              f"apply + queries: {apply_and_query_seconds / len(diff_messages) * 1e6:6.2f} us/diff")
+
+    expected_bids, expected_asks = results["OrderBook"]
+    for bids, asks in results.values():
+        assert np.array_equal(expected_bids, bids) and np.array_equal(expected_asks, asks), "Order books differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+"""
+Micro-benchmark for the OrderBook depth-walk queries.
+
+Compares the native C++ iterator walk used by OrderBook.get_*_for_* against the previous implementation, which walked
+the book through the bid_entries()/ask_entries() generators and allocated an OrderBookRow per level, and against the
+optional prefix-sum depth index (OrderBook.depth_index_enabled).
+"""
+
+import timeit
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+BOOK_LEVELS = 5000
+ITERATIONS = 200
+
+
+def build_order_book(levels: int) -> OrderBook:
+    order_book = OrderBook()
+    mid_price = 10000.0
+    bids = np.array([[mid_price - 0.5 - i * 0.5, 1.0 + (i % 7), 1] for i in range(levels)], dtype=np.float64)
+    asks = np.array([[mid_price + 0.5 + i * 0.5, 1.0 + (i % 7), 1] for i in range(levels)], dtype=np.float64)
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def generator_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    cumulative_volume = 0
+    entries = order_book.ask_entries() if is_buy else order_book.bid_entries()
+    for order_book_row in entries:
+        cumulative_volume += order_book_row.amount
+        if cumulative_volume >= volume:
+            return order_book_row.price
+    return float("nan")
+
+
+def generator_vwap_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    total_cost = 0
+    total_volume = 0
+    entries = order_book.ask_entries() if is_buy else order_book.bid_entries()
+    for order_book_row in entries:
+        if total_volume + order_book_row.amount >= volume:
+            total_cost += (volume - total_volume) * order_book_row.price
+            return total_cost / volume
+        total_cost += order_book_row.amount * order_book_row.price
+        total_volume += order_book_row.amount
+    return float("nan")
+
+
+def generator_volume_for_price(order_book: OrderBook, is_buy: bool, price: float) -> float:
+    cumulative_volume = 0
+    entries = order_book.ask_entries() if is_buy else order_book.bid_entries()
+    for order_book_row in entries:
+        if (is_buy and order_book_row.price > price) or (not is_buy and order_book_row.price < price):
+            break
+        cumulative_volume += order_book_row.amount
+    return cumulative_volume
+
+
+def run_benchmark(name: str, old: Callable[[], float], new: Callable[[], float], indexed: Callable[[], float]):
+    old_seconds = timeit.timeit(old, number=ITERATIONS)
+    new_seconds = timeit.timeit(new, number=ITERATIONS)
+    indexed_seconds = timeit.timeit(indexed, number=ITERATIONS)
+    print(f"{name:<28} generator: {old_seconds / ITERATIONS * 1e6:10.1f} us/call   "
+          f"native: {new_seconds / ITERATIONS * 1e6:8.1f} us/call   "
+          f"indexed: {indexed_seconds / ITERATIONS * 1e6:6.2f} us/call   "
+          f"speedup: {old_seconds / new_seconds:6.1f}x / {old_seconds / indexed_seconds:8.1f}x")
+
+
+def main():
+    order_book = build_order_book(BOOK_LEVELS)
+    indexed_order_book = build_order_book(BOOK_LEVELS)
+    indexed_order_book.depth_index_enabled = True
+    # Queries sized to walk (almost) the whole side of the book.
+    deep_volume = BOOK_LEVELS * 3.9
+    deep_price = 10000.0 + BOOK_LEVELS * 0.49
+
+    benchmarks: Dict[str, Tuple[Callable[[], float], Callable[[], float], Callable[[], float]]] = {
+        "get_price_for_volume": (
+            lambda: generator_price_for_volume(order_book, True, deep_volume),
+            lambda: order_book.get_price_for_volume(True, deep_volume).result_price,
+            lambda: indexed_order_book.get_price_for_volume(True, deep_volume).result_price,
+        ),
+        "get_vwap_for_volume": (
+            lambda: generator_vwap_for_volume(order_book, False, deep_volume),
+            lambda: order_book.get_vwap_for_volume(False, deep_volume).result_price,
+            lambda: indexed_order_book.get_vwap_for_volume(False, deep_volume).result_price,
+        ),
+        "get_volume_for_price": (
+            lambda: generator_volume_for_price(order_book, True, deep_price),
+            lambda: order_book.get_volume_for_price(True, deep_price).result_volume,
+            lambda: indexed_order_book.get_volume_for_price(True, deep_price).result_volume,
+        ),
+    }
+
+    print(f"Order book with {BOOK_LEVELS} levels per side, {ITERATIONS} iterations per query")
+    for name, (old, new, indexed) in benchmarks.items():
+        assert np.isclose(old(), new()) and np.isclose(old(), indexed()), f"{name} results differ"
+        run_benchmark(name, old, new, indexed)
+
+
+if __name__ == "__main__":
+    main()
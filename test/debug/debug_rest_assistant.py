@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the REST request pipeline for a signed Binance order placement: request creation, time synchronizer
+pre-processor, authentication, response post-processor and JSON decoding. The HTTP connection is replaced by a fake
+one, so only the local processing cost is measured.
+
+Usage:
+    python test/debug/debug_rest_assistant.py [requests]
+
+The legacy pipeline deep copies every request and uses the standard library `json` module.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from copy import deepcopy
+from typing import Optional
+from unittest.mock import patch
+
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+from hummingbot.core.web_assistant.connections import json_codec
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+ORDER_RESPONSE = json.dumps({
+    "symbol": "BTCUSDT",
+    "orderId": 28,
+    "orderListId": -1,
+    "clientOrderId": "x-XEKWYICXBBTUT6225c95cd3ea1d8045ae9",
+    "transactTime": 1507725176595,
+    "price": "0.00000000",
+    "origQty": "10.00000000",
+    "executedQty": "10.00000000",
+    "cummulativeQuoteQty": "10.00000000",
+    "status": "FILLED",
+    "timeInForce": "GTC",
+    "type": "LIMIT",
+    "side": "BUY",
+    "fills": [{"price": "4000.00000000", "qty": "1.00000000", "commission": "4.00000000",
+               "commissionAsset": "USDT", "tradeId": 56}],
+})
+
+
+class FakeResponse:
+    status = 200
+    headers = {"X-MBX-USED-WEIGHT-1M": "1", "X-MBX-ORDER-COUNT-10S": "1"}
+
+    async def json(self):
+        return json_codec.loads(ORDER_RESPONSE)
+
+
+class FakeConnection:
+    async def call(self, request: RESTRequest) -> FakeResponse:
+        return FakeResponse()
+
+
+class LegacyRESTAssistant(RESTAssistant):
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None):
+        return await super()._call(request=deepcopy(request), timeout=timeout)
+
+
+async def place_orders(assistant: RESTAssistant, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        await assistant.execute_request(
+            url=web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL),
+            throttler_limit_id=CONSTANTS.ORDER_PATH_URL,
+            data={
+                "symbol": "BTCUSDT",
+                "side": "BUY",
+                "quantity": "1.00000000",
+                "newClientOrderId": f"x-XEKWYICXBBTUT{i}",
+                "type": "LIMIT",
+                "price": "4000.00000000",
+                "timeInForce": "GTC",
+            },
+            method=RESTMethod.POST,
+            is_auth_required=True,
+        )
+    return time.perf_counter() - start
+
+
+def build_assistant(assistant_class, requests: int) -> RESTAssistant:
+    throttler = SlidingWindowThrottler(
+        rate_limits=[RateLimit(limit_id=CONSTANTS.ORDER_PATH_URL, limit=requests, time_interval=60)])
+    time_synchronizer = TimeSynchronizer()
+    time_synchronizer.add_time_offset_ms_sample(0)
+    factory = web_utils.build_api_factory(
+        throttler=throttler,
+        time_synchronizer=time_synchronizer,
+        auth=BinanceAuth(api_key="someKey", secret_key="someSecret", time_provider=time_synchronizer))
+    return assistant_class(
+        connection=FakeConnection(),
+        throttler=throttler,
+        rest_pre_processors=factory._rest_pre_processors,
+        rest_post_processors=factory._rest_post_processors,
+        auth=factory.auth)
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with patch.object(json_codec, "dumps", json.dumps), patch.object(json_codec, "loads", json.loads):
+        legacy_seconds = asyncio.run(place_orders(build_assistant(LegacyRESTAssistant, requests), requests))
+    seconds = asyncio.run(place_orders(build_assistant(RESTAssistant, requests), requests))
+    for name, elapsed in (("legacy", legacy_seconds), ("current", seconds)):
+        print(f"{name:<8} {requests} orders: {elapsed:8.3f} s ({elapsed / requests * 1e6:7.1f} us/order)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of AsyncThrottler against SlidingWindowThrottler acquiring tasks with the Binance spot rate limits.
+
+Usage:
+    python test/debug/debug_throttler.py [acquisitions]
+
+The limits are scaled up so no acquisition has to wait: the benchmark measures the cost of the capacity checks, which
+grows with the number of tasks in the window for AsyncThrottler (expect several minutes for it with the default
+10000 acquisitions).
+"""
+
+import asyncio
+import sys
+import time
+from copy import deepcopy
+from typing import List
+
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+LIMIT_IDS = [CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL, CONSTANTS.SNAPSHOT_PATH_URL, CONSTANTS.ORDER_PATH_URL,
+             CONSTANTS.MY_TRADES_PATH_URL, CONSTANTS.ACCOUNTS_PATH_URL]
+
+
+def rate_limits(acquisitions: int) -> List[RateLimit]:
+    limits = deepcopy(CONSTANTS.RATE_LIMITS)
+    for limit in limits:
+        limit.limit *= acquisitions
+    return limits
+
+
+async def acquire(throttler: AsyncThrottlerBase, acquisitions: int) -> float:
+    start = time.perf_counter()
+    for i in range(acquisitions):
+        async with throttler.execute_task(limit_id=LIMIT_IDS[i % len(LIMIT_IDS)]):
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    acquisitions = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for throttler_class in (SlidingWindowThrottler, AsyncThrottler):
+        throttler = throttler_class(rate_limits=rate_limits(acquisitions))
+        seconds = asyncio.run(acquire(throttler, acquisitions))
+        print(f"{throttler_class.__name__:<24} {acquisitions} acquisitions: {seconds:8.3f} s "
+              f"({seconds / acquisitions * 1e6:9.1f} us/acquisition)")
+
+
+if __name__ == "__main__":
+    main()
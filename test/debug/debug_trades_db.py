@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the trades database with and without the SQLite performance profile (WAL journal, synchronous NORMAL,
+cache and mmap pragmas, and the indexes added by the `AddQueryPatternIndexes` migration).
+
+A database with a `TradeFill` table of the given size (1M rows by default) is generated once, and copied to run the
+benchmark on each configuration:
+- per event transactions: one order with its status per transaction, as the markets recorder writes them
+- the queries of the markets recorder and the history command, and the load of the fills of an order
+
+Usage:
+    python test/debug/debug_trades_db.py [trade_fills]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable
+from unittest.mock import patch
+
+from sqlalchemy import desc
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.db_migration.transformations import AddQueryPatternIndexes
+from hummingbot.model.executors import Executors
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIG_FILES = [f"conf_strategy_{i}.yml" for i in range(10)]
+MARKETS = [f"exchange_{i}" for i in range(5)]
+FILLS_PER_ORDER = 5
+CHUNK_SIZE = 50000
+
+
+def create_manager(db_path: str, profile: bool) -> SQLConnectionManager:
+    pragmas = SQLConnectionManager.SQLITE_PRAGMAS if profile else {}
+    with patch.object(SQLConnectionManager, "SQLITE_PRAGMAS", pragmas):
+        return SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path)
+
+
+def generate_database(db_path: str, trade_fills: int):
+    manager = create_manager(db_path, profile=False)
+    orders = trade_fills // FILLS_PER_ORDER
+    with manager.engine.begin() as connection:
+        for start in range(0, orders, CHUNK_SIZE):
+            connection.execute(Order.__table__.insert(), [
+                dict(id=f"OID{i}", config_file_path=CONFIG_FILES[i % len(CONFIG_FILES)], strategy="strategy",
+                     market=MARKETS[i % len(MARKETS)], symbol="BTC-USDT", base_asset="BTC", quote_asset="USDT",
+                     creation_timestamp=1700000000000 + i * 1000, order_type="LIMIT", amount=1, leverage=1,
+                     price=30000, last_status="BuyOrderCompleted", last_update_timestamp=1700000000000 + i * 1000,
+                     exchange_order_id=f"EOID{i}", position="NIL")
+                for i in range(start, min(start + CHUNK_SIZE, orders))])
+        for start in range(0, trade_fills, CHUNK_SIZE):
+            connection.execute(TradeFill.__table__.insert(), [
+                dict(config_file_path=CONFIG_FILES[(i // FILLS_PER_ORDER) % len(CONFIG_FILES)], strategy="strategy",
+                     market=MARKETS[(i // FILLS_PER_ORDER) % len(MARKETS)], symbol="BTC-USDT", base_asset="BTC",
+                     quote_asset="USDT", timestamp=1700000000000 + i * 200, order_id=f"OID{i // FILLS_PER_ORDER}",
+                     trade_type="BUY", order_type="LIMIT", price=30000, amount=0.2, leverage=1,
+                     trade_fee={"percent": "0", "flat_fees": []}, trade_fee_in_quote=0, exchange_trade_id=f"T{i}",
+                     position="NIL")
+                for i in range(start, min(start + CHUNK_SIZE, trade_fills))])
+        for index_names in AddQueryPatternIndexes.indexes.values():
+            for index_name in index_names:
+                connection.execute(f"DROP INDEX {index_name}")
+    manager.engine.dispose()
+
+
+def timed(function: Callable, repetitions: int) -> float:
+    start = time.perf_counter()
+    for i in range(repetitions):
+        function(i)
+    return (time.perf_counter() - start) / repetitions
+
+
+def run_benchmark(manager: SQLConnectionManager, trade_fills: int) -> dict:
+    orders = trade_fills // FILLS_PER_ORDER
+
+    def write_order(i: int):
+        with manager.get_new_session() as session:
+            with session.begin():
+                order_id = f"NEW-OID{i}"
+                session.add(Order(id=order_id, config_file_path=CONFIG_FILES[0], strategy="strategy",
+                                  market=MARKETS[0], symbol="BTC-USDT", base_asset="BTC", quote_asset="USDT",
+                                  creation_timestamp=1800000000000 + i, order_type="LIMIT", amount=1, leverage=1,
+                                  price=30000, last_status="BuyOrderCreated", last_update_timestamp=1800000000000 + i,
+                                  exchange_order_id=f"NEW-EOID{i}", position="NIL"))
+                session.add(OrderStatus(order_id=order_id, timestamp=1800000000000 + i, status="BuyOrderCreated"))
+
+    def get_trades_for_config(i: int):
+        with manager.get_new_session() as session:
+            (session.query(TradeFill)
+             .filter(TradeFill.config_file_path == CONFIG_FILES[i % len(CONFIG_FILES)])
+             .order_by(TradeFill.timestamp.desc())
+             .limit(2000)
+             .all())
+
+    def get_orders_for_config_and_market(i: int):
+        with manager.get_new_session() as session:
+            (session.query(Order)
+             .filter(Order.config_file_path == CONFIG_FILES[i % len(CONFIG_FILES)],
+                     Order.market == MARKETS[i % len(MARKETS)],
+                     Order.exchange_order_id.isnot(None))
+             .order_by(Order.creation_timestamp)
+             .limit(2000)
+             .all())
+
+    def get_recent_trades(i: int):
+        with manager.get_new_session() as session:
+            (session.query(TradeFill)
+             .filter(TradeFill.timestamp >= 1700000000000 + (trade_fills - 1000) * 200)
+             .order_by(desc(TradeFill.timestamp))
+             .all())
+
+    def load_order_fills(i: int):
+        with manager.get_new_session() as session:
+            order = session.query(Order).filter(Order.id == f"OID{(i * 7919) % orders}").one()
+            len(order.trade_fills)
+
+    def get_executors_by_controller(i: int):
+        with manager.get_new_session() as session:
+            session.query(Executors).filter(Executors.controller_id == f"controller_{i}").all()
+
+    return {
+        "order event transaction": timed(write_order, 500),
+        "get_trades_for_config": timed(get_trades_for_config, 20),
+        "get_orders_for_config_and_market": timed(get_orders_for_config_and_market, 20),
+        "history trades since timestamp": timed(get_recent_trades, 20),
+        "order.trade_fills": timed(load_order_fills, 50),
+        "get_executors_by_controller": timed(get_executors_by_controller, 50),
+    }
+
+
+def main():
+    trade_fills = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_path = os.path.join(temp_dir, "template.sqlite")
+        print(f"Generating a database with {trade_fills} trade fills...")
+        generate_database(template_path, trade_fills)
+
+        results = {}
+        for name, profile in (("default", False), ("profile", True)):
+            db_path = os.path.join(temp_dir, f"{name}.sqlite")
+            shutil.copyfile(template_path, db_path)
+            manager = create_manager(db_path, profile=profile)
+            if profile:
+                AddQueryPatternIndexes(migrator=None).apply(manager)
+            results[name] = run_benchmark(manager, trade_fills)
+            manager.engine.dispose()
+
+    print(f"{'operation':<36} {'default (ms)':>14} {'profile (ms)':>14}")
+    for operation in results["default"]:
+        print(f"{operation:<36} {results['default'][operation] * 1e3:14.3f} {results['profile'][operation] * 1e3:14.3f}")
+
+
+if __name__ == "__main__":
+    main()
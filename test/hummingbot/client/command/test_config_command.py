@@ -60,47 +60,52 @@ class ConfigCommandTest(unittest.TestCase):
         self.assertEqual(6, len(captures))
         self.assertEqual("\nGlobal Configurations:", captures[0])
 
-        df_str_expected = ("    +-----------------------------------+----------------------+\n"
-                           "    | Key                               | Value                |\n"
-                           "    |-----------------------------------+----------------------|\n"
-                           "    | instance_id                       | TEST_ID              |\n"
-                           "    | fetch_pairs_from_all_exchanges    | False                |\n"
-                           "    | kill_switch_mode                  | kill_switch_disabled |\n"
-                           "    | autofill_import                   | disabled             |\n"
-                           "    | telegram_mode                     | telegram_disabled    |\n"
-                           "    | mqtt_bridge                       |                      |\n"
-                           "    | ∟ mqtt_host                       | localhost            |\n"
-                           "    | ∟ mqtt_port                       | 1883                 |\n"
-                           "    | ∟ mqtt_username                   |                      |\n"
-                           "    | ∟ mqtt_password                   |                      |\n"
-                           "    | ∟ mqtt_namespace                  | hbot                 |\n"
-                           "    | ∟ mqtt_ssl                        | False                |\n"
-                           "    | ∟ mqtt_logger                     | True                 |\n"
-                           "    | ∟ mqtt_notifier                   | True                 |\n"
-                           "    | ∟ mqtt_commands                   | True                 |\n"
-                           "    | ∟ mqtt_events                     | True                 |\n"
-                           "    | ∟ mqtt_external_events            | True                 |\n"
-                           "    | ∟ mqtt_autostart                  | False                |\n"
-                           "    | send_error_logs                   | True                 |\n"
-                           "    | pmm_script_mode                   | pmm_script_disabled  |\n"
-                           "    | gateway                           |                      |\n"
-                           "    | ∟ gateway_api_host                | localhost            |\n"
-                           "    | ∟ gateway_api_port                | 15888                |\n"
-                           "    | rate_oracle_source                | binance              |\n"
-                           "    | global_token                      |                      |\n"
-                           "    | ∟ global_token_name               | USDT                 |\n"
-                           "    | ∟ global_token_symbol             | $                    |\n"
-                           "    | rate_limits_share_pct             | 100                  |\n"
-                           "    | commands_timeout                  |                      |\n"
-                           "    | ∟ create_command_timeout          | 10                   |\n"
-                           "    | ∟ other_commands_timeout          | 30                   |\n"
-                           "    | tables_format                     | psql                 |\n"
-                           "    | tick_size                         | 1.0                  |\n"
-                           "    | market_data_collection            |                      |\n"
-                           "    | ∟ market_data_collection_enabled  | True                 |\n"
-                           "    | ∟ market_data_collection_interval | 60                   |\n"
-                           "    | ∟ market_data_collection_depth    | 20                   |\n"
-                           "    +-----------------------------------+----------------------+")
+        df_str_expected = ("    +-------------------------------------+----------------------+\n"
+                           "    | Key                                 | Value                |\n"
+                           "    |-------------------------------------+----------------------|\n"
+                           "    | instance_id                         | TEST_ID              |\n"
+                           "    | fetch_pairs_from_all_exchanges      | False                |\n"
+                           "    | kill_switch_mode                    | kill_switch_disabled |\n"
+                           "    | autofill_import                     | disabled             |\n"
+                           "    | telegram_mode                       | telegram_disabled    |\n"
+                           "    | mqtt_bridge                         |                      |\n"
+                           "    | ∟ mqtt_host                         | localhost            |\n"
+                           "    | ∟ mqtt_port                         | 1883                 |\n"
+                           "    | ∟ mqtt_username                     |                      |\n"
+                           "    | ∟ mqtt_password                     |                      |\n"
+                           "    | ∟ mqtt_namespace                    | hbot                 |\n"
+                           "    | ∟ mqtt_ssl                          | False                |\n"
+                           "    | ∟ mqtt_logger                       | True                 |\n"
+                           "    | ∟ mqtt_notifier                     | True                 |\n"
+                           "    | ∟ mqtt_commands                     | True                 |\n"
+                           "    | ∟ mqtt_events                       | True                 |\n"
+                           "    | ∟ mqtt_external_events              | True                 |\n"
+                           "    | ∟ mqtt_autostart                    | False                |\n"
+                           "    | send_error_logs                     | True                 |\n"
+                           "    | pmm_script_mode                     | pmm_script_disabled  |\n"
+                           "    | gateway                             |                      |\n"
+                           "    | ∟ gateway_api_host                  | localhost            |\n"
+                           "    | ∟ gateway_api_port                  | 15888                |\n"
+                           "    | rate_oracle_source                  | binance              |\n"
+                           "    | global_token                        |                      |\n"
+                           "    | ∟ global_token_name                 | USDT                 |\n"
+                           "    | ∟ global_token_symbol               | $                    |\n"
+                           "    | rate_limits_share_pct               | 100                  |\n"
+                           "    | commands_timeout                    |                      |\n"
+                           "    | ∟ create_command_timeout            | 10                   |\n"
+                           "    | ∟ other_commands_timeout            | 30                   |\n"
+                           "    | tables_format                       | psql                 |\n"
+                           "    | tick_size                           | 1.0                  |\n"
+                           "    | market_data_collection              |                      |\n"
+                           "    | ∟ market_data_collection_enabled    | True                 |\n"
+                           "    | ∟ market_data_collection_interval   | 60                   |\n"
+                           "    | ∟ market_data_collection_depth      | 20                   |\n"
+                           "    | ∟ market_data_collection_format     | sql                  |\n"
+                           "    | markets_recorder                    |                      |\n"
+                           "    | ∟ write_behind_enabled              | False                |\n"
+                           "    | ∟ write_behind_queue_size           | 10000                |\n"
+                           "    | ∟ market_states_checkpoint_interval | 0                    |\n"
+                           "    +-------------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
         self.assertEqual("\nColor Settings:", captures[2])
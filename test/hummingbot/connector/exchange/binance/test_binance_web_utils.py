@@ -1,7 +1,12 @@
+import asyncio
 import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.exchange.binance import binance_web_utils as web_utils
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitUsageRESTPostProcessor
 
 
 class BinanceUtilTestCases(unittest.TestCase):
@@ -17,3 +22,23 @@ class BinanceUtilTestCases(unittest.TestCase):
         domain = "com"
         expected_url = CONSTANTS.REST_URL.format(domain) + CONSTANTS.PRIVATE_API_VERSION + path_url
         self.assertEqual(expected_url, web_utils.private_rest_url(path_url, domain))
+
+    def test_reported_usage_is_scaled_by_the_limits_share(self):
+        throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS, limits_share_percentage=Decimal("50"))
+        post_processor = RateLimitUsageRESTPostProcessor(
+            throttler=throttler, limit_ids_by_header=CONSTANTS.RATE_LIMIT_USAGE_HEADERS)
+        response = MagicMock()
+        response.headers = {
+            "X-MBX-USED-WEIGHT-1M": "3500",
+            "X-MBX-ORDER-COUNT-10S": "10",
+            "X-MBX-ORDER-COUNT-1D": "150000",
+        }
+
+        asyncio.get_event_loop().run_until_complete(post_processor.post_process(response))
+
+        # The local limits are 3000 (weight), 25 (orders) and 80000 (daily orders)
+        self.assertEqual(1750, throttler.capacity_used(CONSTANTS.REQUEST_WEIGHT))
+        self.assertEqual(5, throttler.capacity_used(CONSTANTS.ORDERS))
+        # The daily order count is reset by the server at a fixed time, it is not fed back to the throttler
+        self.assertEqual(0, throttler.capacity_used(CONSTANTS.ORDERS_24HR))
+        self.assertTrue(throttler.execute_task(CONSTANTS.ORDER_PATH_URL).within_capacity())
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.connector import market_data_parquet_writer
+from hummingbot.connector.market_data_parquet_writer import MarketDataParquetWriter, read_market_data
+
+
+class MarketDataParquetWriterDependencyTests(unittest.TestCase):
+
+    @patch("hummingbot.connector.market_data_parquet_writer.pa", None)
+    def test_writer_requires_pyarrow(self):
+        with self.assertRaises(ImportError):
+            MarketDataParquetWriter(base_path=tempfile.gettempdir())
+
+    @patch("hummingbot.connector.market_data_parquet_writer.pa", None)
+    def test_reader_requires_pyarrow(self):
+        with self.assertRaises(ImportError):
+            read_market_data(base_path=tempfile.gettempdir(), dataset=MarketDataParquetWriter.TRADES)
+
+
+@unittest.skipIf(market_data_parquet_writer.pa is None, "pyarrow is not installed")
+class MarketDataParquetWriterTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.base_path = temp_dir.name
+        self.bids = np.array([[99, 1, 10], [98, 2, 10]], dtype=np.float64)
+        self.asks = np.array([[101, 3, 10], [102, 4, 10], [103, 5, 10]], dtype=np.float64)
+
+    def add_snapshot(self, writer: MarketDataParquetWriter, timestamp: float):
+        writer.add_order_book_snapshot(
+            timestamp=timestamp,
+            exchange="binance",
+            trading_pair="BTC-USDT",
+            mid_price=Decimal("100"),
+            best_bid=Decimal("99"),
+            best_ask=Decimal("101"),
+            bids=self.bids,
+            asks=self.asks,
+        )
+
+    def test_order_book_snapshots_and_trades_are_read_back(self):
+        writer = MarketDataParquetWriter(base_path=self.base_path)
+        self.add_snapshot(writer, timestamp=1000)
+        writer.add_trade(
+            timestamp=1000.5, exchange="binance", trading_pair="BTC-USDT", price=Decimal("100.5"),
+            amount=Decimal("0.1"), side="buy")
+        writer.close()
+
+        snapshots = read_market_data(self.base_path, MarketDataParquetWriter.ORDER_BOOK_SNAPSHOTS)
+        trades = read_market_data(self.base_path, MarketDataParquetWriter.TRADES)
+
+        self.assertEqual(1, len(snapshots))
+        self.assertEqual("BTC-USDT", snapshots["trading_pair"][0])
+        self.assertEqual(100, snapshots["mid_price"][0])
+        self.assertEqual([99, 98], list(snapshots["bid_prices"][0]))
+        self.assertEqual([1, 2], list(snapshots["bid_amounts"][0]))
+        self.assertEqual([101, 102, 103], list(snapshots["ask_prices"][0]))
+        self.assertEqual([3, 4, 5], list(snapshots["ask_amounts"][0]))
+        self.assertEqual(1, len(trades))
+        self.assertEqual(100.5, trades["price"][0])
+        self.assertEqual("buy", trades["side"][0])
+
+    @patch("hummingbot.connector.market_data_parquet_writer.MarketDataParquetWriter._time")
+    def test_files_are_rotated(self, time_mock):
+        time_mock.return_value = 1000
+        writer = MarketDataParquetWriter(base_path=self.base_path, rotation_interval=60)
+        self.add_snapshot(writer, timestamp=1000)
+        writer.flush()
+        time_mock.return_value = 1030
+        self.add_snapshot(writer, timestamp=1030)
+        writer.flush()
+        time_mock.return_value = 1060
+        self.add_snapshot(writer, timestamp=1060)
+        writer.close()
+
+        file_names = os.listdir(os.path.join(self.base_path, MarketDataParquetWriter.ORDER_BOOK_SNAPSHOTS))
+        snapshots = read_market_data(self.base_path, MarketDataParquetWriter.ORDER_BOOK_SNAPSHOTS)
+
+        self.assertEqual(2, len(file_names))
+        self.assertEqual([1000, 1030, 1060], list(snapshots["timestamp"]))
+
+    @patch("hummingbot.connector.market_data_parquet_writer.MarketDataParquetWriter._time")
+    def test_records_are_flushed_after_the_flush_interval(self, time_mock):
+        time_mock.return_value = 1000
+        writer = MarketDataParquetWriter(base_path=self.base_path, flush_interval=10)
+        self.add_snapshot(writer, timestamp=1000)
+
+        writer.flush_if_due()
+        self.assertFalse(os.path.exists(os.path.join(self.base_path, MarketDataParquetWriter.ORDER_BOOK_SNAPSHOTS)))
+
+        time_mock.return_value = 1010
+        writer.flush_if_due()
+        self.assertEqual(1, len(os.listdir(os.path.join(self.base_path, MarketDataParquetWriter.ORDER_BOOK_SNAPSHOTS))))
+        writer.close()
+
+    def test_read_filters_by_timestamp(self):
+        writer = MarketDataParquetWriter(base_path=self.base_path)
+        for timestamp in (1000, 1001, 1002, 1003):
+            self.add_snapshot(writer, timestamp=timestamp)
+        writer.close()
+
+        snapshots = read_market_data(
+            self.base_path, MarketDataParquetWriter.ORDER_BOOK_SNAPSHOTS, start_timestamp=1001, end_timestamp=1003)
+
+        self.assertEqual([1001, 1002], list(snapshots["timestamp"]))
+
+    def test_read_returns_empty_data_frame_without_files(self):
+        trades = read_market_data(self.base_path, MarketDataParquetWriter.TRADES)
+
+        self.assertEqual(0, len(trades))
+        self.assertIn("price", trades.columns)
@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -6,6 +8,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
+import pandas as pd
 from sqlalchemy import create_engine
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
@@ -18,11 +21,14 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -434,3 +440,282 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def create_file_sql_manager(self, engine_mock) -> SQLConnectionManager:
+        # The writer thread of the write behind mode can't share an in-memory SQLite database with the tests thread
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(temp_dir.name, 'test_DB.sqlite')}")
+        return SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+
+    def test_write_behind_mode_writes_events_in_writer_thread(self):
+        manager = self.create_file_sql_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+
+        with patch.object(recorder, "_append_row_to_csv") as append_row_mock:
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder.flush()
+
+        self.assertTrue(recorder.write_behind_enabled)
+        self.assertEqual(0, recorder.write_behind_lag)
+        append_row_mock.assert_called_once()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = orders[0].status
+            trade_fills = orders[0].trade_fills
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(MarketEvent.OrderFilled.name, orders[0].last_status)
+        self.assertEqual(2, len(order_status))
+        self.assertEqual(1, len(trade_fills))
+        self.assertEqual(fill_event.exchange_trade_id, trade_fills[0].exchange_trade_id)
+
+    def test_stop_writes_pending_events_in_write_behind_mode(self):
+        manager = self.create_file_sql_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+        )
+        recorder.start()
+
+        for i in range(10):
+            event = BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=f"OID{i}",
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"EOID{i}",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, event)
+        recorder.stop()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(10, len(orders))
+        self.assertEqual(1, len(market_states))
+        self.assertEqual(self.display_name, market_states[0].market)
+
+    def test_market_states_checkpoints_are_debounced(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            market_states_checkpoint_interval=0.01,
+        )
+
+        for i in range(3):
+            self.tracking_states = {f"OID{j}": {"client_order_id": f"OID{j}"} for j in range(i + 1)}
+            event = BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=f"OID{i}",
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"EOID{i}",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, event)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(3, session.query(Order).count())
+            self.assertEqual(0, session.query(MarketState).count())
+
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        with self.manager.get_new_session() as session:
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(market_states))
+        self.assertEqual(self.tracking_states, market_states[0].saved_state)
+
+    def test_stop_saves_the_pending_market_states_checkpoint(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            market_states_checkpoint_interval=60,
+        )
+        recorder.start()
+
+        self.tracking_states = {"OID1": {"client_order_id": "OID1"}}
+        event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, event)
+        recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(market_states))
+        self.assertEqual(self.tracking_states, market_states[0].saved_state)
+
+    def test_trade_fills_are_appended_to_the_trades_csv_file(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        self.addCleanup(recorder.stop)
+
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir.name):
+            for i in range(2):
+                fill_event = OrderFilledEvent(
+                    timestamp=1642020000 + i,
+                    order_id=f"OID{i}",
+                    trading_pair=self.trading_pair,
+                    trade_type=TradeType.BUY,
+                    order_type=OrderType.LIMIT,
+                    price=Decimal(1010),
+                    amount=Decimal(1),
+                    trade_fee=AddedToCostTradeFee(),
+                    exchange_trade_id=f"TradeId{i}"
+                )
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        trades = pd.read_csv(os.path.join(temp_dir.name, "trades_test_co.csv"), keep_default_na=False)
+        self.assertEqual(["TradeId0", "TradeId1"], list(trades["exchange_trade_id"]))
+        self.assertEqual(["n/a", "n/a"], list(trades["age"]))
+
+    @patch("hummingbot.connector.markets_recorder.MarketDataParquetWriter")
+    def test_market_data_collection_in_parquet_files(self, writer_class_mock):
+        writer_mock = writer_class_mock.return_value
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+            np.array([[101, 3, 1], [102, 4, 1]], dtype=np.float64))
+        self.order_books = {self.trading_pair: order_book}
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_interval=1,
+                market_data_collection_depth=20,
+                market_data_collection_format="parquet",
+            ),
+        )
+        recorder._start_market_data_recording()
+        recorder._market_data_collection_task.cancel()
+
+        with patch.object(self, "get_order_book", return_value=order_book):
+            with patch.object(self, "get_price_by_type", return_value=Decimal("100")):
+                recorder._record_market_data_in_parquet_files()
+
+        snapshot = writer_mock.add_order_book_snapshot.call_args.kwargs
+        self.assertEqual(self.display_name, snapshot["exchange"])
+        self.assertEqual(self.trading_pair, snapshot["trading_pair"])
+        self.assertEqual([99, 98], snapshot["bids"][:, 0].tolist())
+        self.assertEqual([101, 102], snapshot["asks"][:, 0].tolist())
+        writer_mock.flush_if_due.assert_called_once()
+
+        order_book.trigger_event(OrderBookEvent.TradeEvent, OrderBookTradeEvent(
+            trading_pair=self.trading_pair,
+            timestamp=1642010000,
+            type=TradeType.SELL,
+            price=Decimal("99"),
+            amount=Decimal("0.5"),
+        ))
+
+        writer_mock.add_trade.assert_called_once_with(
+            timestamp=1642010000,
+            exchange=self.display_name,
+            trading_pair=self.trading_pair,
+            price=Decimal("99"),
+            amount=Decimal("0.5"),
+            side="sell",
+        )
+
+        recorder.stop()
+
+        writer_mock.close.assert_called_once()
+        self.assertEqual(0, len(order_book.get_listeners(OrderBookEvent.TradeEvent)))
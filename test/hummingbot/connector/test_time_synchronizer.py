@@ -75,3 +75,36 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time")
+    def test_time_without_offsets_is_not_affected_by_wall_clock_changes(self, time_mock, seconds_counter_mock):
+        now = 1640000000.0
+        time_mock.side_effect = [now, now - 3600]
+        seconds_counter_mock.side_effect = [2, 2, 5]
+        time_provider = TimeSynchronizer()
+
+        self.assertEqual(now, time_provider.time())
+        self.assertEqual(now + 3, time_provider.time())
+
+    @patch("hummingbot.connector.time_synchronizer.numpy.median")
+    def test_time_offset_is_calculated_only_when_samples_change(self, median_mock):
+        median_mock.side_effect = lambda samples: sorted(samples)[len(samples) // 2]
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+
+        self.assertEqual(1000, time_provider.time_offset_ms)
+        time_provider.time()
+        time_provider.time()
+        self.assertEqual(1, median_mock.call_count)
+
+        time_provider.add_time_offset_ms_sample(2000)
+        time_provider.add_time_offset_ms_sample(3000)
+
+        self.assertEqual(numpy.mean([2000, (1000 + 2000 * 3 + 3000 * 5) / 9]), time_provider.time_offset_ms)
+        self.assertEqual(2, median_mock.call_count)
+
+        time_provider.clear_time_offset_ms_samples()
+        time_provider.time()
+
+        self.assertEqual(2, median_mock.call_count)
@@ -0,0 +1,82 @@
+import os
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+
+import pandas as pd
+
+from hummingbot.connector.trades_csv_writer import TradesCSVWriter
+
+
+class TradesCSVWriterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.csv_path = os.path.join(self.temp_dir, "trades_test.csv")
+        self.field_names = ("exchange_trade_id", "price", "trade_fee", "age")
+
+    def create_writer(self, field_names=None) -> TradesCSVWriter:
+        writer = TradesCSVWriter(csv_path=self.csv_path, field_names=field_names or self.field_names)
+        self.addCleanup(writer.close)
+        return writer
+
+    def test_header_is_written_once_for_a_new_file(self):
+        writer = self.create_writer()
+
+        writer.write_row(("T1", Decimal("100.5"), {"percent": "0.1"}, "00:00:01"))
+        writer.write_row(("T2", Decimal("101"), {"percent": "0.1"}, "n/a"))
+        writer.flush()
+
+        df = pd.read_csv(self.csv_path)
+        self.assertEqual(list(self.field_names), list(df.columns))
+        self.assertEqual(["T1", "T2"], list(df["exchange_trade_id"]))
+        self.assertEqual([100.5, 101], list(df["price"]))
+        self.assertEqual("{'percent': '0.1'}", df["trade_fee"][0])
+
+    def test_rows_are_appended_to_a_file_with_the_same_header(self):
+        pd.DataFrame([self.field_names]).to_csv(self.csv_path, mode='a', header=False, index=False)
+        pd.DataFrame([("T1", Decimal("100"), {}, "n/a")]).to_csv(self.csv_path, mode='a', header=False, index=False)
+        writer = self.create_writer()
+
+        writer.write_row(("T2", Decimal("101"), {}, "n/a"))
+        writer.flush()
+
+        df = pd.read_csv(self.csv_path)
+        self.assertEqual(["T1", "T2"], list(df["exchange_trade_id"]))
+        self.assertEqual(["trades_test.csv"], os.listdir(self.temp_dir))
+
+    def test_file_with_a_different_header_is_renamed(self):
+        pd.DataFrame([("exchange_trade_id", "price")]).to_csv(self.csv_path, mode='a', header=False, index=False)
+        writer = self.create_writer()
+
+        writer.write_row(("T1", Decimal("100"), {}, "n/a"))
+        writer.flush()
+
+        file_names = sorted(os.listdir(self.temp_dir))
+        self.assertEqual(2, len(file_names))
+        self.assertEqual("trades_test.csv", file_names[0])
+        self.assertTrue(file_names[1].startswith("trades_test_old_"))
+        self.assertEqual(list(self.field_names), list(pd.read_csv(self.csv_path).columns))
+
+    def test_rows_are_kept_in_the_buffer_until_flushed(self):
+        writer = self.create_writer()
+
+        writer.write_row(("T1", Decimal("100"), {}, "n/a"))
+        self.assertEqual(0, os.path.getsize(self.csv_path))
+
+        writer.flush()
+        self.assertGreater(os.path.getsize(self.csv_path), 0)
+
+    def test_close_flushes_and_reopen_keeps_appending(self):
+        writer = self.create_writer()
+        writer.write_row(("T1", Decimal("100"), {}, "n/a"))
+        writer.close()
+
+        writer.write_row(("T2", Decimal("101"), {}, "n/a"))
+        writer.close()
+
+        df = pd.read_csv(self.csv_path)
+        self.assertEqual(["T1", "T2"], list(df["exchange_trade_id"]))
@@ -275,3 +275,21 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_update_capacity_used_only_raises_the_local_usage(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 3)
+        self.assertEqual(5, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 8)
+        self.assertEqual(8, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+
+    def test_update_capacity_used_is_scaled_by_the_limits_share(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("50"))
+
+        throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 6)
+
+        self.assertEqual(3, throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.assertTrue(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
@@ -0,0 +1,279 @@
+import asyncio
+import time
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import RateLimitWindow, SlidingWindowThrottler
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits)
+        self.now = 1000.0
+        time_patcher = patch.object(self.throttler, "_time", side_effect=lambda: self.now)
+        time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+    def acquire(self, limit_id: str):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=limit_id).acquire())
+
+    def test_init_with_rate_limits_share_pct(self):
+        throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("55"))
+
+        self.assertEqual(5, len(throttler._windows))
+        self.assertEqual(1, throttler._windows[TEST_POOL_ID].limit)
+        self.assertEqual(5, throttler._windows[TEST_WEIGHTED_POOL_ID].limit)
+        self.assertAlmostEqual(5.25, throttler._windows[TEST_POOL_ID].window)
+
+    def test_task_windows_include_linked_limits_with_their_weights(self):
+        task_windows = self.throttler.task_windows(TEST_WEIGHTED_TASK_1_ID)
+
+        self.assertEqual([(TEST_WEIGHTED_TASK_1_ID, 1), (TEST_WEIGHTED_POOL_ID, 5)],
+                         [(window.rate_limit.limit_id, weight) for window, weight in task_windows])
+        self.assertIs(task_windows, self.throttler.task_windows(TEST_WEIGHTED_TASK_1_ID))
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+
+        self.assertTrue(context.within_capacity())
+        self.ev_loop.run_until_complete(context.acquire())
+
+    def test_within_capacity_pool_non_weighted_task(self):
+        self.assertTrue(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+        self.acquire(TEST_POOL_ID)
+
+        self.assertFalse(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.acquire(TEST_WEIGHTED_TASK_1_ID)
+        self.acquire(TEST_WEIGHTED_TASK_2_ID)
+
+        # Another Task 1 (weight=5) would use 11/10 of the pool, but Task 2 (weight=1) only 7/10
+        self.assertEqual(6, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_capacity_is_released_after_the_window_with_safety_margin(self):
+        self.acquire(TEST_POOL_ID)
+
+        self.now += 5.24
+        self.assertFalse(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+
+        self.now += 0.01
+        self.assertTrue(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+        self.assertEqual(0, self.throttler.capacity_used(TEST_POOL_ID))
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.acquire(TEST_POOL_ID)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(self.throttler.execute_task(TEST_POOL_ID).acquire(), 0.3))
+        self.assertEqual(1, len(self.throttler._windows[TEST_POOL_ID]))
+
+    def test_set_rate_limits_keeps_used_capacity(self):
+        self.acquire(TEST_WEIGHTED_TASK_1_ID)
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=20, time_interval=5.0)])
+
+        self.assertEqual([TEST_WEIGHTED_POOL_ID], list(self.throttler._windows))
+        self.assertEqual(20, self.throttler._windows[TEST_WEIGHTED_POOL_ID].limit)
+        self.assertEqual(5, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+
+    def test_update_capacity_used_only_raises_the_local_usage(self):
+        self.acquire(TEST_WEIGHTED_TASK_1_ID)
+
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 3)
+        self.assertEqual(5, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+
+        self.now += 1
+        self.throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 8)
+        self.assertEqual(8, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+
+        # The usage reported by the server is released a full window after it was received
+        self.now += 4.3
+        self.assertEqual(3, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.throttler.update_capacity_used("unknown", 3)
+
+    def test_update_capacity_used_is_scaled_by_the_limits_share(self):
+        throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("50"))
+
+        # The server reports the usage of the whole account, 6 of 10, which is 3 of the local limit of 5
+        throttler.update_capacity_used(TEST_WEIGHTED_POOL_ID, 6)
+
+        self.assertEqual(3, throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.assertTrue(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_window_expires_entries_in_order(self):
+        window = RateLimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=1), safety_margin_pct=0)
+        window.add(1, now=0.0)
+        window.add(2, now=0.5)
+
+        self.assertFalse(window.has_capacity(1, now=0.9))
+        self.assertTrue(window.has_capacity(1, now=1.1))
+        self.assertEqual(2, window.capacity_used)
+        self.assertEqual(1, len(window))
+
+    def test_window_time_until_capacity(self):
+        window = RateLimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=1), safety_margin_pct=0)
+        window.add(1, now=0.0)
+        window.add(1, now=0.2)
+        window.add(1, now=0.4)
+
+        self.assertAlmostEqual(0.9, window.time_until_capacity(1, now=0.1))
+        self.assertAlmostEqual(1.1, window.time_until_capacity(2, now=0.1))
+        self.assertEqual(0, window.time_until_capacity(1, now=1.0))
+
+    def test_task_heavier_than_the_limit_runs_alone(self):
+        window = RateLimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=1), safety_margin_pct=0)
+
+        self.assertTrue(window.has_capacity(5, now=0))
+        window.add(1, now=0)
+        self.assertFalse(window.has_capacity(5, now=0.5))
+
+
+class SlidingWindowThrottlerWakeupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.new_event_loop()
+        self.addCleanup(self.ev_loop.close)
+        self.throttler = SlidingWindowThrottler(
+            rate_limits=[
+                RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2),
+                RateLimit(limit_id=TEST_PATH_URL, limit=100, time_interval=0.2,
+                          linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            ],
+            safety_margin_pct=0,
+            priority_max_wait=0.3)
+        self.run_order = []
+
+    async def run_task(self, name: str, limit_id: str, priority: RequestPriority = None):
+        async with self.throttler.execute_task(limit_id=limit_id, priority=priority):
+            self.run_order.append((name, time.monotonic()))
+
+    def test_waiters_run_in_fifo_order_when_capacity_is_released(self):
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*[self.run_task(f"task_{i}", TEST_POOL_ID if i % 2 else TEST_PATH_URL)
+                                   for i in range(5)])
+            return start
+
+        start = self.ev_loop.run_until_complete(run())
+
+        self.assertEqual([f"task_{i}" for i in range(5)], [name for name, _ in self.run_order])
+        delays = [timestamp - start for _, timestamp in self.run_order]
+        self.assertLess(delays[1], 0.05)
+        # The waiters are woken up when the first entries expire, not on a polling interval
+        self.assertGreaterEqual(delays[2], 0.2)
+        self.assertLess(delays[3], 0.3)
+        self.assertGreaterEqual(delays[4], 0.4)
+        self.assertLess(delays[4], 0.5)
+
+    def test_cancelled_waiter_does_not_block_the_queue(self):
+        async def run():
+            await self.run_task("task_0", TEST_POOL_ID)
+            await self.run_task("task_1", TEST_POOL_ID)
+            cancelled = asyncio.ensure_future(self.run_task("cancelled", TEST_PATH_URL))
+            waiting = asyncio.ensure_future(self.run_task("task_2", TEST_POOL_ID))
+            await asyncio.sleep(0.05)
+            cancelled.cancel()
+            await waiting
+
+        self.ev_loop.run_until_complete(run())
+
+        self.assertEqual(["task_0", "task_1", "task_2"], [name for name, _ in self.run_order])
+        self.assertEqual(0, len(self.throttler._windows[TEST_POOL_ID].waiters))
+
+    def test_execute_task_uses_the_priority_of_the_context(self):
+        self.assertEqual(RequestPriority.NORMAL, self.throttler.execute_task(TEST_POOL_ID)._priority)
+        with request_priority(RequestPriority.HIGH):
+            self.assertEqual(RequestPriority.HIGH, self.throttler.execute_task(TEST_POOL_ID)._priority)
+            self.assertEqual(RequestPriority.LOW,
+                             self.throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.LOW)._priority)
+        self.assertEqual(RequestPriority.NORMAL, self.throttler.execute_task(TEST_POOL_ID)._priority)
+
+    def test_high_priority_waiters_run_first(self):
+        async def run():
+            await self.run_task("first", TEST_POOL_ID)
+            await self.run_task("second", TEST_POOL_ID)
+            await asyncio.gather(
+                self.run_task("low", TEST_POOL_ID, RequestPriority.LOW),
+                self.run_task("normal", TEST_PATH_URL),
+                self.run_task("high", TEST_PATH_URL, RequestPriority.HIGH),
+            )
+
+        self.ev_loop.run_until_complete(run())
+
+        self.assertEqual(["first", "second", "high", "normal", "low"], [name for name, _ in self.run_order])
+
+    def test_starved_waiters_run_before_newer_high_priority_ones(self):
+        async def run():
+            await self.run_task("first", TEST_POOL_ID)
+            await self.run_task("second", TEST_POOL_ID)
+            low = asyncio.ensure_future(self.run_task("low", TEST_POOL_ID, RequestPriority.LOW))
+            # The first two high priority tasks take the capacity released at 0.2s, when the low priority task has
+            # not been waiting for long enough. The capacity released at 0.4s goes to the low priority task.
+            await asyncio.sleep(0.01)
+            await asyncio.gather(*[self.run_task(f"high_{i}", TEST_POOL_ID, RequestPriority.HIGH) for i in range(3)])
+            await low
+
+        self.ev_loop.run_until_complete(run())
+
+        self.assertEqual(["first", "second", "high_0", "high_1", "low", "high_2"],
+                         [name for name, _ in self.run_order])
+
+    def test_metrics(self):
+        async def run():
+            await self.run_task("first", TEST_POOL_ID)
+            await self.run_task("second", TEST_POOL_ID)
+            waiting = asyncio.ensure_future(self.run_task("third", TEST_POOL_ID))
+            await asyncio.sleep(0.05)
+            metrics = self.throttler.metrics()
+            await waiting
+            return metrics
+
+        metrics = self.ev_loop.run_until_complete(run())
+
+        self.assertEqual({"limit": 2.0, "time_interval": 0.2, "capacity_used": 2.0, "waiting": 1, "acquired": 2,
+                          "rejected": 0, "wait_time_p50": 0.0, "wait_time_p99": 0.0}, metrics[TEST_POOL_ID])
+        self.assertEqual(0, metrics[TEST_PATH_URL]["capacity_used"])
+
+        metrics = self.throttler.metrics()[TEST_POOL_ID]
+        self.assertEqual(0, metrics["waiting"])
+        self.assertEqual(3, metrics["acquired"])
+        self.assertEqual(0, metrics["wait_time_p50"])
+        self.assertGreater(metrics["wait_time_p99"], 0.1)
@@ -0,0 +1,27 @@
+import unittest
+
+from hummingbot.core.api_throttler.throttler_metrics import WAIT_TIMES_SAMPLE_SIZE, LimitMetrics
+
+
+class LimitMetricsTests(unittest.TestCase):
+    def test_wait_time_percentiles(self):
+        metrics = LimitMetrics()
+        self.assertEqual(0, metrics.wait_time_percentile(50))
+
+        for wait_time in range(1, 101):
+            metrics.task_acquired(wait_time / 100)
+
+        self.assertEqual(100, metrics.acquired)
+        self.assertEqual(0.01, metrics.wait_time_percentile(0))
+        self.assertEqual(0.5, metrics.wait_time_percentile(50))
+        self.assertEqual(0.99, metrics.wait_time_percentile(99))
+        self.assertEqual(1, metrics.wait_time_percentile(100))
+
+    def test_wait_time_percentiles_use_the_last_tasks(self):
+        metrics = LimitMetrics()
+        metrics.task_acquired(10)
+        for _ in range(WAIT_TIMES_SAMPLE_SIZE):
+            metrics.task_acquired(0)
+
+        self.assertEqual(WAIT_TIMES_SAMPLE_SIZE + 1, metrics.acquired)
+        self.assertEqual(0, metrics.wait_time_percentile(100))
@@ -0,0 +1,45 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class CompositeOrderBookTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = CompositeOrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64)
+        self.order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+    def _record_fill(self, trade_type: TradeType, price: float, amount: float):
+        self.order_book.record_filled_order(OrderFilledEvent(
+            timestamp=2,
+            order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=Decimal(str(amount)),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+
+    def test_depth_queries_account_for_recorded_fills(self):
+        self._record_fill(TradeType.BUY, 11, 0.5)
+        self._record_fill(TradeType.SELL, 10, 1)
+
+        self.assertEqual(12, self.order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual(0.5 * 11 + 0.5 * 12, self.order_book.get_quote_volume_for_base_amount(True, 1).result_volume)
+        self.assertAlmostEqual(9, self.order_book.get_vwap_for_volume(False, 1).result_price)
+        self.assertEqual(2, self.order_book.get_volume_for_price(False, 9).result_volume)
+
+    def test_original_entries_are_not_modified_by_recorded_fills(self):
+        self._record_fill(TradeType.BUY, 11, 1)
+
+        self.assertEqual([11, 12], [row.price for row in self.order_book.original_ask_entries()])
+        self.assertEqual([12], [row.price for row in self.order_book.ask_entries()])
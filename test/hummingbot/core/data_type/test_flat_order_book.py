@@ -0,0 +1,93 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookBestBidAskChangedEvent, OrderBookEvent
+
+
+class FlatOrderBookTests(unittest.TestCase):
+    def _random_side(self, random: np.random.RandomState, center: float, direction: int, levels: int, update_id: int):
+        prices = center + direction * random.randint(1, 200, levels) * 0.5
+        amounts = random.choice([0, 0, 1, 2.5, 4], levels)
+        return np.column_stack([prices, amounts, np.full(levels, update_id)]).astype(np.float64)
+
+    def _assert_same_books(self, expected: OrderBook, actual: FlatOrderBook):
+        expected_bids, expected_asks = expected.numpy_snapshot
+        actual_bids, actual_asks = actual.numpy_snapshot
+        np.testing.assert_array_equal(expected_bids, actual_bids)
+        np.testing.assert_array_equal(expected_asks, actual_asks)
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        for is_buy in (True, False):
+            self.assertEqual(expected.get_price(is_buy), actual.get_price(is_buy))
+            for volume in (0.5, 10, 120, 5000):
+                np.testing.assert_allclose(expected.get_price_for_volume(is_buy, volume).result_price,
+                                           actual.get_price_for_volume(is_buy, volume).result_price)
+                np.testing.assert_allclose(expected.get_vwap_for_volume(is_buy, volume).result_price,
+                                           actual.get_vwap_for_volume(is_buy, volume).result_price)
+                np.testing.assert_allclose(expected.get_price_for_quote_volume(is_buy, volume * 100).result_price,
+                                           actual.get_price_for_quote_volume(is_buy, volume * 100).result_price)
+                np.testing.assert_allclose(expected.get_quote_volume_for_base_amount(is_buy, volume).result_volume,
+                                           actual.get_quote_volume_for_base_amount(is_buy, volume).result_volume)
+            for price in (80, 99.5, 100.5, 120):
+                for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                    expected_result = getattr(expected, query)(is_buy, price)
+                    actual_result = getattr(actual, query)(is_buy, price)
+                    np.testing.assert_allclose(expected_result.result_volume, actual_result.result_volume)
+                    np.testing.assert_allclose(expected_result.result_price, actual_result.result_price)
+
+    def test_matches_tree_order_book(self):
+        for dex, depth_index in ((False, False), (True, False), (False, True)):
+            random = np.random.RandomState(42)
+            expected = OrderBook(dex=dex)
+            actual = FlatOrderBook(dex=dex, depth_index=depth_index)
+            snapshot = (self._random_side(random, 100, -1, 150, 1), self._random_side(random, 100, 1, 150, 1))
+            expected.apply_numpy_snapshot(*snapshot)
+            actual.apply_numpy_snapshot(*snapshot)
+            self._assert_same_books(expected, actual)
+
+            for update_id in range(2, 300):
+                # Some diffs cross the book to exercise the overlap truncation
+                center = 100 + random.randint(-6, 7) * 0.5
+                diffs = (self._random_side(random, center, -1, 5, update_id),
+                         self._random_side(random, center, 1, 5, update_id))
+                expected.apply_numpy_diffs(*diffs)
+                actual.apply_numpy_diffs(*diffs)
+                self._assert_same_books(expected, actual)
+
+    def test_apply_messages(self):
+        order_book = FlatOrderBook()
+        order_book.apply_snapshot_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids": [["10", "1"], ["9", "2"], ["10", "5"]],
+            "asks": [["11", "1"], ["12", "2"]],
+        }, timestamp=1))
+        order_book.apply_diff_message(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids": [["9", "0"], ["9.5", "3"]],
+            "asks": [["10.5", "1"]],
+        }, timestamp=2))
+
+        self.assertEqual([(10, 1, 1), (9.5, 3, 2)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual([(10.5, 1, 2), (11, 1, 1), (12, 2, 1)], [tuple(row) for row in order_book.ask_entries()])
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual(12, order_book.get_price_for_volume(True, 3).result_price)
+
+    def test_best_bid_ask_changed_event(self):
+        order_book = FlatOrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.BestBidAskChanged, event_logger)
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1]], dtype=np.float64))
+        order_book.best_bid_ask_events_enabled = True
+
+        order_book.apply_numpy_diffs(np.array([[9, 1, 2]], dtype=np.float64), np.array([[10.5, 1, 2]], dtype=np.float64))
+
+        self.assertEqual([OrderBookBestBidAskChangedEvent(best_bid=10, best_ask=10.5, update_id=2)],
+                         event_logger.event_log)
@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 
+import asyncio
 import logging
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+
 import numpy as np
 
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookBestBidAskChangedEvent, OrderBookDepthChangedEvent, OrderBookEvent
+
 
 class OrderBookUnitTest(unittest.TestCase):
     @classmethod
@@ -50,6 +57,244 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries_walk_book_levels(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 2)
+        self.assertEqual(9, result.result_price)
+        result = order_book.get_price_for_volume(True, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((11 + 12) / 2, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertAlmostEqual((10 + 9 * 2 + 8) / 4, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 20)
+        self.assertEqual(12, result.result_price)
+        result = order_book.get_price_for_quote_volume(False, 10)
+        self.assertEqual(10, result.result_price)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(23, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 100)
+        self.assertEqual(10 + 18 + 24, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 12.5)
+        self.assertEqual(3, result.result_volume)
+        self.assertEqual(12, result.result_price)
+        result = order_book.get_volume_for_price(False, 9)
+        self.assertEqual(3, result.result_volume)
+        self.assertEqual(9, result.result_price)
+
+        result = order_book.get_quote_volume_for_price(True, 12)
+        self.assertEqual(35, result.result_volume)
+        result = order_book.get_quote_volume_for_price(False, 7)
+        self.assertEqual(52, result.result_volume)
+        self.assertEqual(8, result.result_price)
+
+    def test_depth_index_matches_depth_walk(self):
+        rng = np.random.default_rng(42)
+        walked_book = OrderBook()
+        indexed_book = OrderBook(depth_index=True)
+        self.assertTrue(indexed_book.depth_index_enabled)
+
+        bids_array = np.array([[100 - i, rng.uniform(0.1, 5), 1] for i in range(50)], dtype=np.float64)
+        asks_array = np.array([[101 + i, rng.uniform(0.1, 5), 1] for i in range(50)], dtype=np.float64)
+        walked_book.apply_numpy_snapshot(bids_array, asks_array)
+        indexed_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for update_id in range(2, 12):
+            bids_diff = np.array([[100 - rng.integers(0, 60), rng.choice([0, 1.5]), update_id]], dtype=np.float64)
+            asks_diff = np.array([[101 + rng.integers(0, 60), rng.choice([0, 2.5]), update_id]], dtype=np.float64)
+            walked_book.apply_numpy_diffs(bids_diff, asks_diff)
+            indexed_book.apply_numpy_diffs(bids_diff, asks_diff)
+
+            for is_buy in (True, False):
+                for volume in (0.05, 1, 7.3, 40, 1000):
+                    for query in ("get_price_for_volume",
+                                  "get_vwap_for_volume",
+                                  "get_price_for_quote_volume",
+                                  "get_quote_volume_for_base_amount"):
+                        expected = getattr(walked_book, query)(is_buy, volume)
+                        result = getattr(indexed_book, query)(is_buy, volume)
+                        np.testing.assert_allclose(
+                            [expected.result_price, expected.result_volume],
+                            [result.result_price, result.result_volume])
+                for price in (40, 80.5, 99, 100, 101, 120, 180):
+                    for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                        expected = getattr(walked_book, query)(is_buy, price)
+                        result = getattr(indexed_book, query)(is_buy, price)
+                        np.testing.assert_allclose(
+                            [expected.result_price, expected.result_volume],
+                            [result.result_price, result.result_volume])
+
+    def test_depth_index_is_refreshed_after_book_updates(self):
+        order_book = OrderBook()
+        order_book.depth_index_enabled = True
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1]], dtype=np.float64))
+        self.assertEqual(11, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(True, 2).result_price))
+
+        order_book.apply_numpy_diffs(np.array([], dtype=np.float64).reshape(0, 3),
+                                     np.array([[12, 3, 2]], dtype=np.float64))
+        self.assertEqual(12, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(1, order_book.get_volume_for_price(False, 10).result_volume)
+
+        order_book.depth_index_enabled = False
+        self.assertEqual(12, order_book.get_price_for_volume(True, 2).result_price)
+
+    def test_get_depth_exports_top_levels(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 2]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 2]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        np.testing.assert_array_equal([[10, 1, 1], [9, 2, 1]], order_book.get_depth(2, is_bid=True))
+        np.testing.assert_array_equal([[11, 1, 1], [12, 2, 2]], order_book.get_depth(5, is_bid=False))
+
+        buffer = np.zeros((2, 3), dtype=np.float64)
+        depth = order_book.get_depth(2, is_bid=False, out=buffer)
+        self.assertIs(buffer, depth.base)
+        np.testing.assert_array_equal([[11, 1, 1], [12, 2, 2]], buffer)
+
+        with self.assertRaises(ValueError):
+            order_book.get_depth(3, is_bid=True, out=buffer)
+
+        bids, asks = order_book.get_depth_arrays(1)
+        np.testing.assert_array_equal([[10, 1, 1]], bids)
+        np.testing.assert_array_equal([[11, 1, 1]], asks)
+
+    def test_numpy_snapshot_matches_snapshot(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 2]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 2]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids_df, asks_df = order_book.snapshot
+        bids, asks = order_book.numpy_snapshot
+        np.testing.assert_array_equal(bids_df.values, bids)
+        np.testing.assert_array_equal(asks_df.values, asks)
+
+    def test_apply_diff_and_snapshot_messages(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids": [["10.0", "1.5"], ["9.5", "2"]],
+            "asks": [["11.0", "1", "extra"], ["11.5", "3"]],
+        }, timestamp=1)
+        order_book.apply_snapshot_message(snapshot)
+
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids": [["10.0", "0"], ["9.8", "4"]],
+            "asks": [["11.0", "2"]],
+        }, timestamp=2)
+        order_book.apply_diff_message(diff)
+
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual([OrderBookRow(9.8, 4, 2), OrderBookRow(9.5, 2, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11.0, 2, 2), OrderBookRow(11.5, 3, 1)], list(order_book.ask_entries()))
+
+    def test_apply_diff_message_uses_overridden_price_levels(self):
+        class CustomOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return [OrderBookRow(entry["px"], entry["qty"], self.update_id) for entry in self.content["bids"]]
+
+        order_book = OrderBook()
+        diff = CustomOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 3,
+            "bids": [{"px": 10.0, "qty": 1.0}],
+            "asks": [],
+        }, timestamp=3)
+        order_book.apply_diff_message(diff)
+
+        self.assertEqual([OrderBookRow(10.0, 1.0, 3)], list(order_book.bid_entries()))
+
+    def test_best_bid_ask_changed_event_only_on_top_of_book_changes(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.BestBidAskChanged, event_logger)
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 1, 1]], dtype=np.float64))
+        self.assertEqual(0, len(event_logger.event_log))
+
+        order_book.best_bid_ask_events_enabled = True
+        order_book.apply_numpy_diffs(np.array([[9, 2, 2]], dtype=np.float64), np.array([[12, 0, 2]], dtype=np.float64))
+        self.assertEqual(0, len(event_logger.event_log))
+
+        order_book.apply_numpy_diffs(np.array([[10.5, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual([OrderBookBestBidAskChangedEvent(best_bid=10.5, best_ask=11, update_id=3)],
+                         event_logger.event_log)
+
+        order_book.apply_numpy_snapshot(np.array([[10.5, 1, 4]], dtype=np.float64),
+                                        np.array([[10.8, 1, 4]], dtype=np.float64))
+        self.assertEqual(OrderBookBestBidAskChangedEvent(best_bid=10.5, best_ask=10.8, update_id=4),
+                         event_logger.event_log[-1])
+
+    def test_depth_changed_event_for_tracked_levels(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.DepthChanged, event_logger)
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 1, 1], [8, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 1, 1], [13, 1, 1]], dtype=np.float64))
+        order_book.depth_event_levels = 2
+
+        order_book.apply_numpy_diffs(np.array([[8, 2, 2]], dtype=np.float64), np.array([[14, 1, 2]], dtype=np.float64))
+        self.assertEqual(0, len(event_logger.event_log))
+
+        order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64), np.array([[12, 3, 3]], dtype=np.float64))
+        self.assertEqual([OrderBookDepthChangedEvent(levels=2, update_id=3)], event_logger.event_log)
+
+        with self.assertRaises(ValueError):
+            order_book.depth_event_levels = -1
+
+    def test_top_of_book_events_are_coalesced_per_event_loop_iteration(self):
+        order_book = OrderBook()
+        best_bid_ask_logger = EventLogger()
+        depth_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.BestBidAskChanged, best_bid_ask_logger)
+        order_book.add_listener(OrderBookEvent.DepthChanged, depth_logger)
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1]], dtype=np.float64))
+        order_book.best_bid_ask_events_enabled = True
+        order_book.depth_event_levels = 1
+        empty = np.empty((0, 3), dtype=np.float64)
+
+        async def apply_updates():
+            order_book.apply_numpy_diffs(np.array([[10.2, 1, 2]], dtype=np.float64), empty)
+            order_book.apply_numpy_diffs(np.array([[10.4, 1, 3]], dtype=np.float64), empty)
+            self.assertEqual(0, len(best_bid_ask_logger.event_log))
+            await asyncio.sleep(0)
+            self.assertEqual([OrderBookBestBidAskChangedEvent(best_bid=10.4, best_ask=11, update_id=3)],
+                             best_bid_ask_logger.event_log)
+            self.assertEqual([OrderBookDepthChangedEvent(levels=1, update_id=3)], depth_logger.event_log)
+
+            # The best bid goes back to the last notified price before the event is emitted
+            order_book.apply_numpy_diffs(np.array([[10.6, 1, 4]], dtype=np.float64), empty)
+            order_book.apply_numpy_diffs(np.array([[10.6, 0, 5]], dtype=np.float64), empty)
+            await asyncio.sleep(0)
+            self.assertEqual(1, len(best_bid_ask_logger.event_log))
+            self.assertEqual(2, len(depth_logger.event_log))
+
+        asyncio.new_event_loop().run_until_complete(apply_updates())
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,306 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import (
+    OrderBookDiffDispatcher,
+    OrderBookMessageQueue,
+    OrderBookTracker,
+)
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = [f"COIN{i}-HBOT" for i in range(5)]
+        self.data_source = MagicMock()
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.snapshot_releases: Dict[str, asyncio.Event] = {
+            trading_pair: asyncio.Event() for trading_pair in self.trading_pairs
+        }
+        self.requested_snapshots: List[str] = []
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def _diff_message(self, first_update_id: int, update_id: int, bids: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pairs[0],
+            "first_update_id": first_update_id,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": [],
+        }, timestamp=float(update_id))
+
+    def _snapshot_message(self, update_id: int, bids: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pairs[0],
+            "update_id": update_id,
+            "bids": bids,
+            "asks": [[20.0, 1.0]],
+        }, timestamp=float(update_id))
+
+    def _start_tracking(self, order_book: OrderBook):
+        trading_pair = self.trading_pairs[0]
+        self.tracker._order_books[trading_pair] = order_book
+        self.tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self.tracker._tracking_tasks[trading_pair] = asyncio.create_task(self.tracker._track_single_book(trading_pair))
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requested_snapshots.append(trading_pair)
+        await self.snapshot_releases[trading_pair].wait()
+        return OrderBook()
+
+    async def test_init_order_books_requests_snapshots_concurrently(self):
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._get_new_order_book)
+
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.trading_pairs, self.requested_snapshots)
+
+        self.snapshot_releases[self.trading_pairs[3]].set()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([self.trading_pairs[3]], list(self.tracker.order_books))
+        self.assertFalse(self.tracker.ready)
+
+        for release in self.snapshot_releases.values():
+            release.set()
+        await init_task
+
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+        self.assertTrue(self.tracker.ready)
+
+    async def test_init_order_books_limits_concurrent_initializations(self):
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._get_new_order_book)
+
+        with patch.object(OrderBookTracker, "MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS", 2):
+            init_task = asyncio.create_task(self.tracker._init_order_books())
+            await asyncio.sleep(0.01)
+
+            self.assertEqual(self.trading_pairs[:2], self.requested_snapshots)
+
+            for release in self.snapshot_releases.values():
+                release.set()
+            await init_task
+
+        self.assertEqual(self.trading_pairs, self.requested_snapshots)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker._sleep", new_callable=AsyncMock)
+    async def test_init_order_books_retries_failed_snapshots(self, _):
+        self.data_source.get_new_order_book = AsyncMock(
+            side_effect=[OrderBook(), Exception("Test error"), OrderBook(), OrderBook(), OrderBook(), OrderBook()]
+        )
+
+        await self.tracker._init_order_books()
+
+        self.assertEqual(6, self.data_source.get_new_order_book.call_count)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+        self.assertTrue(self.tracker.ready)
+
+    async def test_ready_pairs_reports_each_initialized_order_book(self):
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._get_new_order_book)
+
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        first_pair_ready_task = asyncio.create_task(self.tracker.wait_ready(self.trading_pairs[1]))
+        all_pairs_ready_task = asyncio.create_task(self.tracker.wait_ready())
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([], self.tracker.ready_pairs)
+
+        self.snapshot_releases[self.trading_pairs[1]].set()
+        await asyncio.wait_for(first_pair_ready_task, timeout=1)
+
+        self.assertEqual([self.trading_pairs[1]], self.tracker.ready_pairs)
+        self.assertTrue(self.tracker.is_trading_pair_ready(self.trading_pairs[1]))
+        self.assertFalse(self.tracker.is_trading_pair_ready(self.trading_pairs[0]))
+        self.assertFalse(all_pairs_ready_task.done())
+
+        for release in self.snapshot_releases.values():
+            release.set()
+        await init_task
+        await asyncio.wait_for(all_pairs_ready_task, timeout=1)
+
+        self.assertEqual(self.trading_pairs, self.tracker.ready_pairs)
+
+        self.tracker.stop()
+
+        self.assertEqual([], self.tracker.ready_pairs)
+
+    async def test_snapshot_and_trades_received_before_initialization_are_processed_after_it(self):
+        trading_pair = self.trading_pairs[0]
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._get_new_order_book)
+        trade_message = OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": trading_pair,
+            "trade_type": float(TradeType.BUY.value),
+            "trade_id": 1,
+            "update_id": 1,
+            "price": 10.5,
+            "amount": 2.0,
+        }, timestamp=1.0)
+        unknown_pair_trade_message = OrderBookMessage(OrderBookMessageType.TRADE, dict(
+            trade_message.content, trading_pair="UNKNOWN-HBOT"), timestamp=1.0)
+
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        snapshot_router_task = asyncio.create_task(self.tracker._order_book_snapshot_router())
+        trade_loop_task = asyncio.create_task(self.tracker._emit_trade_event_loop())
+        self.tracker._order_book_snapshot_stream.put_nowait(self._snapshot_message(update_id=5, bids=[[10.0, 1.0]]))
+        self.tracker._order_book_trade_stream.put_nowait(trade_message)
+        self.tracker._order_book_trade_stream.put_nowait(unknown_pair_trade_message)
+        await asyncio.sleep(0.01)
+
+        self.assertIn(trading_pair, self.tracker._saved_snapshot_messages)
+        self.assertEqual(1, len(self.tracker._saved_trade_messages[trading_pair]))
+        self.assertNotIn("UNKNOWN-HBOT", self.tracker._saved_trade_messages)
+
+        for release in self.snapshot_releases.values():
+            release.set()
+        await init_task
+        await asyncio.sleep(0.01)
+
+        order_book = self.tracker.order_books[trading_pair]
+        self.assertEqual(10.5, order_book.last_trade_price)
+        self.assertEqual(5, order_book.snapshot_uid)
+        self.assertEqual(10.0, order_book.get_price(False))
+        self.assertEqual({}, self.tracker._saved_snapshot_messages)
+        self.assertNotIn(trading_pair, self.tracker._saved_trade_messages)
+
+        snapshot_router_task.cancel()
+        trade_loop_task.cancel()
+
+    async def test_sequence_gap_buffers_diffs_and_resyncs_order_book(self):
+        trading_pair = self.trading_pairs[0]
+        snapshot_release = asyncio.Event()
+
+        async def get_order_book_snapshot(_):
+            await snapshot_release.wait()
+            return self._snapshot_message(update_id=15, bids=[[9.0, 3.0]])
+
+        self.data_source.get_order_book_snapshot = AsyncMock(side_effect=get_order_book_snapshot)
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(self._snapshot_message(update_id=10, bids=[[10.0, 1.0]]))
+        self._start_tracking(order_book)
+        message_queue = self.tracker._tracking_message_queues[trading_pair]
+
+        message_queue.put_nowait(self._diff_message(first_update_id=11, update_id=11, bids=[[10.0, 2.0]]))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([2.0], [row.amount for row in order_book.bid_entries()])
+
+        message_queue.put_nowait(self._diff_message(first_update_id=14, update_id=14, bids=[[8.0, 1.0]]))
+        message_queue.put_nowait(self._diff_message(first_update_id=15, update_id=16, bids=[[9.5, 1.0]]))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([10.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(
+            {"sequence_gaps": 1, "resyncs": 0, "buffered_diffs": 2, "coalesced_diffs": 0},
+            self.tracker.order_book_sync_stats[trading_pair])
+
+        snapshot_release.set()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([9.5, 9.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(
+            {"sequence_gaps": 1, "resyncs": 1, "buffered_diffs": 0, "coalesced_diffs": 0},
+            self.tracker.order_book_sync_stats[trading_pair])
+        self.data_source.get_order_book_snapshot.assert_called_once_with(trading_pair)
+
+        message_queue.put_nowait(self._diff_message(first_update_id=17, update_id=17, bids=[[9.5, 0.0]]))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([9.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(1, self.tracker.order_book_sync_stats[trading_pair]["sequence_gaps"])
+
+    async def test_resync_requests_new_snapshot_when_snapshot_is_older_than_buffered_diffs(self):
+        trading_pair = self.trading_pairs[0]
+        self.data_source.get_order_book_snapshot = AsyncMock(side_effect=[
+            self._snapshot_message(update_id=12, bids=[[9.0, 3.0]]),
+            self._snapshot_message(update_id=14, bids=[[9.0, 4.0]]),
+        ])
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(self._snapshot_message(update_id=10, bids=[[10.0, 1.0]]))
+        self._start_tracking(order_book)
+
+        self.tracker._tracking_message_queues[trading_pair].put_nowait(
+            self._diff_message(first_update_id=14, update_id=15, bids=[[8.0, 1.0]]))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(2, self.data_source.get_order_book_snapshot.call_count)
+        self.assertEqual([9.0, 8.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([4.0, 1.0], [row.amount for row in order_book.bid_entries()])
+        self.assertEqual(
+            {"sequence_gaps": 1, "resyncs": 1, "buffered_diffs": 0, "coalesced_diffs": 0},
+            self.tracker.order_book_sync_stats[trading_pair])
+
+    async def test_diffs_without_first_update_id_are_not_checked_for_gaps(self):
+        trading_pair = self.trading_pairs[0]
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(self._snapshot_message(update_id=10, bids=[[10.0, 1.0]]))
+        self._start_tracking(order_book)
+        diff = self._diff_message(first_update_id=0, update_id=20, bids=[[8.0, 1.0]])
+        del diff.content["first_update_id"]
+
+        self.tracker._tracking_message_queues[trading_pair].put_nowait(diff)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([10.0, 8.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(0, self.tracker.order_book_sync_stats[trading_pair]["sequence_gaps"])
+
+    def test_message_queue_coalesces_diffs_when_consumer_falls_behind(self):
+        message_queue = OrderBookMessageQueue(coalescing_threshold=2)
+        message_queue.put_nowait(self._diff_message(first_update_id=11, update_id=11, bids=[[10.0, 1.0]]))
+        message_queue.put_nowait(self._diff_message(first_update_id=12, update_id=13, bids=[[10.0, 2.0], [9.0, 1.0]]))
+        message_queue.put_nowait(self._diff_message(first_update_id=14, update_id=14, bids=[[9.0, 0.0], [8.0, 1.0]]))
+
+        self.assertEqual(2, message_queue.qsize())
+        self.assertEqual(1, message_queue.coalesced_messages)
+        message_queue.get_nowait()
+        merged = message_queue.get_nowait()
+        self.assertEqual(12, merged.first_update_id)
+        self.assertEqual(14, merged.update_id)
+        self.assertEqual([[10.0, 2.0], [9.0, 0.0], [8.0, 1.0]], merged.content["bids"])
+
+        message_queue.put_nowait(self._diff_message(first_update_id=15, update_id=15, bids=[[7.0, 1.0]]))
+        message_queue.put_nowait(self._snapshot_message(update_id=16, bids=[[7.0, 2.0]]))
+        message_queue.put_nowait(self._diff_message(first_update_id=17, update_id=17, bids=[[7.0, 3.0]]))
+
+        self.assertEqual(3, message_queue.qsize())
+        self.assertEqual(1, message_queue.coalesced_messages)
+
+    async def test_direct_dispatch_delivers_diffs_to_order_book_queues(self):
+        trading_pair = self.trading_pairs[0]
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(self._snapshot_message(update_id=10, bids=[[10.0, 1.0]]))
+        self.tracker._order_books[trading_pair] = order_book
+        self.tracker._tracking_message_queues[trading_pair] = OrderBookMessageQueue(coalescing_threshold=10)
+        dispatcher = OrderBookDiffDispatcher(self.tracker)
+
+        dispatcher.put_nowait(self._diff_message(first_update_id=9, update_id=9, bids=[[10.0, 2.0]]))
+        await dispatcher.put(self._diff_message(first_update_id=11, update_id=11, bids=[[10.0, 3.0]]))
+        dispatcher.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pairs[1], "update_id": 1, "bids": [], "asks": []}))
+
+        self.assertEqual(1, self.tracker._tracking_message_queues[trading_pair].qsize())
+        self.assertEqual(11, self.tracker._tracking_message_queues[trading_pair].get_nowait().update_id)
+        self.assertEqual(1, len(self.tracker._saved_message_queues[self.trading_pairs[1]]))
+
+    async def test_start_in_direct_dispatch_mode_does_not_start_diff_router(self):
+        for method in ("listen_for_order_book_diffs", "listen_for_trades", "listen_for_order_book_snapshots",
+                       "listen_for_subscriptions", "get_new_order_book"):
+            setattr(self.data_source, method, AsyncMock())
+        tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, direct_diff_dispatch=True)
+
+        tracker.start()
+        await asyncio.sleep(0.01)
+
+        self.assertIsNone(tracker._order_book_diff_router_task)
+        diff_output = self.data_source.listen_for_order_book_diffs.call_args[0][1]
+        self.assertIsInstance(diff_output, OrderBookDiffDispatcher)
+        tracker.stop()
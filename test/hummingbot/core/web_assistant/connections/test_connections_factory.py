@@ -5,6 +5,7 @@ from typing import Awaitable
 from hummingbot.core.web_assistant.connections.connections_factory import (
     ConnectionsFactory
 )
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig
 from hummingbot.core.web_assistant.connections.rest_connection import (
     RESTConnection
 )
@@ -34,3 +35,40 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_rest_connections_share_the_pools(self):
+        factory = ConnectionsFactory()
+
+        first_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        second_connection = self.async_run_with_timeout(factory.get_rest_connection())
+
+        self.assertIs(first_connection._client_session, second_connection._client_session)
+        self.assertIs(first_connection._priority_client_session, second_connection._priority_client_session)
+        self.assertIsNot(first_connection._client_session, first_connection._priority_client_session)
+
+    def test_priority_pool_closes_idle_connections_before_the_servers(self):
+        factory = ConnectionsFactory()
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+
+        priority_connector = rest_connection._priority_client_session.connector
+        self.assertLess(priority_connector._keepalive_timeout, 30)
+
+    def test_pools_use_the_configured_settings(self):
+        factory = ConnectionsFactory(
+            pool_config=ConnectionPoolConfig(limit=50, limit_per_host=5, keepalive_timeout=15, ttl_dns_cache=60),
+            priority_pool_config=ConnectionPoolConfig(limit=4, limit_per_host=2, keepalive_timeout=300))
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        ws_connection = self.async_run_with_timeout(factory.get_ws_connection())
+
+        connector = rest_connection._client_session.connector
+        self.assertIs(connector, ws_connection._client_session.connector)
+        self.assertEqual(50, connector.limit)
+        self.assertEqual(5, connector.limit_per_host)
+        self.assertEqual(15, connector._keepalive_timeout)
+        self.assertEqual(60, connector._cached_hosts._ttl)
+        priority_connector = rest_connection._priority_client_session.connector
+        self.assertEqual(4, priority_connector.limit)
+        self.assertEqual(2, priority_connector.limit_per_host)
+        self.assertEqual(300, priority_connector._keepalive_timeout)
@@ -0,0 +1,49 @@
+import json
+import unittest
+
+import numpy as np
+
+from hummingbot.core.web_assistant.connections import json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+
+    def test_dumps_produces_compact_json(self):
+        self.assertEqual('{"symbol":"COINALPHA/HBOT","price":"10.1","amount":1}',
+                         json_codec.dumps({"symbol": "COINALPHA/HBOT", "price": "10.1", "amount": 1}))
+
+    def test_dumps_converts_non_string_keys(self):
+        self.assertEqual({"1": [1, 2]}, json_codec.loads(json_codec.dumps({1: [1, 2]})))
+
+    def test_dumps_encodes_like_the_standard_library(self):
+        payload = {
+            "price": np.float64(10.1),
+            "amount": float("nan"),
+            "stop": float("inf"),
+            "nonce": 2 ** 70,
+            "label": "caf\u00e9/1",
+        }
+
+        self.assertEqual('{"price":10.1,"amount":NaN,"stop":Infinity,"nonce":1180591620717411303424,'
+                         '"label":"caf\\u00e9/1"}',
+                         json_codec.dumps(payload))
+        self.assertEqual(json.dumps(payload, separators=(",", ":")), json_codec.dumps(payload))
+
+    def test_dumps_rejects_numpy_integers_like_the_standard_library(self):
+        with self.assertRaises(TypeError):
+            json.dumps({"amount": np.int64(1)})
+        with self.assertRaises(TypeError):
+            json_codec.dumps({"amount": np.int64(1)})
+
+    def test_loads_decodes_like_the_standard_library(self):
+        text = '{"nonce": 1180591620717411303424, "price": 10.1, "stop": Infinity, "label": "caf\\u00e9"}'
+
+        self.assertEqual(json.loads(text), json_codec.loads(text))
+
+    def test_loads_accepts_str_and_bytes(self):
+        self.assertEqual({"one": [1, 1.5, None, True]}, json_codec.loads('{"one": [1, 1.5, null, true]}'))
+        self.assertEqual({"one": 1}, json_codec.loads(b'{"one": 1}'))
+
+    def test_loads_raises_value_error_on_invalid_json(self):
+        with self.assertRaises(ValueError):
+            json_codec.loads("pong")
@@ -2,10 +2,13 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 from aioresponses import aioresponses
 
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 
@@ -39,3 +42,24 @@ class RESTConnectionTest(unittest.TestCase):
         j = self.async_run_with_timeout(ret.json())
 
         self.assertEqual(resp, j)
+
+    def test_rest_connection_uses_priority_session_for_high_priority_requests(self):
+        client_session = MagicMock()
+        client_session.request = AsyncMock()
+        priority_client_session = MagicMock()
+        priority_client_session.request = AsyncMock()
+        connection = RESTConnection(client_session, priority_client_session=priority_client_session)
+        request = RESTRequest(method=RESTMethod.GET, url="https://www.test.com/url")
+
+        with request_priority(RequestPriority.LOW):
+            self.async_run_with_timeout(connection.call(request))
+        self.async_run_with_timeout(connection.call(request))
+
+        self.assertEqual(2, client_session.request.call_count)
+        self.assertEqual(0, priority_client_session.request.call_count)
+
+        with request_priority(RequestPriority.HIGH):
+            self.async_run_with_timeout(connection.call(request))
+
+        self.assertEqual(2, client_session.request.call_count)
+        self.assertEqual(1, priority_client_session.request.call_count)
@@ -1,13 +1,18 @@
 import asyncio
+import gzip
 import json
 import unittest
+import zlib
 from typing import Awaitable, List
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
+from aiohttp import web
+from aiohttp.streams import DataQueue
+from aiohttp.test_utils import TestServer
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
-from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
+from hummingbot.core.web_assistant.connections.data_types import WSCompression, WSJSONRequest, WSResponse
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -121,6 +126,134 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_returns_plain_text_message_when_it_is_not_json(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual("pong", response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_returns_binary_message_data_without_compression(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        message = gzip.compress(json.dumps({"one": 1}).encode())
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=message, message_type=aiohttp.WSMsgType.BINARY)
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual(message, response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decompresses_gzip_binary_messages(self, ws_connect_mock):
+        ws_connection = WSConnection(self.client_session, compression=WSCompression.GZIP)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value,
+            message=gzip.compress(json.dumps({"one": 1}).encode()),
+            message_type=aiohttp.WSMsgType.BINARY)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps({"two": 2}))
+
+        first_response = self.async_run_with_timeout(ws_connection.receive())
+        second_response = self.async_run_with_timeout(ws_connection.receive())
+
+        self.assertEqual({"one": 1}, first_response.data)
+        self.assertEqual({"two": 2}, second_response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decompresses_deflate_binary_messages(self, ws_connect_mock):
+        ws_connection = WSConnection(self.client_session, compression=WSCompression.DEFLATE)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value,
+            message=compressor.compress(b"pong") + compressor.flush(),
+            message_type=aiohttp.WSMsgType.BINARY)
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+
+        self.assertEqual("pong", response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_batch_returns_buffered_messages(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        for i in range(4):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                ws_connect_mock.return_value, message=json.dumps({"message": i}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message="", message_type=aiohttp.WSMsgType.PONG)
+        queue = self.mocking_assistant._incoming_websocket_aiohttp_queues[ws_connect_mock.return_value]
+
+        with patch.object(self.ws_connection, "_buffered_messages_count", side_effect=lambda: queue.qsize()):
+            first_batch = self.async_run_with_timeout(self.ws_connection.receive_batch(max_batch_size=3))
+            second_batch = self.async_run_with_timeout(self.ws_connection.receive_batch(max_batch_size=3))
+
+        self.assertEqual([{"message": 0}, {"message": 1}, {"message": 2}], [response.data for response in first_batch])
+        self.assertEqual([{"message": 3}], [response.data for response in second_batch])
+        self.assertTrue(queue.empty())
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_buffered_messages_count_is_the_aiohttp_reader_size(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+
+        self.assertEqual(0, self.ws_connection._buffered_messages_count())
+
+        reader = DataQueue(self.ev_loop)
+        reader.feed_data(aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, "{}", extra=None), 0)
+        reader.feed_data(aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, "{}", extra=None), 0)
+        ws_connect_mock.return_value._reader = reader
+
+        self.assertEqual(2, self.ws_connection._buffered_messages_count())
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_buffered_messages_are_not_counted_with_unsupported_aiohttp_version(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        reader = DataQueue(self.ev_loop)
+        reader.feed_data(aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, "{}", extra=None), 0)
+        ws_connect_mock.return_value._reader = reader
+
+        with patch("aiohttp.__version__", "99.0.0"):
+            self.assertEqual(0, self.ws_connection._buffered_messages_count())
+
+    def test_receive_batch_reads_the_messages_buffered_by_aiohttp(self):
+        # Checks the aiohttp internals used to count the buffered messages with a real WebSocket server
+        async def handler(request: web.Request) -> web.WebSocketResponse:
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            for i in range(3):
+                await ws.send_json({"message": i})
+            await ws.receive()
+            return ws
+
+        async def receive_batch() -> List[WSResponse]:
+            app = web.Application()
+            app.router.add_get("/ws", handler)
+            server = TestServer(app)
+            await server.start_server()
+            try:
+                await self.ws_connection.connect(str(server.make_url("/ws")))
+                while self.ws_connection._buffered_messages_count() < 3:
+                    await asyncio.sleep(0.01)
+                batch = await self.ws_connection.receive_batch()
+                await self.ws_connection.disconnect()
+            finally:
+                await server.close()
+            return batch
+
+        batch = self.async_run_with_timeout(receive_batch(), timeout=5)
+
+        self.assertEqual([{"message": 0}, {"message": 1}, {"message": 2}], [response.data for response in batch])
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
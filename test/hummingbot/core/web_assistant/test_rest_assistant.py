@@ -5,15 +5,19 @@ from typing import Awaitable, Optional
 from unittest.mock import patch
 
 import aiohttp
+import numpy as np
 from aioresponses import aioresponses
+from yarl import URL
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
-from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitUsageRESTPostProcessor, RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 
 
 class RESTAssistantTest(unittest.TestCase):
@@ -100,3 +104,157 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_call_does_not_modify_the_caller_request(self, mocked_call):
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "sig"
+                request.headers["authenticated"] = True
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        req = RESTRequest(
+            method=RESTMethod.GET,
+            url="https://www.test.com/url",
+            params={"symbol": "COINALPHA-HBOT"},
+            headers={"Content-Type": "application/json"},
+            is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({"symbol": "COINALPHA-HBOT", "signature": "sig"}, call_request.params)
+        self.assertEqual({"Content-Type": "application/json", "authenticated": True}, call_request.headers)
+        self.assertEqual({"symbol": "COINALPHA-HBOT"}, req.params)
+        self.assertEqual({"Content-Type": "application/json"}, req.headers)
+
+    @aioresponses()
+    def test_execute_request_does_not_modify_the_caller_params(self, mocked_api):
+        url = "https://www.test.com/url?symbol=COINALPHA-HBOT&signature=sig"
+        mocked_api.get(url, body=json.dumps({"one": 1}))
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "sig"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="test", limit=10, time_interval=1)])
+        assistant = RESTAssistant(connection, throttler=throttler, auth=AuthDummy())
+        params = {"symbol": "COINALPHA-HBOT"}
+
+        response = self.async_run_with_timeout(assistant.execute_request(
+            url="https://www.test.com/url", throttler_limit_id="test", params=params, is_auth_required=True))
+
+        self.assertEqual({"one": 1}, response)
+        self.assertEqual({"symbol": "COINALPHA-HBOT"}, params)
+
+    @aioresponses()
+    def test_request_body_encodes_numpy_floats_and_nan_like_the_standard_library(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.post(url, body=json.dumps({}))
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="test", limit=10, time_interval=1)])
+        assistant = RESTAssistant(connection=RESTConnection(aiohttp.ClientSession()), throttler=throttler)
+        data = {"price": np.float64(10.1), "amount": float("nan")}
+
+        self.async_run_with_timeout(
+            assistant.execute_request(url=url, throttler_limit_id="test", method=RESTMethod.POST, data=data))
+
+        sent_body = mocked_api.requests[("POST", URL(url))][0].kwargs["data"]
+        self.assertEqual('{"price":10.1,"amount":NaN}', sent_body)
+        self.assertEqual(json.dumps(data, separators=(",", ":")), sent_body)
+
+    @aioresponses()
+    def test_rate_limit_rejections_are_recorded_in_the_throttler(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, status=429, body="Too many requests")
+        mocked_api.get(url, status=200, body=json.dumps({}))
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="test", limit=10, time_interval=1)])
+        assistant = RESTAssistant(connection=RESTConnection(aiohttp.ClientSession()), throttler=throttler)
+
+        self.async_run_with_timeout(
+            assistant.execute_request_and_get_response(url=url, throttler_limit_id="test", return_err=True))
+        self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="test"))
+
+        metrics = throttler.metrics()["test"]
+        self.assertEqual(1, metrics["rejected"])
+        self.assertEqual(2, metrics["acquired"])
+        self.assertEqual(2, metrics["capacity_used"])
+
+    @aioresponses()
+    def test_rate_limit_usage_post_processor_updates_the_throttler(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({}), headers={"X-MBX-USED-WEIGHT-1M": "40", "X-MBX-ORDER-COUNT-10S": "?"})
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="weight", limit=100, time_interval=60),
+                                                RateLimit(limit_id="orders", limit=10, time_interval=10),
+                                                RateLimit(limit_id="test", limit=10, time_interval=1)])
+        assistant = RESTAssistant(
+            connection=RESTConnection(aiohttp.ClientSession()),
+            throttler=throttler,
+            rest_post_processors=[RateLimitUsageRESTPostProcessor(
+                throttler=throttler,
+                limit_ids_by_header={"x-mbx-used-weight-1m": "weight", "X-MBX-ORDER-COUNT-10S": "orders"})])
+
+        self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="test"))
+
+        self.assertEqual(40, throttler.capacity_used("weight"))
+        self.assertEqual(0, throttler.capacity_used("orders"))
+
+    @aioresponses()
+    def test_concurrent_identical_public_get_requests_are_coalesced(self, mocked_api):
+        url = "https://www.test.com/url?symbol=COINALPHA-HBOT"
+        mocked_api.get(url, body=json.dumps({"price": "10"}))
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="test", limit=10, time_interval=1)])
+        assistant = RESTAssistant(
+            connection=RESTConnection(aiohttp.ClientSession()),
+            throttler=throttler,
+            request_coalescer=RESTRequestCoalescer())
+
+        responses = self.async_run_with_timeout(asyncio.gather(*[
+            assistant.execute_request(
+                url="https://www.test.com/url", throttler_limit_id="test", params={"symbol": "COINALPHA-HBOT"})
+            for _ in range(3)]))
+
+        self.assertEqual([{"price": "10"}] * 3, responses)
+        self.assertIsNot(responses[0], responses[1])
+        self.assertEqual(1, len(mocked_api.requests[("GET", URL(url))]))
+        self.assertEqual(1, throttler.metrics()["test"]["acquired"])
+
+    @aioresponses()
+    def test_authenticated_requests_are_not_coalesced(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}), repeat=True)
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        assistant = RESTAssistant(
+            connection=RESTConnection(aiohttp.ClientSession()),
+            throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id="test", limit=10, time_interval=1)]),
+            auth=AuthDummy(),
+            request_coalescer=RESTRequestCoalescer())
+
+        self.async_run_with_timeout(asyncio.gather(*[
+            assistant.execute_request(url=url, throttler_limit_id="test", is_auth_required=True) for _ in range(2)]))
+
+        self.assertEqual(2, len(mocked_api.requests[("GET", URL(url))]))
@@ -0,0 +1,139 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
+
+
+class RESTRequestCoalescerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.calls = 0
+        self.release_event = asyncio.Event()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def request_function(self, status: int = 200):
+        self.calls += 1
+        await self.release_event.wait()
+        response = MagicMock()
+        response.status = status
+        return response
+
+    async def execute_concurrently(self, coalescer: RESTRequestCoalescer, keys, **kwargs):
+        tasks = [asyncio.ensure_future(coalescer.execute(key=key, request_function=lambda: self.request_function(
+            **kwargs))) for key in keys]
+        await asyncio.sleep(0)
+        self.release_event.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def test_request_key_is_independent_of_params_and_headers_order(self):
+        first_request = RESTRequest(
+            method=RESTMethod.GET, url="https://test.url", params={"a": 1, "b": "2"}, headers={"h1": "1", "h2": "2"})
+        second_request = RESTRequest(
+            method=RESTMethod.GET, url="https://test.url", params={"b": "2", "a": 1}, headers={"h2": "2", "h1": "1"})
+        third_request = RESTRequest(method=RESTMethod.GET, url="https://test.url", params={"a": 2, "b": "2"})
+
+        self.assertEqual(RESTRequestCoalescer.request_key(first_request),
+                         RESTRequestCoalescer.request_key(second_request))
+        self.assertNotEqual(RESTRequestCoalescer.request_key(first_request),
+                            RESTRequestCoalescer.request_key(third_request))
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        coalescer = RESTRequestCoalescer()
+
+        responses = self.async_run_with_timeout(self.execute_concurrently(coalescer, keys=["key"] * 3))
+
+        self.assertEqual(1, self.calls)
+        self.assertIs(responses[0], responses[1])
+        self.assertIs(responses[0], responses[2])
+
+    def test_different_requests_are_not_shared(self):
+        coalescer = RESTRequestCoalescer()
+
+        responses = self.async_run_with_timeout(self.execute_concurrently(coalescer, keys=["key1", "key2"]))
+
+        self.assertEqual(2, self.calls)
+        self.assertIsNot(responses[0], responses[1])
+
+    def test_sequential_requests_are_not_shared_without_ttl(self):
+        coalescer = RESTRequestCoalescer()
+        self.release_event.set()
+
+        self.async_run_with_timeout(coalescer.execute(key="key", request_function=self.request_function))
+        self.async_run_with_timeout(coalescer.execute(key="key", request_function=self.request_function))
+
+        self.assertEqual(2, self.calls)
+
+    @patch("hummingbot.core.web_assistant.rest_request_coalescer.RESTRequestCoalescer._time")
+    def test_successful_responses_are_cached_during_ttl(self, time_mock):
+        time_mock.return_value = 100
+        coalescer = RESTRequestCoalescer(ttl=1)
+        self.release_event.set()
+
+        first_response = self.async_run_with_timeout(
+            coalescer.execute(key="key", request_function=self.request_function))
+        time_mock.return_value = 100.9
+        second_response = self.async_run_with_timeout(
+            coalescer.execute(key="key", request_function=self.request_function))
+
+        self.assertEqual(1, self.calls)
+        self.assertIs(first_response, second_response)
+
+        time_mock.return_value = 101
+        third_response = self.async_run_with_timeout(
+            coalescer.execute(key="key", request_function=self.request_function))
+
+        self.assertEqual(2, self.calls)
+        self.assertIsNot(first_response, third_response)
+
+    def test_error_responses_are_not_cached(self):
+        coalescer = RESTRequestCoalescer(ttl=10)
+        self.release_event.set()
+
+        self.async_run_with_timeout(
+            coalescer.execute(key="key", request_function=lambda: self.request_function(status=500)))
+        self.async_run_with_timeout(
+            coalescer.execute(key="key", request_function=lambda: self.request_function(status=500)))
+
+        self.assertEqual(2, self.calls)
+
+    def test_exception_is_raised_to_all_callers(self):
+        coalescer = RESTRequestCoalescer()
+
+        async def failing_request_function():
+            self.calls += 1
+            await self.release_event.wait()
+            raise IOError("Test error")
+
+        tasks = [asyncio.ensure_future(coalescer.execute(key="key", request_function=failing_request_function))
+                 for _ in range(2)]
+        self.async_run_with_timeout(asyncio.sleep(0))
+        self.release_event.set()
+        results = self.async_run_with_timeout(asyncio.gather(*tasks, return_exceptions=True))
+
+        self.assertEqual(1, self.calls)
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+
+    def test_cancelled_caller_does_not_cancel_the_request_for_the_others(self):
+        coalescer = RESTRequestCoalescer()
+
+        first_task = asyncio.ensure_future(coalescer.execute(key="key", request_function=self.request_function))
+        second_task = asyncio.ensure_future(coalescer.execute(key="key", request_function=self.request_function))
+        self.async_run_with_timeout(asyncio.sleep(0))
+        first_task.cancel()
+        self.release_event.set()
+        response = self.async_run_with_timeout(second_task)
+
+        self.assertTrue(first_task.cancelled())
+        self.assertEqual(200, response.status)
+        self.assertEqual(1, self.calls)
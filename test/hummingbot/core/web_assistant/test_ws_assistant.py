@@ -200,3 +200,30 @@ class WSAssistantTest(unittest.TestCase):
 
         with self.assertRaises(StopAsyncIteration):
             self.async_run_with_timeout(iter_messages_iterator.__anext__())
+
+    @patch(
+        "hummingbot.core.web_assistant.connections.ws_connection.WSConnection.connected",
+        new_callable=PropertyMock,
+    )
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.receive_batch")
+    def test_iter_message_batches(self, receive_batch_mock, connected_mock):
+        class SomePostProcessor(WSPostProcessorBase):
+            async def post_process(self, response_: WSResponse) -> WSResponse:
+                return WSResponse({"two": response_.data["one"] * 2})
+
+        ws_assistant = WSAssistant(connection=self.ws_connection, ws_post_processors=[SomePostProcessor()])
+        connected_mock.return_value = True
+        receive_batch_mock.side_effect = [[WSResponse({"one": 1}), WSResponse({"one": 2})], [WSResponse({"one": 3})]]
+        iterator = ws_assistant.iter_message_batches(max_batch_size=2)
+
+        first_batch = self.async_run_with_timeout(iterator.__anext__())
+        second_batch = self.async_run_with_timeout(iterator.__anext__())
+
+        self.assertEqual([{"two": 2}, {"two": 4}], [response.data for response in first_batch])
+        self.assertEqual([{"two": 6}], [response.data for response in second_batch])
+        receive_batch_mock.assert_called_with(max_batch_size=2)
+
+        connected_mock.return_value = False
+
+        with self.assertRaises(StopAsyncIteration):
+            self.async_run_with_timeout(iterator.__anext__())
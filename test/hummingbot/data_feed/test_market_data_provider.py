@@ -118,3 +118,18 @@ class TestMarketDataProvider(unittest.TestCase):
         self.mock_connector.ready = True
         mock_candles_feed.ready = False
         self.assertFalse(self.provider.ready)
+
+    def test_markets_ready(self):
+        self.mock_connector.ready = False
+        self.mock_connector.is_trading_pair_ready.side_effect = lambda trading_pair: trading_pair == "BTC-USDT"
+        config = CandlesConfig(connector="mock_connector", trading_pair="BTC-USDT", interval="1m", max_records=100)
+        mock_candles_feed = MagicMock(ready=True)
+        self.provider.candles_feeds = {"mock_connector_BTC-USDT_1m": mock_candles_feed}
+
+        self.assertFalse(self.provider.ready)
+        self.assertTrue(self.provider.markets_ready({"mock_connector": {"BTC-USDT"}}, [config]))
+        self.assertFalse(self.provider.markets_ready({"mock_connector": {"BTC-USDT", "ETH-USDT"}}))
+        self.assertFalse(self.provider.markets_ready({"other_connector": {"BTC-USDT"}}))
+
+        mock_candles_feed.ready = False
+        self.assertFalse(self.provider.markets_ready({"mock_connector": {"BTC-USDT"}}, [config]))
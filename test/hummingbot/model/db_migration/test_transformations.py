@@ -1,7 +1,14 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from sqlalchemy import create_engine, inspect
+
+from hummingbot.model import get_declarative_base
+from hummingbot.model.db_migration.transformations import (
+    AddQueryPatternIndexes,
+    AddTradeFeeInQuote,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +48,30 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class AddQueryPatternIndexesTests(TestCase):
+    def test_name(self):
+        self.assertEqual("AddQueryPatternIndexes", AddQueryPatternIndexes(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20240415, AddQueryPatternIndexes(self).to_version)
+
+    def test_apply_creates_only_the_missing_indexes(self):
+        db_handle = MagicMock()
+        db_handle.engine = create_engine("sqlite:///:memory:")
+        get_declarative_base().metadata.create_all(db_handle.engine)
+        db_handle.engine.execute('DROP INDEX o_config_market_timestamp_index')
+        db_handle.engine.execute('DROP INDEX tf_timestamp_index')
+
+        AddQueryPatternIndexes(migrator=self).apply(db_handle)
+
+        inspector = inspect(db_handle.engine)
+        order_indexes = {index["name"]: index["column_names"] for index in inspector.get_indexes("Order")}
+        trade_fill_indexes = {index["name"]: index["column_names"] for index in inspector.get_indexes("TradeFill")}
+        executors_indexes = {index["name"]: index["column_names"] for index in inspector.get_indexes("Executors")}
+        self.assertEqual(["config_file_path", "market", "creation_timestamp"],
+                         order_indexes["o_config_market_timestamp_index"])
+        self.assertEqual(["order_id"], trade_fill_indexes["tf_order_id_index"])
+        self.assertEqual(["timestamp"], trade_fill_indexes["tf_timestamp_index"])
+        self.assertEqual(["controller_id"], executors_indexes["ex_controller_id"])
@@ -0,0 +1,37 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(temp_dir.name, "test_DB.sqlite"),
+        )
+        self.addCleanup(self.manager.engine.dispose)
+
+    def test_sqlite_connections_use_the_performance_pragmas(self):
+        with self.manager.engine.connect() as connection:
+            journal_mode = connection.execute("PRAGMA journal_mode").scalar()
+            synchronous = connection.execute("PRAGMA synchronous").scalar()
+            cache_size = connection.execute("PRAGMA cache_size").scalar()
+
+        self.assertEqual("wal", journal_mode)
+        self.assertEqual(1, synchronous)  # NORMAL
+        self.assertEqual(SQLConnectionManager.SQLITE_PRAGMAS["cache_size"], cache_size)
+
+    def test_new_database_is_created_with_the_current_version(self):
+        with self.manager.get_new_session() as session:
+            local_db_version = self.manager.get_local_db_version(session=session)
+
+        self.assertEqual(SQLConnectionManager.LOCAL_DB_VERSION_VALUE, local_db_version.value)
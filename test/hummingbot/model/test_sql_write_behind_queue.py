@@ -0,0 +1,120 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+
+
+class SQLWriteBehindQueueTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(temp_dir.name, 'test_DB.sqlite')}")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.write_queue = SQLWriteBehindQueue(sql_manager=self.manager)
+        self.addCleanup(self.write_queue.stop)
+
+    @staticmethod
+    def add_metadata_operation(key: str, after_commit_callback=None):
+        def operation(session):
+            session.add(Metadata(key=key, value="value"))
+            return after_commit_callback
+
+        return operation
+
+    def stored_keys(self):
+        with self.manager.get_new_session() as session:
+            return sorted(metadata.key for metadata in session.query(Metadata).filter(Metadata.key.like("test_%")))
+
+    def test_pending_operations_are_written_in_one_transaction(self):
+        for i in range(3):
+            self.write_queue.put(self.add_metadata_operation(f"test_{i}"))
+
+        self.assertEqual(3, self.write_queue.pending_operations)
+
+        with patch.object(self.manager, "get_new_session", wraps=self.manager.get_new_session) as get_session_mock:
+            self.write_queue.start()
+            self.write_queue.flush()
+
+        get_session_mock.assert_called_once()
+        self.assertEqual(["test_0", "test_1", "test_2"], self.stored_keys())
+        self.assertEqual(0, self.write_queue.pending_operations)
+
+    def test_failing_operation_does_not_discard_the_rest_of_the_batch(self):
+        def failing_operation(session):
+            raise Exception("Test error")
+
+        first_callback = MagicMock()
+        second_callback = MagicMock()
+        self.write_queue.put(self.add_metadata_operation("test_0", first_callback))
+        self.write_queue.put(failing_operation)
+        self.write_queue.put(self.add_metadata_operation("test_1", second_callback))
+
+        self.write_queue.start()
+        self.write_queue.flush()
+
+        self.assertEqual(["test_0", "test_1"], self.stored_keys())
+        first_callback.assert_called_once()
+        second_callback.assert_called_once()
+
+    def test_after_commit_callback_is_not_called_if_the_operation_fails(self):
+        callback = MagicMock()
+
+        def failing_operation(session):
+            session.add(Metadata(key="test_0", value="value"))
+            session.flush()
+            raise Exception("Test error")
+
+        self.write_queue.put(failing_operation)
+        self.write_queue.put(self.add_metadata_operation("test_1", callback))
+        self.write_queue.start()
+        self.write_queue.flush()
+
+        self.assertEqual(["test_1"], self.stored_keys())
+        callback.assert_called_once()
+
+    @patch("hummingbot.model.sql_write_behind_queue.SQLWriteBehindQueue._time")
+    def test_lag_is_the_age_of_the_oldest_pending_operation(self, time_mock):
+        time_mock.return_value = 100
+        self.assertEqual(0, self.write_queue.lag)
+
+        self.write_queue.put(self.add_metadata_operation("test_0"))
+        time_mock.return_value = 101
+        self.write_queue.put(self.add_metadata_operation("test_1"))
+        time_mock.return_value = 102.5
+
+        self.assertEqual(2.5, self.write_queue.lag)
+
+        self.write_queue.start()
+        self.write_queue.flush()
+
+        self.assertEqual(0, self.write_queue.lag)
+
+    def test_stop_writes_pending_operations(self):
+        release_event = threading.Event()
+
+        def blocking_operation(session):
+            release_event.wait()
+
+        self.write_queue.start()
+        self.write_queue.put(blocking_operation)
+        for i in range(5):
+            self.write_queue.put(self.add_metadata_operation(f"test_{i}"))
+        release_event.set()
+        self.write_queue.stop()
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual([f"test_{i}" for i in range(5)], self.stored_keys())
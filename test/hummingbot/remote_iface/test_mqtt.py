@@ -1071,6 +1071,22 @@ class RemoteIfaceMQTTTests(TestCase):
             )
         )
 
+    def test_mqtt_gateway_broadcasts_throttler_metrics(self):
+        status_topic = f"hbot/{self.instance_id}/status_updates"
+        metrics = {"/order": {"limit": 10.0, "capacity_used": 2.0, "waiting": 0, "rejected": 1}}
+        connector = MagicMock()
+        connector.throttler_metrics = metrics
+        self.hbapp.markets = {"test_market_paper_trade": self.test_market, "binance": connector}
+        self.start_mqtt()
+
+        self.gateway.broadcast_throttler_metrics()
+
+        self.async_run_with_timeout(
+            self.wait_for_rcv(status_topic, '{"binance": {"/order": {"limit": 10.0, "capacity_used": 2.0, '
+                                            '"waiting": 0, "rejected": 1}}}'),
+            timeout=10)
+        self.assertTrue(self.is_msg_received(status_topic, "throttler_metrics", msg_key="type"))
+
     def test_mqtt_gateway_stop(self):
         self.start_mqtt()
         self.assertTrue(self.gateway._check_connections())
@@ -1,6 +1,6 @@
 import asyncio
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
-from unittest.mock import AsyncMock, MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
@@ -84,6 +84,19 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
         # Check that no action is put in the queue
         self.mock_actions_queue.put.assert_not_called()
 
+    async def test_control_task_uses_readiness_of_controller_markets(self):
+        type(self.controller.market_data_provider).ready = PropertyMock(return_value=False)
+        self.mock_market_data_provider.markets_ready.return_value = True
+        self.controller.executors_update_event.set()
+        self.controller.update_processed_data = AsyncMock()
+        self.controller.determine_executor_actions = MagicMock(return_value=[])
+        with patch.object(ControllerConfigBase, "update_markets", return_value={"binance_perpetual": {"ETH-USDT"}}):
+            await self.controller.control_task()
+
+        self.mock_market_data_provider.markets_ready.assert_called_once_with(
+            {"binance_perpetual": {"ETH-USDT"}}, self.mock_controller_config.candles_config)
+        self.controller.update_processed_data.assert_called_once()
+
     def test_to_format_status(self):
         # Test the to_format_status method
         status = self.controller.to_format_status()
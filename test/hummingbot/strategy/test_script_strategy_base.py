@@ -1,6 +1,7 @@
 import unittest
 from decimal import Decimal
 from typing import List
+from unittest.mock import MagicMock
 
 import pandas as pd
 
@@ -71,6 +72,26 @@ class ScriptStrategyBaseTest(unittest.TestCase):
         self.strategy.tick(self.start_timestamp + 10)
         self.assertTrue(self.strategy.ready_to_trade)
 
+    def test_partial_start_ticks_when_some_markets_are_ready(self):
+        connector = MagicMock(ready=False)
+        connector.is_trading_pair_ready.return_value = False
+        self.strategy.connectors = {self.connector_name: connector}
+        self.strategy.on_tick = MagicMock()
+
+        self.strategy.tick(self.start_timestamp)
+        self.strategy.on_tick.assert_not_called()
+
+        self.strategy.partial_start = True
+        self.strategy.tick(self.start_timestamp + 1)
+        self.assertEqual({}, self.strategy.ready_markets())
+        self.strategy.on_tick.assert_not_called()
+
+        connector.is_trading_pair_ready.return_value = True
+        self.strategy.tick(self.start_timestamp + 2)
+        self.assertEqual({self.connector_name: {self.trading_pair}}, self.strategy.ready_markets())
+        self.strategy.on_tick.assert_called_once()
+        self.assertFalse(self.strategy.ready_to_trade)
+
     def test_get_assets(self):
         self.strategy.markets = {"con_a": {"HBOT-USDT", "BTC-USDT"}, "con_b": {"HBOT-BTC", "HBOT-ETH"}}
         self.assertRaises(KeyError, self.strategy.get_assets, "con_c")